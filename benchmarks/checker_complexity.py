@@ -0,0 +1,203 @@
+"""
+Micro-benchmarks for every hard-constraint check and soft-penalty term.
+
+Each checker (the entries of eval.hard_constraints._HARD_CHECKS and the
+eval_* terms of eval.eval) is measured on random complete schedules of
+generated instances, in two series:
+
+    events: growing course counts, full slot grid
+    slots:  a fixed course count, growing lecture / tutorial slot counts
+
+A power law t = c * n^k is fitted to each series on a log-log scale; k is
+the empirical complexity exponent in events resp. slots. A checker whose
+event exponent exceeds --max-exponent (default 1.5, i.e. clearly worse
+than linear) or whose slot exponent exceeds --max-slot-exponent (default
+0.5: a checker that scans the schedule once per slot, O(S * E), shows
+about 1) is reported as a regression. The slot grid has at most 21
+lecture and 32 tutorial slots, which is why slots get a series of their
+own instead of growing along with the events.
+
+By default the cost of a call is its wall time (best of --repeats). With
+--operations it is the number of Python line and call events the call
+executes (sys.settrace), which is exact and machine-independent, but
+blind to work done inside C builtins.
+
+Usage (from the project root):
+    python benchmarks/checker_complexity.py
+    python benchmarks/checker_complexity.py --sizes 50 100 200 400 800 --output complexity.json
+    python benchmarks/checker_complexity.py --operations
+
+The exit code is 1 when a checker exceeds an allowed exponent.
+"""
+
+import io
+import os
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import tempfile
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from parser.parser import parse_input_file
+from eval.hard_constraints import _HARD_CHECKS
+from eval.eval import eval_minfilled, eval_pref, eval_secdiff, eval_pair
+from model.initial_state import generate_initial_state
+from generate_instance import write_instance, LECTURE_GRID, TUTORIAL_GRID
+
+SEED = 433
+
+# slot series: share of the full lecture / tutorial grid, at this course count
+SLOT_SHARES = [0.25, 0.5, 0.75, 1.0]
+SLOT_SERIES_COURSES = 100
+
+CHECKERS = _HARD_CHECKS + (
+    ("eval_minfilled", eval_minfilled),
+    ("eval_pref", eval_pref),
+    ("eval_secdiff", eval_secdiff),
+    ("eval_pair", eval_pair),
+)
+
+
+# function to build a problem of `courses` courses on `slot_share` of the slot grid
+# and a few random complete schedules for it
+# returns (problem, schedules)
+def build_case(courses, slot_share=1.0, schedules=3):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f"synthetic-{courses}.txt")
+        # a few partial assignments, so C3 has work to do as well
+        write_instance(
+            path, name=f"synthetic-{courses}", courses=courses, partial_fraction=0.02, seed=SEED,
+            lecture_slots=round(slot_share * len(LECTURE_GRID)), tutorial_slots=round(slot_share * len(TUTORIAL_GRID)),
+        )
+        with redirect_stdout(io.StringIO()):
+            problem = parse_input_file(path)
+            population = generate_initial_state(problem, schedules, seed=SEED)
+    return problem, [schedule for schedule, _, _, _ in population]
+
+
+def time_checker(check, problem, schedules, repeats):
+    """Best-of-`repeats` seconds for one call of check (averaged over the schedules)."""
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for schedule in schedules:
+            check(schedule, problem)
+        best = min(best, (time.perf_counter() - started) / len(schedules))
+    return best
+
+
+def count_operations(check, problem, schedules):
+    """Python line and call events of one call of check (averaged over the schedules)."""
+    count = 0
+
+    def tracer(frame, event, arg):
+        nonlocal count
+        count += 1
+        return tracer
+
+    sys.settrace(tracer)
+    try:
+        for schedule in schedules:
+            check(schedule, problem)
+    finally:
+        sys.settrace(None)
+    return count / len(schedules)
+
+
+def fit_exponent(sizes, seconds):
+    """Least-squares slope of log(seconds) over log(sizes)."""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in seconds]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    return sxy / sxx
+
+
+def measure(course_counts, repeats=5, checkers=CHECKERS, slot_shares=SLOT_SHARES, operations=False):
+    """
+    Measure every checker on instances with the given course counts (full
+    slot grid) and, at SLOT_SERIES_COURSES courses, with the given shares
+    of the slot grid.
+
+    Args:
+        operations: cost = traced Python operations instead of seconds
+
+    Returns:
+        {"events": [...], "slots": [...],
+         "checkers": {name: {"cost": [...], "exponent": k, "slot_cost": [...], "slot_exponent": k}}}
+    """
+    def cost(check, problem, schedules):
+        if operations:
+            return count_operations(check, problem, schedules)
+        return time_checker(check, problem, schedules, repeats)
+
+    random.seed(SEED)
+    cases = [build_case(courses) for courses in course_counts]
+    events = [len(problem.events_by_id) for problem, _ in cases]
+    slot_cases = [build_case(SLOT_SERIES_COURSES, share) for share in slot_shares]
+    slots = [len(problem.lec_slots_by_key) + len(problem.tut_slots_by_key) for problem, _ in slot_cases]
+
+    results = {"events": events, "slots": slots, "checkers": {}}
+    for name, check in checkers:
+        row = {"cost": [cost(check, problem, schedules) for problem, schedules in cases]}
+        row["exponent"] = round(fit_exponent(events, row["cost"]), 3)
+        if slot_cases:
+            row["slot_cost"] = [cost(check, problem, schedules) for problem, schedules in slot_cases]
+            row["slot_exponent"] = round(fit_exponent(slots, row["slot_cost"]), 3)
+        results["checkers"][name] = row
+    return results
+
+
+def main(argv=None):
+    cli = argparse.ArgumentParser(description="Fit complexity exponents of the constraint checkers")
+    cli.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 200, 400, 800], help="course counts")
+    cli.add_argument("--repeats", type=int, default=5)
+    cli.add_argument("--max-exponent", type=float, default=1.5)
+    cli.add_argument("--max-slot-exponent", type=float, default=0.5)
+    cli.add_argument("--operations", action="store_true",
+                     help="count traced Python operations instead of timing (exact, slower)")
+    cli.add_argument("--output", default=None, help="write the results JSON here")
+    args = cli.parse_args(argv)
+
+    results = measure(args.sizes, args.repeats, operations=args.operations)
+
+    def cell(value):
+        return f"{value:>11.0f}" if args.operations else f"{value * 1e6:>9.0f}us"
+
+    for series, sizes, key in (("events", results["events"], ""), ("slots", results["slots"], "slot_")):
+        print(f"{'checker / ' + series:<26}" + "".join(f"{n:>11}" for n in sizes) + f"{'exponent':>11}")
+        for name, row in results["checkers"].items():
+            print(f"{name:<26}" + "".join(cell(c) for c in row[key + "cost"]) + f"{row[key + 'exponent']:>11.2f}")
+        print()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n[COMPLEXITY] Results written to: {args.output}")
+
+    slow = [
+        f"{name}: n^{row['exponent']} in events" for name, row in results["checkers"].items()
+        if row["exponent"] > args.max_exponent
+    ] + [
+        f"{name}: n^{row['slot_exponent']} in slots" for name, row in results["checkers"].items()
+        if row["slot_exponent"] > args.max_slot_exponent
+    ]
+    if slow:
+        print(f"\n[COMPLEXITY] Worse than n^{args.max_exponent} in events or n^{args.max_slot_exponent} in slots:")
+        for message in slow:
+            print(f"  - {message}")
+        return 1
+
+    print(f"\n[COMPLEXITY] All checkers within n^{args.max_exponent} in events and n^{args.max_slot_exponent} in slots.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
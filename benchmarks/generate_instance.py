@@ -0,0 +1,259 @@
+"""
+Synthetic instance generator for scaling studies.
+
+Writes input files in the format parser.parser reads (same sections, same
+line formats as input/deptinst*.txt), parameterised by size and difficulty:
+
+    courses                 number of courses (CPSC / SENG / MATH / PHYS, 200-599)
+    sections_per_course     lecture sections per course
+    tutorials_per_section   tutorials per lecture section
+    lecture_slots           lecture slots taken from the MO / TU grid (max 21)
+    tutorial_slots          tutorial slots taken from the MO / TU / FR grid (max 32)
+    al_fraction             share of events that require active learning
+    evening_fraction        share of sections that are evening sections (LEC 9X)
+    graduate_fraction       share of 500-level courses (capped by the lecture slots)
+    not_compatible_density  not-compatible pairs per event
+    unwanted_density        unwanted slots per event
+    preference_density      preferences per event
+    pair_density            pair constraints per event
+    partial_fraction        share of events with a partial assignment
+    tightness               demand / capacity ratio of the slots (0 < t <= 1)
+
+Usage (from the project root):
+    python benchmarks/generate_instance.py input/synthetic200.txt --courses 200
+    python benchmarks/generate_instance.py big.txt --courses 1000 --tightness 0.9 --seed 7
+
+The same parameters and seed always produce the same file.
+"""
+
+import sys
+import math
+import random
+import argparse
+
+PROGRAMS = ("CPSC", "SENG", "MATH", "PHYS")
+
+# full slot grids, in the order the bundled instances list them
+LECTURE_GRID = (
+    [("MO", f"{hour}:00") for hour in range(8, 21)]
+    + [("TU", time) for time in ("8:00", "9:30", "11:00", "12:30", "14:00", "15:30", "17:00", "18:30")]
+)
+TUTORIAL_GRID = (
+    [("MO", f"{hour}:00") for hour in range(8, 21)]
+    + [("TU", f"{hour}:00") for hour in range(8, 21)]
+    + [("FR", f"{hour}:00") for hour in range(8, 19, 2)]
+)
+
+# lectures may never go here (department meeting), tutorials of CPSC 851/913 always go here
+MEETING_SLOT = ("TU", "11:00")
+SPECIAL_TUTORIAL_SLOT = ("TU", "18:00")
+
+
+def is_evening(slot):
+    return int(slot[1].split(":")[0]) >= 18
+
+
+def format_slot(slot):
+    day, time = slot
+    return f"{day}, {time:>5}"
+
+
+# function to pick `count` slots of a grid, keeping the forced ones
+# returns the chosen slots in grid order
+def pick_slots(grid, count, rng, forced=()):
+    count = max(len(forced), min(count, len(grid)))
+    rest = [slot for slot in grid if slot not in forced]
+    chosen = set(forced) | set(rng.sample(rest, count - len(forced)))
+    return [slot for slot in grid if slot in chosen]
+
+
+# function to size the slots so that demand / capacity is about `tightness`
+# returns a list of (max, min, al_max) per slot, aligned with `slots`
+def slot_capacities(slots, events, al_events, evening_events, tightness):
+    evening_slots = [slot for slot in slots if is_evening(slot)]
+    day_slots = [slot for slot in slots if not is_evening(slot)]
+
+    def per_slot(demand, n):
+        return math.ceil(demand / (n * tightness)) if demand and n else 0
+
+    day_max = max(1, per_slot(events - evening_events, len(day_slots) or len(slots)))
+    evening_max = max(1, per_slot(evening_events, len(evening_slots)))
+    al_max = per_slot(al_events, len(slots))
+
+    capacities = []
+    for slot in slots:
+        slot_max = evening_max if is_evening(slot) else day_max
+        # a quarter of the capacity as minimum, so minfilled has something to say
+        capacities.append((slot_max, slot_max // 4, min(al_max, slot_max)))
+    return capacities
+
+
+def generate_instance(
+    name="synthetic",
+    courses=40,
+    sections_per_course=2,
+    tutorials_per_section=2,
+    lecture_slots=len(LECTURE_GRID),
+    tutorial_slots=len(TUTORIAL_GRID),
+    al_fraction=0.05,
+    evening_fraction=0.05,
+    graduate_fraction=0.05,
+    not_compatible_density=0.5,
+    unwanted_density=0.1,
+    preference_density=0.5,
+    pair_density=0.05,
+    partial_fraction=0.0,
+    tightness=0.7,
+    seed=0,
+):
+    """
+    Build a synthetic problem instance.
+
+    Args:
+        see the module docstring; densities are counts per event, fractions are shares of events
+
+    Returns:
+        the instance file contents (str)
+    """
+    if not 0 < tightness <= 1:
+        raise ValueError(f"tightness must be in (0, 1], got {tightness}")
+
+    rng = random.Random(seed)
+
+    lec_slots = pick_slots(LECTURE_GRID, lecture_slots, rng)
+    tut_slots = pick_slots(TUTORIAL_GRID, tutorial_slots, rng, forced=(SPECIAL_TUTORIAL_SLOT,))
+
+    # courses: unique (program, number), never the special 851/913 numbers;
+    # every 500-level lecture needs a slot of its own, so there are at most
+    # as many 500-level lectures as lecture slots
+    graduate = min(round(graduate_fraction * courses), len(lec_slots) // max(1, sections_per_course))
+    undergrad_numbers = [(program, number) for program in PROGRAMS for number in range(200, 500)]
+    graduate_numbers = [(program, number) for program in PROGRAMS for number in range(500, 600)]
+    if courses - graduate > len(undergrad_numbers):
+        raise ValueError(f"at most {len(undergrad_numbers) + graduate} courses can be generated")
+    course_keys = sorted(
+        rng.sample(undergrad_numbers, courses - graduate) + rng.sample(graduate_numbers, graduate)
+    )
+
+    lectures, tutorials = [], []
+    seen = set()
+    for program, number in course_keys:
+        for section in range(1, sections_per_course + 1):
+            if rng.random() < evening_fraction:
+                label = f"LEC {90 + section % 10:02d}"
+            else:
+                label = f"LEC {section:02d}"
+            lecture_id = f"{program} {number} {label}"
+            if lecture_id in seen:
+                continue
+            seen.add(lecture_id)
+            lectures.append((lecture_id, rng.random() < al_fraction))
+            for tutorial in range(1, tutorials_per_section + 1):
+                tutorials.append((f"{lecture_id} TUT {tutorial:02d}", rng.random() < al_fraction))
+
+    def count(events, predicate):
+        return sum(1 for event in events if predicate(event))
+
+    lec_caps = slot_capacities(
+        lec_slots, len(lectures), count(lectures, lambda e: e[1]), count(lectures, lambda e: " LEC 9" in e[0]),
+        tightness,
+    )
+    tut_caps = slot_capacities(
+        tut_slots, len(tutorials), count(tutorials, lambda e: e[1]), count(tutorials, lambda e: " LEC 9" in e[0]),
+        tightness,
+    )
+
+    events = [event_id for event_id, _ in lectures + tutorials]
+    lecture_ids = {event_id for event_id, _ in lectures}
+
+    def slots_for(event_id):
+        return lec_slots if event_id in lecture_ids else tut_slots
+
+    def random_pairs(density):
+        pairs = set()
+        for _ in range(round(density * len(events))):
+            a, b = rng.sample(events, 2)
+            pairs.add((min(a, b), max(a, b)))
+        return sorted(pairs)
+
+    not_compatible = random_pairs(not_compatible_density)
+    pair = random_pairs(pair_density)
+
+    unwanted = sorted({
+        (event_id, rng.choice(slots_for(event_id)))
+        for event_id in rng.choices(events, k=round(unwanted_density * len(events)))
+    })
+    preferences = sorted({
+        (event_id, rng.choice(slots_for(event_id)), rng.randint(1, 10))
+        for event_id in rng.choices(events, k=round(preference_density * len(events)))
+    })
+
+    # partial assignments only to slots the event may legally take
+    partial = []
+    for event_id in sorted(rng.sample(events, round(partial_fraction * len(events)))):
+        candidates = [
+            slot for slot in slots_for(event_id)
+            if (is_evening(slot) or " LEC 9" not in event_id)
+            and not (event_id in lecture_ids and slot == MEETING_SLOT)
+        ]
+        if candidates:
+            partial.append((event_id, rng.choice(candidates)))
+
+    lines = ["Name:", name, "", "Lecture slots:"]
+    lines += [f"{format_slot(slot)}, {mx}, {mn}, {al}" for slot, (mx, mn, al) in zip(lec_slots, lec_caps)]
+    lines += ["", "Tutorial slots:"]
+    lines += [f"{format_slot(slot)}, {mx}, {mn}, {al}" for slot, (mx, mn, al) in zip(tut_slots, tut_caps)]
+    lines += ["", "Lectures:"]
+    lines += [f"{event_id}, {str(al).lower()}" for event_id, al in lectures]
+    lines += ["", "Tutorials:"]
+    lines += [f"{event_id}, {str(al).lower()}" for event_id, al in tutorials]
+    lines += ["", "Not compatible:"]
+    lines += [f"{a}, {b}" for a, b in not_compatible]
+    lines += ["", "Unwanted:"]
+    lines += [f"{event_id}, {format_slot(slot)}" for event_id, slot in unwanted]
+    lines += ["", "Preferences:"]
+    lines += [f"{format_slot(slot)}, {event_id}, {value}" for event_id, slot, value in preferences]
+    lines += ["", "Pair:"]
+    lines += [f"{a}, {b}" for a, b in pair]
+    lines += ["", "Partial assignments:"]
+    lines += [f"{event_id}, {format_slot(slot)}" for event_id, slot in partial]
+    return "\n".join(lines) + "\n"
+
+
+def write_instance(path, **params):
+    """Generate an instance (see generate_instance) and write it to path."""
+    with open(path, "w") as f:
+        f.write(generate_instance(**params))
+
+
+def main(argv=None):
+    cli = argparse.ArgumentParser(description="Generate a synthetic scheduling instance")
+    cli.add_argument("output", help="instance file to write")
+    cli.add_argument("--name", default=None, help="instance name (default: file name)")
+    cli.add_argument("--courses", type=int, default=40)
+    cli.add_argument("--sections-per-course", type=int, default=2)
+    cli.add_argument("--tutorials-per-section", type=int, default=2)
+    cli.add_argument("--lecture-slots", type=int, default=len(LECTURE_GRID))
+    cli.add_argument("--tutorial-slots", type=int, default=len(TUTORIAL_GRID))
+    cli.add_argument("--al-fraction", type=float, default=0.05)
+    cli.add_argument("--evening-fraction", type=float, default=0.05)
+    cli.add_argument("--graduate-fraction", type=float, default=0.05)
+    cli.add_argument("--not-compatible-density", type=float, default=0.5)
+    cli.add_argument("--unwanted-density", type=float, default=0.1)
+    cli.add_argument("--preference-density", type=float, default=0.5)
+    cli.add_argument("--pair-density", type=float, default=0.05)
+    cli.add_argument("--partial-fraction", type=float, default=0.0)
+    cli.add_argument("--tightness", type=float, default=0.7)
+    cli.add_argument("--seed", type=int, default=0)
+    args = vars(cli.parse_args(argv))
+
+    output = args.pop("output")
+    if args["name"] is None:
+        args["name"] = output.replace("\\", "/").rsplit("/", 1)[-1].rsplit(".", 1)[0]
+    write_instance(output, **args)
+    print(f"Instance written to: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
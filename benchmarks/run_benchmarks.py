@@ -0,0 +1,337 @@
+"""
+Benchmark suite over the bundled instances.
+
+Measures, per instance (fixed seeds):
+    - parse_ms          : parse_input_file_streaming wall time (median, the parser ga_main uses)
+    - eval_per_sec      : eval.eval calls per second on random complete schedules
+    - valid_per_sec     : Valid calls per second on the same schedules
+    - repair_per_sec    : repair_schedule calls per second on copies of them
+    - gens_per_sec      : GA generations per second over a fixed budget
+    - time_to_valid_s   : seconds until the GA's best individual first has hard = 0
+    - final_hard / final_soft : best individual after the fixed budget
+    - trajectory        : digest of the GA's improvement sequence (generation, hard, soft)
+
+The GA figures come from one fixed-seed run, so any change to the search
+(operators, selection, purge order, random draws) moves them even when it
+is not worse on average. A quality regression on an instance whose
+trajectory differs from the baseline's is reported as such: check the
+change on several seeds, then regenerate the baseline in the same commit.
+
+Usage (from the project root):
+    python benchmarks/run_benchmarks.py                       # run + compare to benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --quick               # dept instances only, smaller budgets
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --quick --synthetic 50 100 200 400   # scaling study
+    python benchmarks/run_benchmarks.py --update-baseline     # store this run as the new baseline
+
+The exit code is 1 when a metric regressed by more than --tolerance
+against the baseline.
+"""
+
+import io
+import os
+import sys
+import json
+import hashlib
+import time
+import random
+import argparse
+import platform
+import statistics
+import tempfile
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from parser.stream import parse_input_file_streaming
+from eval.eval import eval as soft_eval
+from eval.hard_constraints import Valid
+from model.initial_state import generate_initial_state
+from control.repair import repair_schedule
+from control.genetic_algorithm import GeneticAlgorithm
+from generate_instance import write_instance
+
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+SEED = 433
+
+# same penalties / weights for every instance
+PARAMS = dict(
+    pen_lecturemin=10, pen_tutorialmin=10, pen_notpaired=10, pen_section=10,
+    w_minfilled=1, w_pref=1, w_pair=1, w_secdiff=1,
+)
+
+# metric -> True if higher is better
+METRICS = {
+    "parse_ms": False,
+    "eval_per_sec": True,
+    "valid_per_sec": True,
+    "repair_per_sec": True,
+    "gens_per_sec": True,
+    "time_to_valid_s": False,
+    "final_soft": False,
+}
+
+# absolute slack for timings too small for a relative tolerance alone
+SLACK = {"parse_ms": 0.5, "time_to_valid_s": 0.05}
+
+
+def instance_names(quick):
+    names = ["deptinst1.txt", "deptinst2.txt"]
+    if not quick:
+        names += sorted(n for n in os.listdir(os.path.join(ROOT, "input")) if n.startswith(("HC", "SC")))
+    return names
+
+
+def load(path):
+    with redirect_stdout(io.StringIO()):
+        return parse_input_file_streaming(path, **PARAMS)
+
+
+def rate(fn, items, min_seconds, rounds=5):
+    """
+    Calls per second of fn over items: best of `rounds` windows of
+    min_seconds / rounds each (the best window is the least disturbed one).
+    """
+    best = 0.0
+    for _ in range(rounds):
+        calls = 0
+        started = time.perf_counter()
+        while True:
+            for item in items:
+                fn(item)
+            calls += len(items)
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_seconds / rounds:
+                break
+        best = max(best, calls / elapsed)
+    return best
+
+
+def calibrate(min_seconds):
+    """
+    Speed of a fixed pure-Python workload (dict / tuple churn, like the
+    evaluators). Results are compared relative to it, so a slower or busier
+    machine does not show up as a regression.
+    """
+    keys = [(day, hour) for day in ("MO", "TU", "FR") for hour in range(8, 21)]
+
+    def workload(_):
+        counts = {}
+        for i in range(200):
+            key = keys[i % len(keys)]
+            counts[key] = counts.get(key, 0) + 1
+        return sum(counts.values())
+
+    return rate(workload, [None] * 10, min_seconds)
+
+
+def bench_instance(path, generations, min_seconds):
+    result = {}
+
+    # parse
+    times = []
+    for _ in range(5):
+        started = time.perf_counter()
+        problem = load(path)
+        times.append((time.perf_counter() - started) * 1000)
+    result["parse_ms"] = round(statistics.median(times), 3)
+
+    # evaluators on random complete schedules
+    with redirect_stdout(io.StringIO()):
+        schedules = [s for s, _, _, _ in generate_initial_state(problem, 20, seed=SEED)]
+    result["eval_per_sec"] = round(rate(lambda s: soft_eval(s, problem), schedules, min_seconds), 1)
+    result["valid_per_sec"] = round(rate(lambda s: Valid(s, problem), schedules, min_seconds), 1)
+
+    random.seed(SEED)
+    result["repair_per_sec"] = round(rate(lambda s: repair_schedule(s.copy(), problem), schedules, min_seconds), 1)
+
+    # GA with a fixed generation budget; run twice with the same seed (identical
+    # search), keeping the faster wall time
+    elapsed = None
+    for _ in range(2):
+        first_valid = []
+        improvements = []
+        random.seed(SEED)
+        with redirect_stdout(io.StringIO()):
+            ga = GeneticAlgorithm(
+                problem, population_size=50, max_generations=generations, plateau_limit=generations,
+                polish_interval=500,
+            )
+            started = time.perf_counter()
+
+            def on_improvement(schedule, soft, hard, fitness, generation):
+                improvements.append((generation, hard, soft))
+                if hard == 0 and not first_valid:
+                    first_valid.append(time.perf_counter() - started)
+
+            _, soft, hard, _ = ga.run(
+                print_interval=generations + 1, on_improvement=on_improvement, snapshot_interval=0
+            )
+            run_time = time.perf_counter() - started
+        if elapsed is None or run_time < elapsed:
+            elapsed, time_to_valid = run_time, (first_valid[0] if first_valid else None)
+
+    result["gens_per_sec"] = round((ga.generation + 1) / elapsed, 1)
+    result["time_to_valid_s"] = round(time_to_valid, 3) if time_to_valid is not None else None
+    result["final_hard"] = hard
+    result["final_soft"] = soft
+    result["trajectory"] = hashlib.sha1(repr(improvements).encode()).hexdigest()[:12]
+    return result
+
+
+def compare(results, baseline, tolerance):
+    """
+    List of regression messages (metric worse than baseline by more than
+    tolerance). Throughput and timings are scaled by the calibration ratio of
+    the two runs first.
+    """
+    regressions = []
+    speed = results["meta"]["calibration"] / baseline["meta"]["calibration"]
+    for name, metrics in results["instances"].items():
+        base = baseline.get("instances", {}).get(name)
+        if base is None or "skipped" in base or "skipped" in metrics:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            now, then = metrics.get(metric), base.get(metric)
+            if now is None or then is None:
+                if then is not None and now is None and metric == "time_to_valid_s":
+                    regressions.append(f"{name}: no valid schedule any more (baseline reached one in {then}s)")
+                continue
+            if metric != "final_soft":
+                then = then * speed if higher_is_better else then / speed
+            if higher_is_better and now < then * (1 - tolerance):
+                regressions.append(f"{name}: {metric} {now} < baseline {then:.4g}")
+            if not higher_is_better and now > then * (1 + tolerance) + SLACK.get(metric, 0):
+                regressions.append(f"{name}: {metric} {now} > baseline {then:.4g}")
+        if metrics["final_hard"] > base["final_hard"]:
+            regressions.append(f"{name}: final_hard {metrics['final_hard']} > baseline {base['final_hard']}")
+    return regressions
+
+
+def search_changed(results, baseline, regressions):
+    """
+    Instances with a quality regression (time_to_valid_s / final_hard /
+    final_soft) whose GA trajectory differs from the baseline's.
+    """
+    changed = []
+    for name, metrics in results["instances"].items():
+        base = baseline.get("instances", {}).get(name, {})
+        quality = any(
+            message.startswith(f"{name}: {metric}")
+            for message in regressions
+            for metric in ("time_to_valid_s", "no valid schedule", "final_hard", "final_soft")
+        )
+        if quality and metrics.get("trajectory") != base.get("trajectory"):
+            changed.append(name)
+    return changed
+
+
+def print_table(results):
+    columns = ["parse_ms", "eval_per_sec", "valid_per_sec", "repair_per_sec", "gens_per_sec",
+               "time_to_valid_s", "final_hard", "final_soft"]
+    print(f"{'instance':<16}" + "".join(f"{c:>16}" for c in columns))
+    for name, metrics in {**results["instances"], **results["synthetic"]}.items():
+        if "skipped" in metrics:
+            print(f"{name:<16}  skipped: {metrics['skipped']}")
+            continue
+        cells = ["-" if metrics[c] is None else str(metrics[c]) for c in columns]
+        print(f"{name:<16}" + "".join(f"{c:>16}" for c in cells))
+
+
+def main(argv=None):
+    cli = argparse.ArgumentParser(description="Benchmark parse / eval / Valid / repair / GA on the bundled instances")
+    cli.add_argument("--quick", action="store_true", help="deptinst1/2 only, smaller budgets")
+    cli.add_argument("--output", default=None, help="write the results JSON here")
+    cli.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON to compare against")
+    cli.add_argument("--update-baseline", action="store_true", help="store this run as the baseline")
+    cli.add_argument(
+        "--synthetic", type=int, nargs="+", metavar="COURSES",
+        help="also benchmark generated instances with these course counts (see generate_instance.py)",
+    )
+    cli.add_argument("--tolerance", type=float, default=0.4, help="allowed relative slowdown (default 0.4)")
+    args = cli.parse_args(argv)
+
+    generations = 300 if args.quick else 1500
+    min_seconds = 0.2 if args.quick else 0.5
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "quick": args.quick,
+            "seed": SEED,
+            "generations": generations,
+        },
+        "instances": {},
+        "synthetic": {},
+    }
+
+    calibration = calibrate(min_seconds)
+    for name in instance_names(args.quick):
+        print(f"[BENCH] {name} ...", flush=True)
+        try:
+            results["instances"][name] = bench_instance(os.path.join(ROOT, "input", name), generations, min_seconds)
+        except SystemExit:
+            # generate_initial_state exits on instances it cannot build a schedule for
+            results["instances"][name] = {"skipped": "no initial population"}
+
+    # synthetic instances of growing size (scaling study, not compared against the baseline)
+    with tempfile.TemporaryDirectory() as tmp:
+        for courses in args.synthetic or ():
+            name = f"synthetic-{courses}"
+            path = os.path.join(tmp, name + ".txt")
+            write_instance(path, name=name, courses=courses, seed=SEED)
+            print(f"[BENCH] {name} ...", flush=True)
+            try:
+                results["synthetic"][name] = bench_instance(path, generations, min_seconds)
+            except SystemExit:
+                results["synthetic"][name] = {"skipped": "no initial population"}
+
+    # calibrated before and after, so drift during the run is averaged out
+    results["meta"]["calibration"] = round((calibration + calibrate(min_seconds)) / 2, 1)
+
+    print()
+    print_table(results)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n[BENCH] Results written to: {args.output}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"[BENCH] Baseline updated: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\n[BENCH] No baseline at {args.baseline} (run with --update-baseline to create one)")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline["meta"].get("generations") != generations:
+        print("\n[BENCH] Baseline was recorded with another budget (--quick?); skipping comparison")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n[BENCH] {len(regressions)} regression(s) against the baseline:")
+        for message in regressions:
+            print(f"  - {message}")
+        changed = search_changed(results, baseline, regressions)
+        if changed:
+            print(
+                f"\n[BENCH] The fixed-seed search differs from the baseline's on {', '.join(changed)}; if the "
+                "change holds up on other seeds, regenerate the baseline (--update-baseline) with it"
+            )
+        return 1
+
+    print("\n[BENCH] No regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
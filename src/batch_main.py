@@ -0,0 +1,75 @@
+import os
+import sys
+import glob
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from control.batch import run_batch
+from control.sweep import parse_sweep_file, WEIGHT_NAMES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# input files: paths, globs, or names inside input/
+def resolve_instances(names):
+    paths = []
+    for name in names:
+        candidates = glob.glob(name) or glob.glob(os.path.join(ROOT, "input", name))
+        if not candidates:
+            raise FileNotFoundError(f"Input file not found: {name}")
+        paths.extend(sorted(candidates))
+    return paths
+
+
+# batch runs over instances x weight vectors x seeds, results in one CSV / JSON table
+def main(argv=None):
+    cli = argparse.ArgumentParser(usage="python src/batch_main.py INSTANCE... [options]")
+    cli.add_argument("instances", nargs="+",
+                     help="input files (paths, globs like 'input/HC*.txt', or names in input/)")
+    cli.add_argument("--weights", nargs=len(WEIGHT_NAMES), type=int, action="append", metavar="W",
+                     help=f"one weight vector ({' '.join(WEIGHT_NAMES)}); repeat for more")
+    cli.add_argument("--weights-file", default=None,
+                     help="weight vectors, one line of 8 numbers each (same format as ga_main --sweep)")
+    cli.add_argument("--seeds", nargs="+", type=int, default=[1],
+                     help="random seeds, one run per seed (default: 1)")
+    cli.add_argument("--workers", type=int, default=None,
+                     help="runs at the same time (default: cpu count)")
+    cli.add_argument("--time-limit", type=float, default=None,
+                     help="wall-clock limit per run in seconds")
+    cli.add_argument("--max-generations", type=int, default=None,
+                     help="generation limit per run (default: scaled to the instance)")
+    cli.add_argument("--output", default="batch_results.csv",
+                     help="results table, .csv or .json; an existing table is resumed (default: batch_results.csv)")
+    args = cli.parse_args(argv)
+
+    weight_vectors = [tuple(w) for w in (args.weights or [])]
+    if args.weights_file:
+        weight_vectors += parse_sweep_file(args.weights_file)
+    if not weight_vectors:
+        weight_vectors = [(1, 1, 1, 1, 10, 10, 10, 10)]
+
+    ga_params = {}
+    if args.time_limit is not None:
+        ga_params["time_limit"] = args.time_limit
+    if args.max_generations is not None:
+        ga_params["max_generations"] = args.max_generations
+
+    def show(row):
+        print(
+            f"[BATCH] {row['instance']:<20} w=[{row['weights']}] seed={row['seed']:<4} "
+            + (f"hard={row['hard']} soft={row['soft']} gens={row['generations']}" if row["status"] == "ok"
+               else row["error"])
+            + f"  ({row['wall_time']}s)"
+        )
+
+    rows = run_batch(
+        resolve_instances(args.instances), weight_vectors, args.seeds, args.output,
+        workers=args.workers, ga_params=ga_params, on_row=show
+    )
+    failed = sum(1 for row in rows if row["status"] != "ok")
+    print(f"\n[BATCH] {len(rows)} runs in {args.output}" + (f", {failed} failed" if failed else ""))
+
+
+if __name__ == "__main__":
+    main()
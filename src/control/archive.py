@@ -0,0 +1,200 @@
+import json
+import time
+import sqlite3
+import hashlib
+
+from model.encoding import ScheduleCodec
+from eval.selection import hard_from_fitness
+
+
+"""
+    SQLite run archive.
+
+    Every archived run stores the instance hash, weights / penalties, seed,
+    GA parameters, wall time, final hard / soft, the best schedule (encoded
+    with model.encoding.ScheduleCodec, a few hundred bytes) and a summary
+    line every few generations.
+
+    Runs are indexed by (instance hash, weights, hard, soft), so "best known
+    solution for this instance" is a single index lookup; it feeds warm
+    starts and regression comparisons.
+
+    The instance hash covers everything but the weights and penalties:
+    events (in order), slots (in order) and their capacities, and all
+    constraints. Schedules only decode onto an instance with the same hash.
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id            INTEGER PRIMARY KEY,
+    instance_hash TEXT    NOT NULL,
+    instance_name TEXT,
+    weights       TEXT    NOT NULL,
+    seed          INTEGER,
+    params        TEXT,
+    started       REAL,
+    wall_time     REAL,
+    generations   INTEGER,
+    hard          INTEGER NOT NULL,
+    soft          INTEGER NOT NULL,
+    schedule      BLOB    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (instance_hash, weights, hard, soft);
+CREATE TABLE IF NOT EXISTS generations (
+    run_id      INTEGER NOT NULL REFERENCES runs (id),
+    generation  INTEGER NOT NULL,
+    elapsed     REAL,
+    best_hard   INTEGER,
+    best_soft   INTEGER,
+    mean_soft   REAL,
+    valid_share REAL,
+    PRIMARY KEY (run_id, generation)
+);
+"""
+
+
+def instance_hash(problem):
+    """
+    Hash of the instance without its weights and penalties.
+    """
+    parts = [f"{e.id}|{e.al_required}" for e in problem.events_by_id.values()]
+    parts += [repr((key, slot.lecture_max, slot.lecture_min, slot.al_lecture_max))
+              for key, slot in problem.lec_slots_by_key.items()]
+    parts += [repr((key, slot.tutorial_max, slot.tutorial_min, slot.al_tutorial_max))
+              for key, slot in problem.tut_slots_by_key.items()]
+    parts += sorted(repr(("nc", c.event_a_id, c.event_b_id)) for c in problem.not_compatible)
+    parts += sorted(repr(("uw", c.event_id, c.slot_key)) for c in problem.unwanted)
+    parts += sorted(repr(("pref", c.event_id, c.slot_key, c.value)) for c in problem.preferences)
+    parts += sorted(repr(("pair", c.event_a_id, c.event_b_id)) for c in problem.pairs)
+    parts += sorted(repr(("pa", c.event_id, c.slot_key)) for c in problem.partial_assignments)
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()
+
+
+def weights_of(problem):
+    # same order as the ga_main command line
+    return " ".join(str(w) for w in (
+        problem.w_minfilled, problem.w_pref, problem.w_pair, problem.w_secdiff,
+        problem.pen_lecturemin, problem.pen_tutorialmin, problem.pen_notpaired, problem.pen_section,
+    ))
+
+
+class GenerationLog:
+    """
+    Telemetry sink for GeneticAlgorithm.run that keeps a short summary every
+    `interval` generations in memory (for RunArchive.record_run). Another
+    sink (e.g. a control.telemetry.Telemetry) can be chained behind it; it
+    then sets the interval.
+    """
+
+    def __init__(self, interval=100, forward=None):
+        self.forward = forward
+        self.interval = forward.interval if forward is not None else max(1, interval)
+        self.started = time.perf_counter()
+        self.rows = []
+
+    def record(self, ga, population, best_hard):
+        _, best_soft, _, _ = population[0]
+        softs = [soft for _, soft, _, _ in population]
+        valid = sum(1 for _, soft, fit, _ in population if hard_from_fitness(fit, soft, ga.w_hard, ga.w_soft) == 0)
+        self.rows.append((
+            ga.generation, round(time.perf_counter() - self.started, 3), best_hard, best_soft,
+            sum(softs) / len(softs), valid / len(population),
+        ))
+        if self.forward is not None:
+            self.forward.record(ga, population, best_hard)
+
+    def close(self):
+        if self.forward is not None:
+            self.forward.close()
+
+
+class RunArchive:
+    """
+    Archive of GA runs in an SQLite file (created on first use).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    def record_run(self, problem, schedule, hard, soft, generations=None, wall_time=None,
+                   seed=None, params=None, history=None):
+        """
+        Store one run; `history` is a GenerationLog (or its rows).
+
+        Returns:
+            the run id
+        """
+        rows = history.rows if isinstance(history, GenerationLog) else (history or [])
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO runs (instance_hash, instance_name, weights, seed, params, started, wall_time,"
+                " generations, hard, soft, schedule) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    instance_hash(problem), problem.name, weights_of(problem), seed,
+                    json.dumps(params or {}, sort_keys=True), time.time(), wall_time,
+                    generations, hard, soft, ScheduleCodec(problem).encode(schedule),
+                ),
+            )
+            run_id = cursor.lastrowid
+            self.db.executemany(
+                "INSERT INTO generations VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, *row) for row in rows],
+            )
+        return run_id
+
+    def best_known(self, problem, any_weights=False):
+        """
+        Best archived schedule for this instance: fewest hard violations,
+        then lowest soft penalty, for the problem's own weights (any weights
+        with any_weights=True; soft values are then not comparable, the
+        schedule is still a good warm start).
+
+        Returns:
+            (schedule, hard, soft, run_id) or None
+        """
+        query = "SELECT id, hard, soft, schedule FROM runs WHERE instance_hash = ?"
+        args = [instance_hash(problem)]
+        if not any_weights:
+            query += " AND weights = ?"
+            args.append(weights_of(problem))
+        row = self.db.execute(query + " ORDER BY hard, soft, id LIMIT 1", args).fetchone()
+        if row is None:
+            return None
+        run_id, hard, soft, data = row
+        return ScheduleCodec(problem).decode(data), hard, soft, run_id
+
+    def runs(self, problem=None):
+        """
+        Archived runs (newest first) as dicts without the schedule, all of
+        them or only those of `problem`'s instance.
+        """
+        query = ("SELECT id, instance_name, instance_hash, weights, seed, params, started, wall_time,"
+                 " generations, hard, soft FROM runs")
+        args = []
+        if problem is not None:
+            query += " WHERE instance_hash = ?"
+            args.append(instance_hash(problem))
+        cursor = self.db.execute(query + " ORDER BY id DESC", args)
+        names = [d[0] for d in cursor.description]
+        return [dict(zip(names, row)) for row in cursor]
+
+    def history(self, run_id):
+        """
+        Per-generation summary of a run: [(generation, elapsed, best_hard,
+        best_soft, mean_soft, valid_share), ...].
+        """
+        return self.db.execute(
+            "SELECT generation, elapsed, best_hard, best_soft, mean_soft, valid_share"
+            " FROM generations WHERE run_id = ? ORDER BY generation", (run_id,)
+        ).fetchall()
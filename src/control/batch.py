@@ -0,0 +1,164 @@
+import io
+import os
+import csv
+import json
+import time
+import random
+import itertools
+import multiprocessing
+from contextlib import redirect_stdout
+
+from parser.stream import parse_input_file_streaming
+from control.sweep import problem_with_weights
+
+
+"""
+    Batch experiments.
+
+    Runs the GA once for every (instance file, weight vector, seed) of a
+    matrix, in a local process pool, and collects one row per run into a
+    single CSV or JSON table (chosen by the file extension).
+
+    The table is rewritten after every finished run, so an interrupted batch
+    keeps its results: running the same batch again skips every run that
+    already has an "ok" row and only re-runs missing or failed ones.
+"""
+
+COLUMNS = ("instance", "weights", "seed", "status", "hard", "soft", "generations", "wall_time", "error")
+
+# instances parsed by this worker process (pool workers run many jobs)
+_parsed = {}
+
+
+def _instance(path):
+    problem = _parsed.get(path)
+    if problem is None:
+        problem = _parsed[path] = parse_input_file_streaming(path)
+    return problem
+
+
+def instance_label(path):
+    """
+    Normalized instance path for the table: relative to the working
+    directory for files below it, absolute otherwise, so that different
+    spellings of one file share its rows and equal names in different
+    directories do not.
+    """
+    path = os.path.abspath(path)
+    relative = os.path.relpath(path)
+    return path if relative.startswith(os.pardir) else relative
+
+
+def run_key(instance, weights, seed):
+    """
+    Identity of a run in the table: (instance path, "w1 ... w8", seed).
+    """
+    return (instance_label(instance), " ".join(str(w) for w in weights), int(seed))
+
+
+def _run_job(payload):
+    """
+    Worker: one GA run; returns a table row (errors are reported in the row).
+    """
+    from control.genetic_algorithm import GeneticAlgorithm
+
+    path, weights, seed, ga_params = payload
+    instance, weights_text, seed = run_key(path, weights, seed)
+    row = {"instance": instance, "weights": weights_text, "seed": seed}
+
+    started = time.perf_counter()
+    try:
+        with redirect_stdout(io.StringIO()):
+            problem = problem_with_weights(_instance(path), weights)
+            random.seed(seed)
+            ga = GeneticAlgorithm(problem, **ga_params)
+            _, soft, hard, _ = ga.run(print_interval=ga.max_generations + 1)
+        row.update(status="ok", hard=hard, soft=soft, generations=ga.generation, error="")
+    except (Exception, SystemExit) as e:
+        row.update(status="error", hard="", soft="", generations="", error=f"{type(e).__name__}: {e}")
+    row["wall_time"] = round(time.perf_counter() - started, 3)
+    return row
+
+
+def read_table(path):
+    """
+    Rows of an existing results table ([] if the file does not exist).
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, newline="") as f:
+        if path.endswith(".json"):
+            rows = json.load(f)
+        else:
+            rows = list(csv.DictReader(f))
+    for row in rows:
+        row["seed"] = int(row["seed"])
+    return rows
+
+
+def write_table(path, rows):
+    """
+    Write the results table (CSV, or JSON for a .json path) atomically.
+    """
+    rows = sorted(rows, key=lambda r: (r["instance"], r["weights"], r["seed"]))
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", newline="") as f:
+        if path.endswith(".json"):
+            json.dump([{k: row.get(k, "") for k in COLUMNS} for row in rows], f, indent=2)
+        else:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({k: row.get(k, "") for k in COLUMNS})
+    os.replace(tmp_path, path)
+
+
+def run_batch(instances, weight_vectors, seeds, output, workers=None, ga_params=None, on_row=None):
+    """
+    Run every (instance, weights, seed) combination that has no "ok" row
+    in `output` yet (rows of other runs in the table are kept).
+
+    Args:
+        instances: input file paths
+        weight_vectors: 8-tuples (ga_main weight / penalty order)
+        seeds: random seeds (one run per seed)
+        output: results table path (.csv or .json)
+        workers: concurrent runs (None = cpu count, 1 = inline)
+        ga_params: extra GeneticAlgorithm kwargs for every run
+        on_row: called with each new row as it arrives
+
+    Returns:
+        all rows of the table (earlier ones included)
+    """
+    existing = read_table(output)
+    done = {(r["instance"], r["weights"], r["seed"]) for r in existing if r["status"] == "ok"}
+
+    payloads = [
+        (path, tuple(weights), seed, dict(ga_params or {}))
+        for path, weights, seed in itertools.product(instances, weight_vectors, seeds)
+        if run_key(path, weights, seed) not in done
+    ]
+
+    # rows of runs that are about to be repeated are replaced, all others kept
+    todo = {run_key(path, weights, seed) for path, weights, seed, _ in payloads}
+    rows = [r for r in existing if (r["instance"], r["weights"], r["seed"]) not in todo]
+    print(f"[BATCH] {len(payloads)} runs to do, {len(rows)} already in {output}")
+
+    def collect(row):
+        rows.append(row)
+        write_table(output, rows)
+        if on_row is not None:
+            on_row(row)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(payloads) <= 1:
+        for payload in payloads:
+            collect(_run_job(payload))
+    else:
+        with multiprocessing.Pool(processes=min(workers, len(payloads))) as pool:
+            for row in pool.imap_unordered(_run_job, payloads):
+                collect(row)
+
+    if not payloads:
+        write_table(output, rows)
+    return rows
@@ -0,0 +1,357 @@
+import math
+import time
+
+from model.schedule import Schedule
+from model.domains import compute_domains
+from eval.hard_constraints import _lecture_tutorial_overlap
+from parser.constants import SPECIAL_COURSE_851, SPECIAL_COURSE_913
+
+# instances with at most this many events are tried with the exact solver first
+EXACT_EVENT_LIMIT = 40
+
+
+class BranchAndBound:
+    """
+    Exact depth-first branch-and-bound over event domains.
+
+    Given a schedule and a set of "free" events, it searches every placement of
+    the free events (the rest stay where they are) and returns the cheapest
+    one in soft penalty that breaks NO hard constraint.
+
+    Hard constraints are checked incrementally as events are placed:
+        - unary rules (evening, AL slot, unwanted, partial, blackout, special tut) via the domains
+        - capacity and AL capacity (C1/C8/C14/C15)
+        - not compatible + CPSC 851/913 vs 351/413 (C2/C12/C13)
+        - one 5XX lecture per time (C5)
+        - tutorial vs. lecture of the same section (C9)
+
+    After every placement the live values of all unplaced events are
+    recomputed (forward checking): an event with no value left kills the
+    node, and the event with the fewest values is branched on next (MRV).
+
+    The soft penalty is tracked with the same formulas as eval.eval, and a node
+    is cut once its lower bound can no longer beat the best completion found:
+        - pref/pair/secdiff terms already fixed by the placed events
+        - cheapest pref penalty each unplaced event can still reach
+        - minfilled shortfall that the unplaced events cannot possibly cover
+
+    The search stops early after node_limit placements or time_limit seconds;
+    `solve` reports whether the tree was fully explored.
+    """
+
+    def __init__(self, problem, domains=None, node_limit=20000, time_limit=None):
+        self.problem = problem
+        self.domains = domains if domains is not None else compute_domains(problem)
+        self.node_limit = node_limit
+        self.time_limit = time_limit
+        self.nodes = 0
+
+        # event_id -> event_ids that must not share its (day, time)
+        self.time_conflicts = {event_id: set() for event_id in problem.events_by_id}
+        for nc in problem.not_compatible:
+            if nc.event_a_id in self.time_conflicts and nc.event_b_id in self.time_conflicts:
+                self.time_conflicts[nc.event_a_id].add(nc.event_b_id)
+                self.time_conflicts[nc.event_b_id].add(nc.event_a_id)
+
+        related = {SPECIAL_COURSE_851: ("CPSC", 351), SPECIAL_COURSE_913: ("CPSC", 413)}
+        for event_id, event in problem.events_by_id.items():
+            course_key = related.get(f"{event.program_code} {event.course_no}")
+            if not event.is_special_tut or course_key is None:
+                continue
+            for other_id in problem.course_list.get(course_key, []) + problem.tut_list.get(course_key, []):
+                self.time_conflicts[event_id].add(other_id)
+                self.time_conflicts[other_id].add(event_id)
+
+        # event_id -> events of the same section with the other kind (C9)
+        self.section_partners = {event_id: [] for event_id in problem.events_by_id}
+        sections = {}
+        for event_id, event in problem.events_by_id.items():
+            key = (event.program_code, event.course_no, event.section_label)
+            sections.setdefault(key, []).append(event)
+        for members in sections.values():
+            for a in members:
+                for b in members:
+                    if a.is_lecture() and b.is_tutorial():
+                        self.section_partners[a.id].append(b.id)
+                        self.section_partners[b.id].append(a.id)
+
+        # soft lookups
+        self.prefs = {}
+        for pref in problem.preferences:
+            self.prefs.setdefault(pref.event_id, []).append((pref.slot_key, pref.value))
+
+        self.pair_partners = {}
+        for pair in problem.pairs:
+            self.pair_partners.setdefault(pair.event_a_id, []).append(pair.event_b_id)
+            self.pair_partners.setdefault(pair.event_b_id, []).append(pair.event_a_id)
+
+    # ------------------------------------------------------------------
+    # soft helpers (same formulas as eval.eval, weights included)
+    # ------------------------------------------------------------------
+    def _pref_cost(self, event_id, slot_key):
+        p = self.problem
+        # day and time only, like eval_pref (the kind in a preference key may differ)
+        return p.w_pref * sum(v for key, v in self.prefs.get(event_id, ()) if key[1:] != slot_key[1:])
+
+    def solve(self, schedule, free_ids, upper_bound=None):
+        """
+        Re-optimise the free events of `schedule`.
+
+        Args:
+            schedule: Schedule holding (at least) every non-free event; free
+                      events may be missing. It is not modified.
+            free_ids: event_ids to (re)place
+            upper_bound: only completions with soft strictly below this are
+                         returned (None = any hard-feasible completion)
+
+        Returns:
+            (Schedule or None, soft, complete)
+            - Schedule: best completion found (None if nothing beat the bound)
+            - soft: its soft penalty (or upper_bound if None)
+            - complete: True if the whole tree was searched within the node
+                        and time budget, i.e. the answer is proven optimal
+                        (or, with no bound and no Schedule, proven infeasible)
+        """
+        p = self.problem
+        free_ids = [eid for eid in free_ids if eid in p.events_by_id]
+        free_set = set(free_ids)
+        best_cost = math.inf if upper_bound is None else upper_bound
+
+        # ----- state from the fixed part -----
+        slot_of = {}
+        count = {}
+        al_count = {}
+        fivexx = {}
+        sec_count = {}
+
+        for event, slot in schedule.assignments.items():
+            if event.id in free_set:
+                continue
+            slot_of[event.id] = slot
+            self._place(event, slot, count, al_count, fivexx, sec_count)
+
+        lec_short = sum(max(0, s.lecture_min - count.get(k, 0)) for k, s in p.lec_slots_by_key.items())
+        tut_short = sum(max(0, s.tutorial_min - count.get(k, 0)) for k, s in p.tut_slots_by_key.items())
+
+        fixed_soft = 0
+        for event_id, slot in slot_of.items():
+            fixed_soft += self._pref_cost(event_id, slot.slot_key)
+        for pair in p.pairs:
+            a, b = slot_of.get(pair.event_a_id), slot_of.get(pair.event_b_id)
+            if a is not None and b is not None and a is not b:
+                fixed_soft += p.w_pair * p.pen_notpaired
+        sec_weight = p.w_secdiff * p.pen_section
+        fixed_soft += sec_weight * sum(c // 2 for c in sec_count.values())
+
+        free_events = {eid: p.get_event(eid) for eid in free_ids}
+        w_min_lec = p.w_minfilled * p.pen_lecturemin
+        w_min_tut = p.w_minfilled * p.pen_tutorialmin
+
+        self.nodes = 0
+        started = time.perf_counter()
+        best_assign = None
+        aborted = False
+        current = {}
+
+        def dfs(unplaced, settled, lec_short, tut_short):
+            nonlocal best_cost, best_assign, aborted
+
+            if not unplaced:
+                total = settled + w_min_lec * lec_short + w_min_tut * tut_short
+                if total < best_cost:
+                    best_cost = total
+                    best_assign = dict(current)
+                return
+
+            # propagate: live values of every unplaced event (forward checking),
+            # cheapest reachable pref per event, and pick the most constrained
+            # event to branch on (MRV)
+            branch_id, branch_options = None, None
+            pref_floor = 0
+            rem_lec = rem_tut = 0
+            for event_id in unplaced:
+                event = free_events[event_id]
+                options = [
+                    slot for slot in self.domains[event_id]
+                    if self._feasible(event, slot, slot_of, count, al_count, fivexx)
+                ]
+                if not options:
+                    return
+                pref_floor += min(self._pref_cost(event_id, slot.slot_key) for slot in options)
+                if event.is_lecture():
+                    rem_lec += 1
+                else:
+                    rem_tut += 1
+                if branch_options is None or len(options) < len(branch_options):
+                    branch_id, branch_options = event_id, options
+
+            bound = (
+                settled + pref_floor
+                + w_min_lec * max(0, lec_short - rem_lec)
+                + w_min_tut * max(0, tut_short - rem_tut)
+            )
+            if bound >= best_cost:
+                return
+
+            event = free_events[branch_id]
+            rest = [eid for eid in unplaced if eid != branch_id]
+            rest_floor = pref_floor - min(self._pref_cost(branch_id, slot.slot_key) for slot in branch_options)
+            rest_lec = rem_lec - (1 if event.is_lecture() else 0)
+            rest_tut = rem_tut - (1 if event.is_tutorial() else 0)
+
+            # cheapest values first so good incumbents show up early
+            options = sorted(
+                ((self._delta(event, slot, slot_of, count, sec_count), slot) for slot in branch_options),
+                key=lambda o: o[0]
+            )
+
+            for delta, slot in options:
+                if aborted:
+                    return
+                self.nodes += 1
+                if self.nodes > self.node_limit or (
+                    self.time_limit is not None
+                    and self.nodes % 16 == 0
+                    and time.perf_counter() - started > self.time_limit
+                ):
+                    aborted = True
+                    return
+
+                key = slot.slot_key
+                below_min = count.get(key, 0) < (slot.lecture_min if event.is_lecture() else slot.tutorial_min)
+                new_lec_short = lec_short - (1 if below_min and event.is_lecture() else 0)
+                new_tut_short = tut_short - (1 if below_min and event.is_tutorial() else 0)
+                new_settled = settled + delta
+
+                bound = (
+                    new_settled + rest_floor
+                    + w_min_lec * max(0, new_lec_short - rest_lec)
+                    + w_min_tut * max(0, new_tut_short - rest_tut)
+                )
+                if bound >= best_cost:
+                    continue
+
+                slot_of[branch_id] = slot
+                current[branch_id] = slot
+                self._place(event, slot, count, al_count, fivexx, sec_count)
+
+                dfs(rest, new_settled, new_lec_short, new_tut_short)
+
+                self._unplace(event, slot, count, al_count, fivexx, sec_count)
+                del current[branch_id]
+                del slot_of[branch_id]
+
+        dfs(sorted(free_ids), fixed_soft, lec_short, tut_short)
+
+        if best_assign is None:
+            return None, (upper_bound if upper_bound is not None else math.inf), not aborted
+
+        result = Schedule(assignments={e: s for e, s in schedule.assignments.items() if e.id not in free_set})
+        for event_id, slot in best_assign.items():
+            result.assign(p.get_event(event_id), slot)
+        return result, best_cost, not aborted
+
+    # ------------------------------------------------------------------
+    # incremental bookkeeping
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _place(event, slot, count, al_count, fivexx, sec_count):
+        key = slot.slot_key
+        count[key] = count.get(key, 0) + 1
+        if event.al_required:
+            al_count[key] = al_count.get(key, 0) + 1
+        if event.is_lecture():
+            sk = (event.program_code, event.course_no, key)
+            sec_count[sk] = sec_count.get(sk, 0) + 1
+            if event.is_500_course:
+                tk = (slot.day, slot.start_time)
+                fivexx[tk] = fivexx.get(tk, 0) + 1
+
+    @staticmethod
+    def _unplace(event, slot, count, al_count, fivexx, sec_count):
+        key = slot.slot_key
+        count[key] -= 1
+        if event.al_required:
+            al_count[key] -= 1
+        if event.is_lecture():
+            sec_count[(event.program_code, event.course_no, key)] -= 1
+            if event.is_500_course:
+                fivexx[(slot.day, slot.start_time)] -= 1
+
+    def _feasible(self, event, slot, slot_of, count, al_count, fivexx):
+        key = slot.slot_key
+
+        # capacity
+        if event.is_lecture():
+            if count.get(key, 0) >= slot.lecture_max:
+                return False
+            if event.al_required and al_count.get(key, 0) >= slot.al_lecture_max:
+                return False
+            if event.is_500_course and fivexx.get((slot.day, slot.start_time), 0) > 0:
+                return False
+        else:
+            if count.get(key, 0) >= slot.tutorial_max:
+                return False
+            if event.al_required and al_count.get(key, 0) >= slot.al_tutorial_max:
+                return False
+
+        # not compatible / special tutorials
+        for other_id in self.time_conflicts[event.id]:
+            other = slot_of.get(other_id)
+            if other is not None and other.day == slot.day and other.start_time == slot.start_time:
+                return False
+
+        # tutorial vs. lecture of the same section
+        for other_id in self.section_partners[event.id]:
+            other = slot_of.get(other_id)
+            if other is None:
+                continue
+            if event.is_lecture():
+                if _lecture_tutorial_overlap(slot, other):
+                    return False
+            elif _lecture_tutorial_overlap(other, slot):
+                return False
+
+        return True
+
+    def _delta(self, event, slot, slot_of, count, sec_count):
+        """Soft cost added by placing `event` in `slot` (minfilled handled by the caller)."""
+        p = self.problem
+        key = slot.slot_key
+        delta = self._pref_cost(event.id, key)
+
+        for other_id in self.pair_partners.get(event.id, ()):
+            other = slot_of.get(other_id)
+            if other is not None and other is not slot:
+                delta += p.w_pair * p.pen_notpaired
+
+        if event.is_lecture():
+            # count // 2 goes up by one on every even count
+            if sec_count.get((event.program_code, event.course_no, key), 0) % 2 == 1:
+                delta += p.w_secdiff * p.pen_section
+
+        return delta
+
+
+def solve_exact(problem, node_limit=500000, time_limit=10.0):
+    """
+    Solve a whole (small) instance with BranchAndBound.
+
+    Returns:
+        (schedule, soft, complete) - see BranchAndBound.solve. With complete=True
+        the schedule is optimal, or None means no valid schedule exists.
+    """
+    solver = BranchAndBound(problem, node_limit=node_limit, time_limit=time_limit)
+    started = time.perf_counter()
+    schedule, soft, complete = solver.solve(Schedule(), problem.get_all_event_ids())
+    elapsed = (time.perf_counter() - started) * 1000
+
+    if complete and schedule is not None:
+        print(f"\n[B&B] Optimal schedule proven: soft={soft}  ({solver.nodes} nodes, {elapsed:.1f} ms)")
+    elif complete:
+        print(f"\n[B&B] Proved no valid schedule exists ({solver.nodes} nodes, {elapsed:.1f} ms)")
+    else:
+        found = f"best soft so far={soft}" if schedule is not None else "no valid schedule yet"
+        print(f"\n[B&B] Budget exhausted after {solver.nodes} nodes, {elapsed:.1f} ms ({found}) — handing over to the GA")
+
+    return schedule, soft, complete
@@ -0,0 +1,170 @@
+import os
+import gzip
+import json
+import base64
+import hashlib
+import random
+
+from model.encoding import ScheduleCodec
+
+
+"""
+    GA checkpoints.
+
+    A checkpoint is a gzipped JSON document holding everything the main loop
+    of GeneticAlgorithm.run needs to continue bit-for-bit:
+        - the population, in order, with each distinct schedule stored once
+          (the elite can sit in the population twice, and parent selection
+          compares schedules by identity)
+        - the state of the `random` module
+        - generation, plateau_counter, valid_found, restarts, best_fitness_before
+        - the adapted mutation rate and the diversity it is measured against
+        - search bounds and operator / LNS statistics
+        - the hall of fame (alternative valid schedules, kept across restarts)
+
+    Files are written to a temporary file and renamed, so a crash while
+    writing never leaves a half-written checkpoint behind.
+"""
+
+CHECKPOINT_VERSION = 3
+
+
+def problem_signature(problem):
+    """
+    Hash of everything a checkpoint depends on: event and slot order
+    (used by the encoding) plus weights and penalties (used by fitness).
+    """
+    parts = list(problem.events_by_id)
+    parts += [repr(key) for key in problem.lec_slots_by_key]
+    parts += [repr(key) for key in problem.tut_slots_by_key]
+    parts.append(repr((problem.w_minfilled, problem.w_pref, problem.w_pair, problem.w_secdiff)))
+    parts.append(repr((problem.pen_lecturemin, problem.pen_tutorialmin, problem.pen_notpaired, problem.pen_section)))
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()
+
+
+def checkpoint_path_for(input_filename, root_dir, output_dir="output"):
+    # e.g. output/deptinst2_checkpoint.json.gz
+    base_name = os.path.splitext(os.path.basename(input_filename))[0]
+    return os.path.join(root_dir, output_dir, f"{base_name}_checkpoint.json.gz")
+
+
+def atomic_write(path, data):
+    """Write bytes to `path` through a temporary file + rename."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def save_checkpoint(path, ga, population, best_fitness_before):
+    """
+    Write the state of `ga` at the top of generation ga.generation.
+
+    Args:
+        path: checkpoint file
+        ga: GeneticAlgorithm
+        population: list of (schedule, eval, fitness, prob) tuples
+        best_fitness_before: plateau reference of the main loop
+    """
+    codec = ScheduleCodec(ga.problem)
+
+    schedules = []
+    index_of = {}
+    members = []
+    for schedule, eval_v, fit_v, prob in population:
+        if id(schedule) not in index_of:
+            index_of[id(schedule)] = len(schedules)
+            schedules.append(base64.b64encode(codec.encode(schedule)).decode("ascii"))
+        members.append([index_of[id(schedule)], eval_v, fit_v, prob])
+
+    hall_of_fame = [
+        [base64.b64encode(codec.encode(schedule)).decode("ascii"), soft, order]
+        for schedule, soft, order in ga.hall_of_fame.entries()
+    ]
+
+    version, internal, gauss = random.getstate()
+
+    state = {
+        "version": CHECKPOINT_VERSION,
+        "problem": ga.problem.name,
+        "signature": problem_signature(ga.problem),
+        "bounds": {
+            "max_generations": ga.max_generations,
+            "plateau_limit": ga.plateau_limit,
+            "population_size": ga.population_size,
+            "base_population_size": ga.base_population_size,
+            "p_mutation": ga.p_mutation,
+            "w_hard": ga.w_hard,
+            "w_soft": ga.w_soft,
+            "polish_interval": ga.polish_interval,
+            "polish_iterations": ga.polish_iterations,
+            "max_valid_solutions": ga.max_valid_solutions,
+            "solution_distance": ga.solution_distance,
+            "restart": ga.restart,
+            "max_restarts": ga.max_restarts,
+            "adaptive_mutation": ga.adaptive_mutation,
+            "min_diversity": ga.min_diversity,
+        },
+        "counters": {
+            "generation": ga.generation,
+            "plateau_counter": ga.plateau_counter,
+            "valid_found": ga.valid_found,
+            "restarts": ga.restarts,
+            "mutation_rate": ga.mutation_rate,
+            "initial_diversity": ga.initial_diversity,
+            "best_fitness_before": best_fitness_before,
+        },
+        "operator_stats": ga.operator_stats,
+        "lns_stats": (
+            {"attempts": ga.lns.attempts, "improvements": ga.lns.improvements}
+            if ga.lns is not None else None
+        ),
+        "rng": [version, list(internal), gauss],
+        "schedules": schedules,
+        "population": members,
+        "hall_of_fame": {"order": ga.hall_of_fame.order, "members": hall_of_fame},
+    }
+
+    atomic_write(path, gzip.compress(json.dumps(state).encode("utf-8"), mtime=0))
+
+
+def load_checkpoint(path, problem):
+    """
+    Read a checkpoint written by save_checkpoint for `problem`.
+
+    Returns:
+        dict with the decoded "population" (shared schedules restored) and
+        "hall_of_fame", and the raw "bounds", "counters", "operator_stats",
+        "lns_stats", "rng"
+
+    Raises:
+        ValueError: unknown version, or the checkpoint belongs to another
+                    instance / other weights
+    """
+    with open(path, "rb") as f:
+        state = json.loads(gzip.decompress(f.read()).decode("utf-8"))
+
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version {state.get('version')} in {path}")
+    if state["signature"] != problem_signature(problem):
+        raise ValueError(
+            f"Checkpoint {path} was written for '{state['problem']}' with other events, slots or weights"
+        )
+
+    codec = ScheduleCodec(problem)
+    schedules = [codec.decode(base64.b64decode(data)) for data in state["schedules"]]
+    state["population"] = [
+        (schedules[index], eval_v, fit_v, prob) for index, eval_v, fit_v, prob in state["population"]
+    ]
+
+    state["hall_of_fame"]["members"] = [
+        (codec.decode(base64.b64decode(data)), soft, order) for data, soft, order in state["hall_of_fame"]["members"]
+    ]
+
+    version, internal, gauss = state["rng"]
+    state["rng"] = (version, tuple(internal), gauss)
+    return state
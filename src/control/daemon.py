@@ -0,0 +1,437 @@
+import io
+import json
+import time
+import uuid
+import hashlib
+import threading
+import multiprocessing
+from multiprocessing.connection import wait as wait_ready
+from collections import OrderedDict
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from parser.stream import StreamingParser
+from control.sweep import problem_with_weights, WEIGHT_NAMES
+
+
+"""
+    Solver service.
+
+    A long-running process that keeps parsed instances in memory and runs GA
+    jobs in a bounded set of worker processes, so planners do not pay for
+    interpreter start-up, imports and parsing on every request, and several
+    submissions queue up instead of competing for the CPU.
+
+    HTTP / JSON protocol (localhost):
+
+        POST   /jobs              submit {"instance": <input file text>
+                                          or "input_file": <path>,
+                                          "weights": [8 numbers, ga_main order],
+                                          "time_limit": seconds (optional),
+                                          "ga": {GeneticAlgorithm bounds} (optional)}
+                                  -> {"id": ...}
+        GET    /jobs              all jobs (status only)
+        GET    /jobs/<id>         status, best-so-far and (when done) the schedule
+        GET    /jobs/<id>/stream  one JSON line per best-so-far improvement
+                                  until the job ends
+        DELETE /jobs/<id>         cancel (queued or running)
+
+    Job status: queued -> running -> done | failed | cancelled
+"""
+
+# GeneticAlgorithm arguments a client may set
+GA_PARAMS = ("max_generations", "plateau_limit", "population_size", "p_mutation", "polish_interval")
+
+FINISHED = ("done", "failed", "cancelled")
+
+
+def _is_number(value):
+    # JSON numbers only (json.loads gives int / float; bool is an int subclass)
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _solve_job(problem, weights, ga_params, updates):
+    """
+    Worker process: run the GA for one job, reporting every best-so-far
+    improvement and the final result through its `updates` pipe (one pipe
+    per job, so terminating a cancelled worker cannot corrupt another
+    job's messages).
+    """
+    from control.genetic_algorithm import GeneticAlgorithm
+
+    def report(schedule, soft, hard, fitness_value, generation):
+        updates.send(("progress", {
+            "hard": hard, "soft": soft, "fitness": fitness_value, "generation": generation,
+        }))
+
+    try:
+        point = problem_with_weights(problem, weights)
+        with redirect_stdout(io.StringIO()):
+            ga = GeneticAlgorithm(point, **ga_params)
+            schedule, soft, hard, fitness_value = ga.run(
+                print_interval=ga.max_generations + 1, on_improvement=report, snapshot_interval=0.5
+            )
+        updates.send(("done", {
+            "hard": hard, "soft": soft, "fitness": fitness_value, "generation": ga.generation,
+            "schedule": {event.id: f"{slot.day}, {slot.start_time}" for event, slot in schedule.assignments.items()},
+        }))
+    except (Exception, SystemExit) as e:
+        updates.send(("failed", {"error": f"{type(e).__name__}: {e}"}))
+    finally:
+        updates.close()
+
+
+class SolverService:
+    """
+    Job queue, worker processes and instance cache behind the HTTP handler.
+
+    Args:
+        workers: jobs that may run at the same time (one process each)
+        cache_size: parsed instances kept in memory (least recently used
+                    ones are dropped first)
+    """
+
+    def __init__(self, workers=2, cache_size=16):
+        self.workers = workers
+        self.cache_size = cache_size
+        self.instances = OrderedDict()      # sha1 of the input text -> ProblemInstance
+        self.jobs = OrderedDict()           # job id -> job dict
+        self.queue = []                     # queued job ids, oldest first
+        self.processes = {}                 # running job id -> Process
+        self.pipes = {}                     # running job id -> read end of its updates pipe
+
+        self.lock = threading.Condition()
+        # workers are started while the dispatch thread holds the lock and the
+        # HTTP threads run, so they must not be forked from this process
+        methods = multiprocessing.get_all_start_methods()
+        self.context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        self.closed = False
+
+        self.threads = [
+            threading.Thread(target=self._dispatch, daemon=True),
+            threading.Thread(target=self._collect, daemon=True),
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    # =====================================================================
+    # Instances
+    # =====================================================================
+    def instance(self, text):
+        """
+        Parsed instance for an input file text (parsed once per distinct text).
+        """
+        key = hashlib.sha1(text.encode()).hexdigest()
+        with self.lock:
+            problem = self.instances.get(key)
+            if problem is not None:
+                self.instances.move_to_end(key)
+                return problem
+
+        builder = StreamingParser()
+        with redirect_stdout(io.StringIO()):
+            for line in text.splitlines():
+                line = line.strip()
+                if line:
+                    builder.feed(line)
+            problem = builder.finish()
+
+        with self.lock:
+            self.instances[key] = problem
+            while len(self.instances) > self.cache_size:
+                self.instances.popitem(last=False)
+        return problem
+
+    # =====================================================================
+    # Jobs
+    # =====================================================================
+    def submit(self, request):
+        """
+        Queue a job from a decoded JSON request; returns its id.
+        Raises ValueError for a malformed request.
+        """
+        if not isinstance(request, dict):
+            raise ValueError(f"request must be a JSON object, got {type(request).__name__}")
+
+        if "instance" in request:
+            text = request["instance"]
+            if not isinstance(text, str):
+                raise ValueError("'instance' must be the input file text")
+        elif "input_file" in request:
+            if not isinstance(request["input_file"], str):
+                raise ValueError("'input_file' must be a path")
+            with open(request["input_file"]) as f:
+                text = f.read()
+        else:
+            raise ValueError("request needs 'instance' (input file text) or 'input_file'")
+
+        weights = request.get("weights", [1] * len(WEIGHT_NAMES))
+        if (
+            not isinstance(weights, list) or len(weights) != len(WEIGHT_NAMES)
+            or not all(_is_number(w) for w in weights)
+        ):
+            raise ValueError(f"'weights' needs {len(WEIGHT_NAMES)} numbers: {' '.join(WEIGHT_NAMES)}")
+        weights = tuple(int(w) for w in weights)
+
+        ga = request.get("ga") or {}
+        if not isinstance(ga, dict):
+            raise ValueError("'ga' must be an object of GeneticAlgorithm parameters")
+        unknown = set(ga) - set(GA_PARAMS)
+        if unknown:
+            raise ValueError(f"unknown 'ga' parameters: {sorted(unknown)} (allowed: {list(GA_PARAMS)})")
+        if not all(_is_number(v) for v in ga.values()):
+            raise ValueError("'ga' parameters must be numbers")
+        ga_params = dict(ga)
+        if request.get("time_limit") is not None:
+            if not _is_number(request["time_limit"]):
+                raise ValueError("'time_limit' must be a number of seconds")
+            ga_params["time_limit"] = float(request["time_limit"])
+
+        problem = self.instance(text)
+
+        job_id = uuid.uuid4().hex[:12]
+        with self.lock:
+            self.jobs[job_id] = {
+                "id": job_id, "status": "queued", "instance": problem.name, "weights": list(weights),
+                "submitted": time.time(), "started": None, "finished": None,
+                "best": None, "progress": [], "result": None, "error": None,
+                "problem": problem, "ga_params": ga_params,
+            }
+            self.queue.append(job_id)
+            self.lock.notify_all()
+        return job_id
+
+    def status(self, job_id, full=True):
+        """
+        JSON-ready view of a job (None if unknown); the schedule only with full=True.
+        """
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            view = {k: job[k] for k in ("id", "status", "instance", "weights", "submitted", "started", "finished", "best", "error")}
+            if full:
+                view["result"] = job["result"]
+            return view
+
+    def list(self):
+        with self.lock:
+            ids = list(self.jobs)
+        return [self.status(job_id, full=False) for job_id in ids]
+
+    def cancel(self, job_id):
+        """
+        Cancel a queued or running job; returns False if it is unknown or already finished.
+        """
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None or job["status"] in FINISHED:
+                return False
+            if job_id in self.queue:
+                self.queue.remove(job_id)
+            self._stop(job_id, terminate=True)
+            self._finish(job, "cancelled")
+            return True
+
+    def stream(self, job_id, poll=1.0):
+        """
+        Yield every best-so-far update of a job (earlier ones first), then
+        its final status once it has finished.
+        """
+        sent = 0
+        while True:
+            with self.lock:
+                job = self.jobs.get(job_id)
+                if job is None:
+                    return
+                while sent == len(job["progress"]) and job["status"] not in FINISHED:
+                    self.lock.wait(poll)
+                pending = job["progress"][sent:]
+                sent = len(job["progress"])
+                finished = job["status"] in FINISHED
+            for update in pending:
+                yield update
+            if finished:
+                yield self.status(job_id, full=False)
+                return
+
+    def wait(self, job_id, timeout=None):
+        """
+        Block until a job has finished; returns its status (None if the job
+        is unknown, as for status(), or on timeout).
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self.lock:
+            if job_id not in self.jobs:
+                return None
+            while self.jobs[job_id]["status"] not in FINISHED:
+                left = None if deadline is None else deadline - time.time()
+                if left is not None and left <= 0:
+                    return None
+                self.lock.wait(left)
+        return self.status(job_id)
+
+    def close(self):
+        """
+        Stop dispatching and terminate running workers.
+        """
+        with self.lock:
+            self.closed = True
+            for job_id in list(self.processes):
+                self._stop(job_id, terminate=True)
+                self._finish(self.jobs[job_id], "cancelled")
+            self.lock.notify_all()
+
+    # =====================================================================
+    # Background threads
+    # =====================================================================
+    def _finish(self, job, status):
+        job["status"] = status
+        job["finished"] = time.time()
+        job["problem"] = None
+        self.lock.notify_all()
+
+    def _stop(self, job_id, terminate=False):
+        # forget a job's worker (terminating it first if it is still running)
+        process = self.processes.pop(job_id, None)
+        pipe = self.pipes.pop(job_id, None)
+        if process is not None:
+            if terminate:
+                process.terminate()
+            process.join(timeout=5)
+        if pipe is not None:
+            pipe.close()
+
+    def _dispatch(self):
+        # start queued jobs while fewer than `workers` are running
+        with self.lock:
+            while not self.closed:
+                while self.queue and len(self.processes) < self.workers:
+                    job_id = self.queue.pop(0)
+                    job = self.jobs[job_id]
+                    reader, writer = self.context.Pipe(duplex=False)
+                    process = self.context.Process(
+                        target=_solve_job,
+                        args=(job["problem"], tuple(job["weights"]), job["ga_params"], writer),
+                        daemon=True,
+                    )
+                    process.start()
+                    writer.close()
+                    self.processes[job_id] = process
+                    self.pipes[job_id] = reader
+                    job["status"] = "running"
+                    job["started"] = time.time()
+
+                self.lock.wait(0.2)
+
+    def _collect(self):
+        # apply worker messages to the job table; a pipe that closes before
+        # "done" / "failed" means the worker died
+        while not self.closed:
+            with self.lock:
+                readers = {pipe: job_id for job_id, pipe in self.pipes.items()}
+            if not readers:
+                time.sleep(0.05)
+                continue
+
+            for pipe in wait_ready(list(readers), timeout=0.2):
+                job_id = readers[pipe]
+                try:
+                    kind, data = pipe.recv()
+                except (EOFError, OSError):
+                    kind, data = "failed", None
+
+                with self.lock:
+                    job = self.jobs[job_id]
+                    if job["status"] in FINISHED or self.pipes.get(job_id) is not pipe:
+                        continue
+                    if kind == "progress":
+                        job["best"] = data
+                        job["progress"].append(data)
+                        self.lock.notify_all()
+                        continue
+
+                    self._stop(job_id)
+                    if kind == "done":
+                        schedule = data.pop("schedule")
+                        job["best"] = data
+                        job["result"] = dict(data, schedule=schedule)
+                        self._finish(job, "done")
+                    else:
+                        job["error"] = data["error"] if data else "worker exited before reporting a result"
+                        self._finish(job, "failed")
+
+
+class SolverRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON front end of a SolverService (self.server.service).
+    """
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def send_json(self, code, body):
+        data = json.dumps(body).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def parts(self):
+        return [p for p in self.path.split("?", 1)[0].split("/") if p]
+
+    def do_POST(self):
+        if self.parts() != ["jobs"]:
+            return self.send_json(404, {"error": "not found"})
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            job_id = self.server.service.submit(request)
+        except (ValueError, OSError) as e:
+            return self.send_json(400, {"error": str(e)})
+        self.send_json(202, {"id": job_id})
+
+    def do_GET(self):
+        parts = self.parts()
+        service = self.server.service
+        if parts == ["jobs"]:
+            return self.send_json(200, service.list())
+        if len(parts) == 2 and parts[0] == "jobs":
+            status = service.status(parts[1])
+            if status is None:
+                return self.send_json(404, {"error": f"unknown job {parts[1]}"})
+            return self.send_json(200, status)
+        if len(parts) == 3 and parts[0] == "jobs" and parts[2] == "stream":
+            if service.status(parts[1], full=False) is None:
+                return self.send_json(404, {"error": f"unknown job {parts[1]}"})
+            # newline-delimited JSON, the connection closes when the job ends
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.end_headers()
+            for update in service.stream(parts[1]):
+                self.wfile.write((json.dumps(update) + "\n").encode())
+                self.wfile.flush()
+            return
+        self.send_json(404, {"error": "not found"})
+
+    def do_DELETE(self):
+        parts = self.parts()
+        if len(parts) != 2 or parts[0] != "jobs":
+            return self.send_json(404, {"error": "not found"})
+        if self.server.service.status(parts[1], full=False) is None:
+            return self.send_json(404, {"error": f"unknown job {parts[1]}"})
+        cancelled = self.server.service.cancel(parts[1])
+        self.send_json(200, {"id": parts[1], "cancelled": cancelled})
+
+
+def make_server(service, host="127.0.0.1", port=8765, verbose=False):
+    """
+    HTTP server for `service` (port 0 picks a free port: server.server_address[1]).
+    """
+    server = ThreadingHTTPServer((host, port), SolverRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.verbose = verbose
+    return server
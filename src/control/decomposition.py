@@ -0,0 +1,276 @@
+import io
+import os
+import time
+import random
+import multiprocessing
+from contextlib import redirect_stdout
+
+from model.schedule import Schedule
+from model.domains import compute_domains
+from model.constraint_graph import build_constraint_graph, connected_components
+from parser.slot import LectureSlot, TutorialSlot
+from parser.problem_instance import ProblemInstance
+from eval.eval import eval as soft_eval
+from eval.hard_constraints import Valid
+from control.branch_and_bound import BranchAndBound, EXACT_EVENT_LIMIT
+
+
+"""
+    Constraint-graph decomposition.
+
+    Events that are not linked by any not-compatible / pair / section / 5XX
+    constraint only interact through slot capacities (and slot minimums).
+    If every component gets its own share of each slot's capacity, the
+    components can be solved independently (in parallel processes) and the
+    results stitched back into one Schedule that respects the real capacities.
+
+    Small components are solved exactly with BranchAndBound, the rest with
+    the GA.
+
+    If the components are coupled too tightly (one giant component, or the
+    capacity cannot be split so that every component still fits), callers
+    fall back to the normal whole-instance search.
+"""
+
+
+def _split(total, weights):
+    """
+    Largest-remainder split of `total` units proportionally to `weights`,
+    never giving a component more than its weight (its demand).
+    Leftover units go round-robin to components that still want more.
+    """
+    shares = [0] * len(weights)
+    demand = sum(weights)
+    if total <= 0 or demand <= 0:
+        return shares
+
+    exact = [total * w / demand for w in weights]
+    shares = [min(int(x), w) for x, w in zip(exact, weights)]
+
+    order = sorted(range(len(weights)), key=lambda i: (exact[i] - int(exact[i])), reverse=True)
+    left = total - sum(shares)
+    while left > 0:
+        gave = False
+        for i in order:
+            if left == 0:
+                break
+            if shares[i] < weights[i]:
+                shares[i] += 1
+                left -= 1
+                gave = True
+        if not gave:
+            break
+    return shares
+
+
+def allocate_budgets(problem, components, domains):
+    """
+    Split every slot's max / min / AL max between the components.
+
+    1. reserve: place every event (most constrained first) into the slot of its
+       domain with the most capacity left, ignoring everything but capacity;
+       each component is guaranteed the capacity its events used there
+    2. share: whatever capacity is left is split proportionally to demand
+       (number of a component's events whose domain contains the slot)
+
+    Slot minimums (soft) are split proportionally to demand as well.
+
+    Returns:
+        list (one per component) of dict slot_key -> (max, min, al_max),
+        or None if the events cannot even be packed by capacity alone
+    """
+    owner = {}
+    for index, component in enumerate(components):
+        for event_id in component:
+            owner[event_id] = index
+
+    all_slots = list(problem.lec_slots_by_key.values()) + list(problem.tut_slots_by_key.values())
+    left = {}
+    al_left = {}
+    for slot in all_slots:
+        if isinstance(slot, LectureSlot):
+            left[slot.slot_key], al_left[slot.slot_key] = slot.lecture_max, slot.al_lecture_max
+        else:
+            left[slot.slot_key], al_left[slot.slot_key] = slot.tutorial_max, slot.al_tutorial_max
+
+    # 1. reserve
+    reserved = [{s.slot_key: [0, 0] for s in all_slots} for _ in components]
+    for event_id in sorted(domains, key=lambda e: (len(domains[e]), e)):
+        event = problem.get_event(event_id)
+        options = [
+            s for s in domains[event_id]
+            if left[s.slot_key] > 0 and (not event.al_required or al_left[s.slot_key] > 0)
+        ]
+        if not options:
+            return None
+        slot = max(options, key=lambda s: left[s.slot_key])
+        left[slot.slot_key] -= 1
+        reserved[owner[event_id]][slot.slot_key][0] += 1
+        if event.al_required:
+            al_left[slot.slot_key] -= 1
+            reserved[owner[event_id]][slot.slot_key][1] += 1
+
+    # 2. share the rest
+    budgets = [{} for _ in components]
+    for slot in all_slots:
+        key = slot.slot_key
+        demand = [0] * len(components)
+        al_demand = [0] * len(components)
+        for event_id, domain in domains.items():
+            if slot in domain:
+                demand[owner[event_id]] += 1
+                if problem.get_event(event_id).al_required:
+                    al_demand[owner[event_id]] += 1
+
+        low = slot.lecture_min if isinstance(slot, LectureSlot) else slot.tutorial_min
+        extra = _split(left[key], [max(0, d - r[key][0]) for d, r in zip(demand, reserved)])
+        al_extra = _split(al_left[key], [max(0, d - r[key][1]) for d, r in zip(al_demand, reserved)])
+        mins = _split(low, demand)
+
+        for index in range(len(components)):
+            cap, al_cap = reserved[index][key]
+            budgets[index][key] = (cap + extra[index], mins[index], al_cap + al_extra[index])
+
+    return budgets
+
+
+def build_subproblem(problem, event_ids, budget, index):
+    """
+    Make a ProblemInstance holding only `event_ids`, with slot capacities
+    replaced by this component's budget. Events are shared with the parent.
+    """
+    keep = set(event_ids)
+    sub = ProblemInstance()
+    sub.name = f"{problem.name}#c{index}"
+
+    sub.lec_by_id = {k: v for k, v in problem.lec_by_id.items() if k in keep}
+    sub.tut_by_id = {k: v for k, v in problem.tut_by_id.items() if k in keep}
+    sub.events_by_id = {**sub.lec_by_id, **sub.tut_by_id}
+    for course_key, ids in problem.course_list.items():
+        mine = [i for i in ids if i in keep]
+        if mine:
+            sub.course_list[course_key] = mine
+    for course_key, ids in problem.tut_list.items():
+        mine = [i for i in ids if i in keep]
+        if mine:
+            sub.tut_list[course_key] = mine
+
+    for key, slot in problem.lec_slots_by_key.items():
+        cap, low, al_cap = budget[key]
+        sub.lec_slots_by_key[key] = LectureSlot(slot.day, slot.start_time, cap, low, al_cap)
+    for key, slot in problem.tut_slots_by_key.items():
+        cap, low, al_cap = budget[key]
+        sub.tut_slots_by_key[key] = TutorialSlot(slot.day, slot.start_time, cap, low, al_cap)
+    sub.lec_slot_index = dict(problem.lec_slot_index)
+    sub.tut_slot_index = dict(problem.tut_slot_index)
+
+    sub.not_compatible = [c for c in problem.not_compatible if c.event_a_id in keep and c.event_b_id in keep]
+    sub.pairs = [c for c in problem.pairs if c.event_a_id in keep and c.event_b_id in keep]
+    sub.unwanted = [c for c in problem.unwanted if c.event_id in keep]
+    sub.preferences = [c for c in problem.preferences if c.event_id in keep]
+    sub.partial_assignments = [c for c in problem.partial_assignments if c.event_id in keep]
+
+    sub.set_penalties(problem.pen_lecturemin, problem.pen_tutorialmin, problem.pen_notpaired, problem.pen_section)
+    sub.set_weights(problem.w_minfilled, problem.w_pref, problem.w_pair, problem.w_secdiff)
+    return sub
+
+
+def _solve_component(payload):
+    """
+    Worker: solve one sub-problem (exactly if it is small, GA otherwise);
+    returns plain data so it pickles cheaply.
+    """
+    from control.genetic_algorithm import GeneticAlgorithm
+
+    index, subproblem, ga_params, seed, deadline = payload
+    if seed is not None:
+        random.seed(seed + index)
+
+    seeds = []
+    if len(subproblem.events_by_id) <= EXACT_EVENT_LIMIT:
+        exact_limit = 5.0 if deadline is None else max(0.0, min(5.0, deadline - time.time()))
+        solver = BranchAndBound(subproblem, node_limit=100000, time_limit=exact_limit)
+        schedule, soft, complete = solver.solve(Schedule(), subproblem.get_all_event_ids())
+        if schedule is not None and complete:
+            assignment = {event.id: slot.slot_key for event, slot in schedule.assignments.items()}
+            return index, assignment, 0, soft, 0
+        if schedule is not None:
+            seeds = [schedule]
+
+    # components that start late (in a later wave) get what is left of the budget
+    if deadline is not None:
+        ga_params = dict(ga_params, time_limit=max(0.0, deadline - time.time()))
+
+    with redirect_stdout(io.StringIO()):
+        ga = GeneticAlgorithm(subproblem, **ga_params)
+        schedule, soft, hard, _ = ga.run(print_interval=ga.max_generations + 1, seed_schedules=seeds)
+
+    assignment = {event.id: slot.slot_key for event, slot in schedule.assignments.items()}
+    return index, assignment, hard, soft, ga.generation
+
+
+def solve_decomposed(problem, workers=None, max_component_share=0.8, ga_params=None, seed=None, deadline=None):
+    """
+    Solve `problem` component by component.
+
+    Args:
+        problem: ProblemInstance
+        workers: number of processes (None = cpu count, 1 = run inline)
+        max_component_share: give up if the biggest component holds more
+                             than this fraction of all events
+        ga_params: extra GeneticAlgorithm kwargs for every component
+        seed: base random seed (component i uses seed + i)
+        deadline: time.time() by which every component must be done; each
+                  one gets the time left when it starts (overrides a
+                  time_limit in ga_params)
+
+    Returns:
+        (schedule, soft, hard, generations) on success, or None when the
+        caller should fall back to whole-instance search
+    """
+    domains = compute_domains(problem)
+    components = connected_components(build_constraint_graph(problem))
+    total = len(problem.events_by_id)
+
+    print(f"\n[DECOMP] {len(components)} components, sizes: {[len(c) for c in components]}")
+
+    if len(components) < 2 or len(components[0]) > max_component_share * total:
+        print("[DECOMP] Components too coupled — falling back to whole-instance search.")
+        return None
+
+    budgets = allocate_budgets(problem, components, domains)
+    if budgets is None:
+        print("[DECOMP] Slot capacities cannot be split between components — falling back.")
+        return None
+
+    payloads = [
+        (index, build_subproblem(problem, component, budgets[index], index), dict(ga_params or {}), seed, deadline)
+        for index, component in enumerate(components)
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = [_solve_component(p) for p in payloads]
+    else:
+        with multiprocessing.Pool(processes=min(workers, len(payloads))) as pool:
+            results = pool.map(_solve_component, payloads)
+
+    # stitch back onto the parent's Event and Slot objects
+    schedule = Schedule()
+    generations = 0
+    for index, assignment, hard, soft, gens in sorted(results, key=lambda r: r[0]):
+        generations = max(generations, gens)
+        if hard > 0:
+            print(f"[DECOMP] Component {index} ended with hard={hard} — falling back.")
+            return None
+        for event_id, slot_key in assignment.items():
+            schedule.assign(problem.get_event(event_id), problem.get_slot(slot_key))
+
+    hard = Valid(schedule, problem)
+    if hard > 0:
+        print(f"[DECOMP] Stitched schedule has hard={hard} — falling back.")
+        return None
+
+    soft = soft_eval(schedule, problem)
+    print(f"[DECOMP] Stitched schedule: hard={hard}  soft={soft}")
+    return schedule, soft, hard, generations
@@ -0,0 +1,165 @@
+import math
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+"""
+    Population diversity.
+
+    The population is encoded as an n x E matrix of slot indices (one row per
+    individual, one column per event in problem order, -1 = unassigned), and
+    everything is computed from it:
+
+        mean_distance: mean pairwise Hamming distance as a share of the events
+                       (0 = all individuals identical)
+        entropy:       mean per-event allele entropy in bits (0 = every event
+                       sits in the same slot in all individuals)
+        clusters:      leader clusters: individuals within CLUSTER_RADIUS
+                       (share of events) of a leader join its cluster
+
+    Pairwise distance and entropy come from per-event allele counts (pairs
+    that differ at an event = all pairs - pairs sharing a slot), so they cost
+    O(n * E) instead of O(n^2 * E). With NumPy the counting and the cluster
+    distances are vectorised (a few ms for 500 x 200); without it the same
+    numbers are computed in pure Python.
+"""
+
+# generations between diversity checks of adaptive mutation / diversity restarts
+DIVERSITY_INTERVAL = 100
+
+# an individual within this share of events of a cluster leader joins it
+CLUSTER_RADIUS = 0.1
+
+
+class PopulationEncoder:
+    """
+    Slot-index rows for schedules of one problem instance.
+    """
+
+    def __init__(self, problem):
+        self.events = list(problem.events_by_id.values())
+        slots = list(problem.lec_slots_by_key.values()) + list(problem.tut_slots_by_key.values())
+        self.slot_index = {slot.slot_key: i for i, slot in enumerate(slots)}
+        self.n_slots = len(slots)
+
+    def row(self, schedule):
+        get = schedule.assignments.get
+        return [
+            self.slot_index[slot.slot_key] if slot is not None else -1
+            for slot in (get(event) for event in self.events)
+        ]
+
+    def matrix(self, population):
+        """
+        n x E slot indices of (schedule, eval, fitness, prob) tuples
+        (a NumPy array, or a list of lists without NumPy).
+        """
+        rows = [self.row(individual[0]) for individual in population]
+        return np.array(rows, dtype=np.int32).reshape(len(rows), len(self.events)) if np is not None else rows
+
+
+def allele_counts(matrix, n_slots):
+    """
+    Per event: how many individuals put it in each slot.
+
+    Returns:
+        E x (n_slots + 1) count array with NumPy (last column = unassigned),
+        else a list of Counters
+    """
+    if np is not None:
+        n, n_events = matrix.shape
+        shifted = np.where(matrix < 0, n_slots, matrix) + np.arange(n_events)[None, :] * (n_slots + 1)
+        return np.bincount(shifted.ravel(), minlength=n_events * (n_slots + 1)).reshape(n_events, n_slots + 1)
+    return [Counter(column) for column in zip(*matrix)]
+
+
+def mean_pairwise_distance(counts, n):
+    """
+    Mean Hamming distance over all pairs of n individuals, as a share of the events.
+    """
+    if n < 2:
+        return 0.0
+    pairs = n * (n - 1) / 2
+    if np is not None:
+        n_events = counts.shape[0]
+        same = (counts * (counts - 1) / 2).sum()
+    else:
+        n_events = len(counts)
+        same = sum(c * (c - 1) / 2 for column in counts for c in column.values())
+    if n_events == 0:
+        return 0.0
+    return float((n_events * pairs - same) / (pairs * n_events))
+
+
+def allele_entropy(counts, n):
+    """
+    Allele entropy (bits) of every event, in problem event order.
+    """
+    if n == 0:
+        return []
+    if np is not None:
+        p = counts / n
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terms = np.where(p > 0, -p * np.log2(p), 0.0)
+        return terms.sum(axis=1).tolist()
+    return [-sum((c / n) * math.log2(c / n) for c in column.values()) for column in counts]
+
+
+def cluster_count(matrix, n_slots, radius=CLUSTER_RADIUS):
+    """
+    Number of leader clusters: each individual (best first) joins the first
+    leader it is within radius * E of, or becomes a leader itself.
+    """
+    if np is not None:
+        if matrix.shape[0] == 0:
+            return 0
+        limit = radius * matrix.shape[1]
+        leaders = np.empty_like(matrix)
+        leaders[0] = matrix[0]
+        k = 1
+        for row in matrix[1:]:
+            if not ((leaders[:k] != row).sum(axis=1) <= limit).any():
+                leaders[k] = row
+                k += 1
+        return k
+
+    if not matrix:
+        return 0
+    # one bit per (event, slot): the Hamming distance of two rows is half
+    # the popcount of their XOR
+    width = n_slots + 1
+    limit = 2 * radius * len(matrix[0])
+    leaders = []
+    for row in matrix:
+        bits = sum(1 << (e * width + slot % width) for e, slot in enumerate(row))
+        if not any((bits ^ leader).bit_count() <= limit for leader in leaders):
+            leaders.append(bits)
+    return len(leaders)
+
+
+def population_diversity(population, problem=None, encoder=None, radius=CLUSTER_RADIUS):
+    """
+    Diversity of a (schedule, eval, fitness, prob) population, best first.
+
+    Args:
+        population: the individuals
+        problem: their problem instance (or pass a PopulationEncoder)
+        encoder: PopulationEncoder to reuse across calls
+        radius: cluster radius as a share of the events
+
+    Returns:
+        {"mean_distance", "entropy", "clusters"}
+    """
+    encoder = encoder if encoder is not None else PopulationEncoder(problem)
+    matrix = encoder.matrix(population)
+    counts = allele_counts(matrix, encoder.n_slots)
+    entropy = allele_entropy(counts, len(population))
+    return {
+        "mean_distance": round(mean_pairwise_distance(counts, len(population)), 6),
+        "entropy": round(sum(entropy) / len(entropy), 6) if entropy else 0.0,
+        "clusters": cluster_count(matrix, encoder.n_slots, radius),
+    }
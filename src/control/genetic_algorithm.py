@@ -1,16 +1,25 @@
 import math
+import time
 import random
 from eval.eval import eval as soft_eval
 from eval.hard_constraints import (
     Valid, PassEvening, PassAL, PassLectures, PassTutorials, _check_5xx_lectures, _check_not_compatible
 )
-from eval.selection import fitness, probability, running_sum
+from eval.selection import fitness, fitness_from_scores, probability, running_sum, hard_from_fitness, LEXICOGRAPHIC
+from eval.lower_bound import soft_lower_bound
 from model.initial_state import generate_initial_state
 from model.extension_rules import (
     mutate_evening, mutate_AL, mutate_lecture, mutate_tutorial, mutate_500_conflict, mutate_notcompatible,
     crossover, purge
 )
 from control.repair import repair_schedule
+from control.lns import LargeNeighbourhoodSearch
+from control.checkpoint import save_checkpoint
+from control.incremental import apply_delta, update_population
+from control.hall_of_fame import HallOfFame
+from control.restart import epoch_budget, epoch_population_size, restart_population
+from control.diversity import population_diversity, PopulationEncoder, DIVERSITY_INTERVAL
+from control.profiler import NULL_PROFILER
 
 
 class GeneticAlgorithm:
@@ -21,20 +30,82 @@ class GeneticAlgorithm:
         max_valid_solutions=1,
         p_mutation=0.5,
         w_hard=3000,
-        w_soft=1
+        w_soft=1,
+        polish_interval=1000,
+        polish_iterations=20,
+        max_generations=None,
+        plateau_limit=None,
+        population_size=None,
+        time_limit=None,
+        solution_distance=1,
+        restart=None,
+        max_restarts=None,
+        adaptive_mutation=False,
+        min_diversity=None,
+        lexicographic=False
     ):  
         self.problem = problem_instance
         self.max_valid_solutions = max_valid_solutions
         self.p_mutation = p_mutation
         self.w_hard = w_hard
         self.w_soft = w_soft
+
+        # exact (hard, soft) integer keys instead of 1 / (1 + w_hard * hard + w_soft * soft)
+        if lexicographic:
+            self.w_hard = LEXICOGRAPHIC
+
+        # children rejected on their hard score alone (lazy soft evaluation)
+        self.skipped_soft_evals = 0
+
+        # elite polishing with LNS (0 disables it)
+        self.polish_interval = polish_interval
+        self.polish_iterations = polish_iterations
+        self.lns = LargeNeighbourhoodSearch(self.problem) if polish_interval > 0 else None
         
+        # no valid schedule can have a soft penalty below this -> reaching it is optimal
+        self.soft_bound = soft_lower_bound(self.problem)
+
         # scale bounding parameters based on problem size
         scaled_max_gen, scaled_plateau, scaled_population_size = self.scale_bounding_parameters()
         self.population_size = scaled_population_size
         self.max_generations = scaled_max_gen
         self.plateau_limit = scaled_plateau
 
+        # explicit bounds (sub-problems, benchmarks, ...) override the scaled ones
+        if population_size is not None:
+            self.population_size = population_size
+        if max_generations is not None:
+            self.max_generations = max_generations
+        if plateau_limit is not None:
+            self.plateau_limit = plateau_limit
+
+        # wall-clock budget for run() in seconds (None = no limit)
+        self.time_limit = time_limit
+
+        # restart policy on plateau (control.restart; None = terminate)
+        self.restart = restart
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        self.base_population_size = self.population_size
+
+        # population diversity (control.diversity), measured every
+        # DIVERSITY_INTERVAL generations when one of these is on:
+        #   adaptive_mutation: the mutation rate rises from p_mutation towards 1
+        #                      as the population loses its initial diversity
+        #   min_diversity: restart (with the restart policy) once the mean
+        #                  pairwise distance falls below this share of events
+        self.adaptive_mutation = adaptive_mutation
+        self.min_diversity = min_diversity
+        self.mutation_rate = p_mutation
+        self.diversity = None
+        self.initial_diversity = None
+        self.diversity_encoder = None
+
+        # the max_valid_solutions best valid schedules, pairwise at least
+        # solution_distance assignments apart
+        self.solution_distance = solution_distance
+        self.hall_of_fame = HallOfFame(self.problem, max_valid_solutions, solution_distance)
+
         # mutation mapping for fallback
         self.all_mutations = {
             "evening": mutate_evening,
@@ -51,11 +122,16 @@ class GeneticAlgorithm:
         self.plateau_counter = 0
         self.valid_found = 0
 
+        # how often each extension operator was applied
+        self.operator_stats = {name: 0 for name in ["crossover", *self.all_mutations]}
+
     # Tournament selection
     def tournament(self, population, k=25):
 
         # randomly pick k candidates from population
-        competitors = random.sample(population, k)
+        # (at most half of a small population, so two tournaments can still
+        # return different parents)
+        competitors = random.sample(population, min(k, max(1, len(population) // 2)))
 
         # sort them by fitness (3rd item in tuple)
         competitors.sort(key=lambda x: x[2], reverse=True)
@@ -66,30 +142,111 @@ class GeneticAlgorithm:
     # =====================================================================
     # Main GA
     # =====================================================================
-    def run(self, print_interval=50):
-        print("\n=== GENERATING INITIAL POPULATION ===")
-
-        # build initial population with weighted hard/soft evaluation
-        population = generate_initial_state(
-            self.problem,
-            self.population_size,
-            w_hard=self.w_hard,
-            w_soft=self.w_soft
-        )
+    def run(
+        self,
+        print_interval=50,
+        seed_schedules=None,
+        resume=None,
+        checkpoint_path=None,
+        checkpoint_interval=0,
+        on_improvement=None,
+        snapshot_interval=10.0,
+        telemetry=None,
+        profiler=None,
+        initial_population=None
+    ):
+        """
+        Args:
+            print_interval: generations between progress lines
+            seed_schedules: schedules that replace random initial individuals
+            resume: state from control.checkpoint.load_checkpoint to continue from
+            checkpoint_path: where to write checkpoints (None = never)
+            checkpoint_interval: generations between checkpoints (0 = never)
+            on_improvement: called as on_improvement(schedule, soft, hard, fitness, generation)
+                            when the best individual improved, at most once every
+                            snapshot_interval seconds (the latest best is always reported)
+            telemetry: control.telemetry.Telemetry sink (None = off)
+            profiler: control.profiler.PhaseProfiler timing each phase of the
+                      loop (None = off); its table is printed at the end
+            initial_population: already evaluated (schedule, eval, fitness, prob)
+                                tuples to start from (e.g. a re-ranked population
+                                of an earlier run); random individuals fill up
+                                the rest of the population
+
+        Returns:
+            (best_schedule, best_eval, best_hard, best_fitness)
+        """
+        prof = profiler if profiler is not None else NULL_PROFILER
+
+        if resume is not None:
+            population, best_fitness_before, start = self.restore(resume)
+            print(f"\n=== RESUMING FROM GENERATION {start} ===")
+        else:
+            print("\n=== GENERATING INITIAL POPULATION ===")
+
+            # a follow-up run starts again from the first epoch
+            self.mutation_rate = self.p_mutation
+            self.initial_diversity = None
+            if self.restarts:
+                self.restarts = 0
+                self.population_size = self.base_population_size
+
+            # build initial population with weighted hard/soft evaluation
+            t = prof.start()
+            population = list(initial_population or [])[:self.population_size]
+            if len(population) < self.population_size:
+                population += generate_initial_state(
+                    self.problem,
+                    self.population_size - len(population),
+                    w_hard=self.w_hard,
+                    w_soft=self.w_soft
+                )
+            prof.stop("initial population", t)
+
+            # seed schedules (e.g. from the exact solver) replace random individuals
+            for i, seed_schedule in enumerate((seed_schedules or [])[:len(population)]):
+                seed_eval = soft_eval(seed_schedule, self.problem)
+                population[-(i + 1)] = fitness((seed_schedule, seed_eval, 0, 0), self.problem, self.w_hard, self.w_soft)
+
+            # Convert evals to probs
+            population = self.with_probabilities(population)
+            best_fitness_before = None
+            start = 0
 
-        # Convert evals to probs
-        population = probability(running_sum(population))
-        best_fitness_before = None
+            # a follow-up run (e.g. after apply_delta) starts a fresh plateau
+            self.plateau_counter = 0
 
+            # valid individuals of the initial population enter the hall of fame
+            for schedule, eval_v, fit_v, _ in population:
+                self.offer_solution(schedule, eval_v, fit_v)
+
+        started = time.perf_counter()
+        last_report = None
+        reported_fitness = None
+
+        print(f"\n[GA] Soft lower bound: {self.soft_bound}")
         print("\n=== BEGIN GA EVOLUTION ===")
 
         # ==========================================================
         # Main loop
         # ==========================================================
-        for self.generation in range(self.max_generations):
+        for self.generation in range(start, self.max_generations):
+
+            # checkpoint at the top of a generation (state is complete here)
+            if (
+                checkpoint_path is not None
+                and checkpoint_interval > 0
+                and self.generation > start
+                and self.generation % checkpoint_interval == 0
+            ):
+                t = prof.start()
+                save_checkpoint(checkpoint_path, self, population, best_fitness_before)
+                prof.stop("checkpoint", t)
 
             # sort individuals by fitness
+            t = prof.start()
             population.sort(key=lambda x: x[2], reverse=True)
+            prof.stop("sort", t)
 
             # current best individual
             elite = population[0]
@@ -98,7 +255,26 @@ class GeneticAlgorithm:
             best_schedule, best_eval, best_fitness, _ = elite
 
             # hard penalty count
+            t = prof.start()
             best_valid = Valid(best_schedule, self.problem)
+            prof.stop("valid (elite)", t)
+
+            # polish a valid elite with LNS every polish_interval generations
+            if (
+                self.lns is not None
+                and best_valid == 0
+                and self.generation > 0
+                and self.generation % self.polish_interval == 0
+            ):
+                t = prof.start()
+                polished, polished_eval = self.lns.polish(best_schedule, best_eval, self.polish_iterations)
+                prof.stop("lns polish", t)
+                if polished_eval < best_eval:
+                    elite = fitness((polished, polished_eval, 0, 0), self.problem, self.w_hard, self.w_soft)
+                    population[0] = elite
+                    self.offer_solution(polished, polished_eval, elite[2])
+                    best_schedule, best_eval, best_fitness, _ = elite
+                    print(f"[gen {self.generation:4d}] LNS polished elite: soft={polished_eval}")
 
             # Periodically print progress
             if self.generation % print_interval == 0:
@@ -107,8 +283,27 @@ class GeneticAlgorithm:
                     f"fitness={best_fitness:.4f}  "
                     f"hard={best_valid}  "
                     f"soft={best_eval}"
+                    + (f"  gap={self.optimality_gap(best_eval):.1%}" if best_valid == 0 else "")
                 )
 
+            now = time.perf_counter()
+
+            # anytime snapshot of the best individual (throttled)
+            if (
+                on_improvement is not None
+                and (reported_fitness is None or best_fitness > reported_fitness)
+                and (last_report is None or now - last_report >= snapshot_interval)
+            ):
+                t = prof.start()
+                on_improvement(best_schedule, best_eval, best_valid, best_fitness, self.generation)
+                prof.stop("snapshot", t)
+                reported_fitness, last_report = best_fitness, now
+
+            if telemetry is not None and self.generation % telemetry.interval == 0:
+                t = prof.start()
+                telemetry.record(self, population, best_valid)
+                prof.stop("telemetry", t)
+
             # plateau logic
             if best_fitness_before is not None:
                 if best_fitness <= best_fitness_before:
@@ -123,42 +318,86 @@ class GeneticAlgorithm:
 
             best_fitness_before = best_fitness
 
-            # terminate if no improvement for plateau_limit generations
-            if self.plateau_counter >= self.plateau_limit:
-                print("\n[GA] Plateau reached — terminating.")
+            # converged population: adapt the mutation rate, restart below min_diversity
+            if (
+                (self.adaptive_mutation or self.min_diversity is not None)
+                and self.generation % DIVERSITY_INTERVAL == 0
+            ):
+                t = prof.start()
+                converged = self.measure_diversity(population)
+                prof.stop("diversity", t)
+                if converged and self.restart is not None and (
+                    self.max_restarts is None or self.restarts < self.max_restarts
+                ):
+                    print(f"[gen {self.generation:4d}] Diversity {self.diversity['mean_distance']:.3f} "
+                          f"below {self.min_diversity}")
+                    t = prof.start()
+                    population = self.restart_population(population)
+                    prof.stop("restart", t)
+                    continue
+
+            # no improvement for the epoch's plateau budget: restart or terminate
+            if self.plateau_counter >= epoch_budget(self.restart, self.restarts, self.plateau_limit):
+                if self.restart is None or (self.max_restarts is not None and self.restarts >= self.max_restarts):
+                    print("\n[GA] Plateau reached — terminating.")
+                    break
+                t = prof.start()
+                population = self.restart_population(population)
+                prof.stop("restart", t)
+                continue
+
+            # terminate when the wall-clock budget is used up
+            if self.time_limit is not None and now - started >= self.time_limit:
+                print(f"\n[GA] Time limit of {self.time_limit}s reached — terminating.")
                 break
 
             # terminate early if optimal is schedule found
-            if best_fitness == 1.0:
+            if best_fitness == fitness_from_scores(0, 0, self.w_hard, self.w_soft):
                 print(f"\n[GA] Optimal schedule found at generation {self.generation}")
                 break
 
+            # a valid schedule at the soft lower bound cannot be improved
+            if best_valid == 0 and best_eval <= self.soft_bound:
+                print(f"\n[GA] Soft lower bound reached — schedule is optimal (generation {self.generation})")
+                break
+
             # maintain population size
+            t = prof.start()
             if len(population) > self.population_size:
-                population = purge(population, len(population) - self.population_size)
+                population = purge(population, len(population) - self.population_size, key=lambda x: x[2])
+            prof.stop("purge", t)
 
             # recompute probs
-            population = probability(running_sum(population))
+            t = prof.start()
+            population = self.with_probabilities(population)
+            prof.stop("probability", t)
 
             # Extensions
-            if random.random() < self.p_mutation:
+            if random.random() < self.mutation_rate:
 
                 # select parent
+                t = prof.start()
                 parent = self.tournament(population)
+                prof.stop("selection", t)
 
                 # Decide which mutation to use
+                t = prof.start()
                 mut_type = self.choose_mutation_type(parent)
+                prof.stop("choose mutation", t)
 
                 # Debug
                 if self.generation % 500 == 0:
+                    t = prof.start()
                     print(f"[DEBUG] gen {self.generation}: mutating '{mut_type}' "
                         f"(Evening={PassEvening(parent, self.problem)}, "
                         f"AL={PassAL(parent, self.problem)}, "
                         f"Lect={PassLectures(parent, self.problem)}, "
                         f"Tut={PassTutorials(parent, self.problem)})")
+                    prof.stop("debug checks", t)
                     
                 # mutation function
                 mut_fn = self.all_mutations[mut_type]
+                self.operator_stats[mut_type] += 1
 
                 # all possible slot options
                 all_slots = (
@@ -171,10 +410,14 @@ class GeneticAlgorithm:
 
                 # attempt mutation up to 5 times
                 while child is None and attempts < 5:
+                    t = prof.start()
                     candidate = mut_fn(parent, all_slots)
+                    prof.stop("mutation", t)
                     if candidate is not None:
                         # Run repair immediately on mutated schedule
+                        t = prof.start()
                         child = repair_schedule(candidate, self.problem)
+                        prof.stop("repair", t)
                     attempts += 1
 
                 if child is None:
@@ -186,40 +429,69 @@ class GeneticAlgorithm:
                         if alt not in self.all_mutations:
                             continue
                         alt_fn = self.all_mutations[alt]
+                        t = prof.start()
                         candidate = alt_fn(parent, all_slots)
+                        prof.stop("mutation", t)
                         if candidate is not None:
+                            t = prof.start()
                             child = repair_schedule(candidate, self.problem)
+                            prof.stop("repair", t)
                             break
 
             else:
                 # crossover
+                t = prof.start()
                 p1 = self.tournament(population)
                 p2 = self.tournament(population)
-                while p2 == p1: # ensuring two unique parents are selected
+                # ensuring two unique parents are selected (bounded: a converged
+                # population can hold a single distinct schedule)
+                for _ in range(10):
+                    if p2 is not p1:
+                        break
                     p2 = self.tournament(population)
+                prof.stop("selection", t)
 
 
                 # build new schedule by combining parents
+                t = prof.start()
                 child = crossover(p1, p2)
+                prof.stop("crossover", t)
+                self.operator_stats["crossover"] += 1
 
                 # repair any structural issues
+                t = prof.start()
                 child = repair_schedule(child, self.problem)
+                prof.stop("repair", t)
+
+            # lazy evaluation: hard score first. Soft penalties are >= 0, so
+            # fitness(hard, 0) bounds the child's fitness; below the worst
+            # individual it would be purged next generation whatever its soft
+            # penalty, and the soft penalty is never computed
+            t = prof.start()
+            child_hard = Valid(child, self.problem)
+            prof.stop("valid", t)
+            if self.hard_dominated(child_hard, population):
+                self.skipped_soft_evals += 1
+                continue
 
             # evaluate child
+            t = prof.start()
             child_eval = soft_eval(child, self.problem)
-            schedule, eval_v, fit_v, _ = fitness(
-                (child, child_eval, 0, 0),
-                self.problem,
-                self.w_hard,
-                self.w_soft
-            )
+            prof.stop("soft eval", t)
+            schedule, eval_v = child, child_eval
+            fit_v = fitness_from_scores(child_hard, child_eval, self.w_hard, self.w_soft)
 
             population.append((schedule, eval_v, fit_v, 0))
+            t = prof.start()
+            self.offer_solution(schedule, eval_v, fit_v)
+            prof.stop("hall of fame", t)
 
             # ensure best survives
+            t = prof.start()
             population.sort(key=lambda x: x[2], reverse=True)
             if population[0] != elite:
                 population[-1] = elite
+            prof.stop("sort", t)
 
         # debug print, if max generation limit was reached
         else:
@@ -232,13 +504,161 @@ class GeneticAlgorithm:
         best_schedule, best_eval, best_fitness, _ = population[0]
         best_valid = Valid(best_schedule, self.problem)
 
+        # final population, best first (warm start for a follow-up run)
+        self.population = population
+
         print("\n=== GA FINISHED ===")
         print(f"Generations: {self.generation}")
+        print(f"Soft skipped : {self.skipped_soft_evals} children (hard score dominated)")
         print(f"Best fitness : {best_fitness:.4f}")
         print(f"Hard penalty : {best_valid}")
         print(f"Soft penalty : {best_eval}")
+        if best_valid == 0:
+            print(f"Lower bound  : {self.soft_bound}  (gap {self.optimality_gap(best_eval):.1%})")
+
+        if profiler is not None:
+            print("\n" + profiler.report())
 
         return best_schedule, best_eval, best_valid, best_fitness
+
+    # restore bounds, counters, stats and RNG from a checkpoint state
+    # returns (population, best_fitness_before, generation to continue at)
+    def restore(self, state):
+        bounds = state["bounds"]
+        self.max_generations = bounds["max_generations"]
+        self.plateau_limit = bounds["plateau_limit"]
+        self.population_size = bounds["population_size"]
+        self.p_mutation = bounds["p_mutation"]
+        self.w_hard = bounds["w_hard"]
+        self.w_soft = bounds["w_soft"]
+        self.polish_interval = bounds["polish_interval"]
+        self.polish_iterations = bounds["polish_iterations"]
+
+        if self.polish_interval <= 0:
+            self.lns = None
+        elif self.lns is None:
+            self.lns = LargeNeighbourhoodSearch(self.problem)
+        if self.lns is not None and state["lns_stats"] is not None:
+            self.lns.attempts = dict(state["lns_stats"]["attempts"])
+            self.lns.improvements = dict(state["lns_stats"]["improvements"])
+
+        counters = state["counters"]
+        self.generation = counters["generation"]
+        self.plateau_counter = counters["plateau_counter"]
+        self.valid_found = counters["valid_found"]
+        self.restarts = counters["restarts"]
+        self.restart = bounds["restart"]
+        self.max_restarts = bounds["max_restarts"]
+        self.adaptive_mutation = bounds["adaptive_mutation"]
+        self.min_diversity = bounds["min_diversity"]
+        self.mutation_rate = counters["mutation_rate"]
+        self.initial_diversity = counters["initial_diversity"]
+        self.base_population_size = bounds["base_population_size"]
+
+        self.max_valid_solutions = bounds["max_valid_solutions"]
+        self.solution_distance = bounds["solution_distance"]
+        self.hall_of_fame = HallOfFame(self.problem, self.max_valid_solutions, self.solution_distance)
+        self.hall_of_fame.restore(state["hall_of_fame"]["members"], state["hall_of_fame"]["order"])
+        self.operator_stats = dict(state["operator_stats"])
+
+        random.setstate(state["rng"])
+        return list(state["population"]), counters["best_fitness_before"], self.generation
+
+    # apply a control.incremental.InstanceDelta to the live problem and population
+    # continue with run(initial_population=self.population)
+    # returns the number of individuals that had to be re-scored
+    def apply_delta(self, delta):
+        applied = apply_delta(self.problem, delta)
+
+        # state derived from the instance
+        self.soft_bound = soft_lower_bound(self.problem)
+        if self.lns is not None:
+            self.lns = LargeNeighbourhoodSearch(self.problem)
+
+        self.hall_of_fame = HallOfFame(self.problem, self.max_valid_solutions, self.solution_distance)
+        self.diversity_encoder = None
+        self.population, rescored = update_population(
+            getattr(self, "population", []), self.problem, applied, self.w_hard, self.w_soft
+        )
+        print(
+            f"[GA] Instance delta: +{len(applied.added)} / -{len(applied.removed)} events, "
+            f"{rescored}/{len(self.population)} individuals re-scored"
+        )
+        return rescored
+
+    # new epoch after a plateau: the elite and the hall of fame survive
+    def restart_population(self, population):
+        self.restarts += 1
+        self.plateau_counter = 0
+        self.mutation_rate = self.p_mutation
+        self.initial_diversity = None
+        if self.restart == "luby":
+            self.population_size = epoch_population_size(self.restart, self.restarts, self.base_population_size)
+
+        keep = [
+            (schedule, soft, fitness_from_scores(0, soft, self.w_hard, self.w_soft), 0)
+            for schedule, soft in self.hall_of_fame.solutions()
+        ]
+        population = restart_population(
+            population, self.problem, self.restart, self.population_size, self.w_hard, self.w_soft, keep=keep,
+            fingerprint=self.hall_of_fame.fingerprint
+        )
+        for schedule, eval_v, fit_v, _ in population:
+            self.offer_solution(schedule, eval_v, fit_v)
+
+        print(
+            f"[gen {self.generation:4d}] Plateau — restart {self.restarts} ({self.restart}): "
+            f"population {self.population_size}, "
+            f"budget {epoch_budget(self.restart, self.restarts, self.plateau_limit)} generations"
+        )
+        return self.with_probabilities(population)
+
+    @property
+    def lexicographic(self):
+        return self.w_hard == LEXICOGRAPHIC
+
+    # True when a child with `child_hard` violations cannot beat the worst
+    # individual of a full population, whatever its soft penalty (>= 0)
+    def hard_dominated(self, child_hard, population):
+        return (
+            len(population) >= self.population_size
+            and fitness_from_scores(child_hard, 0, self.w_hard, self.w_soft) < min(x[2] for x in population)
+        )
+
+    # roulette probabilities (selection is by tournament; lexicographic keys
+    # are not proportional to anything, so their probabilities stay 0)
+    def with_probabilities(self, population):
+        if self.lexicographic:
+            return population
+        return probability(running_sum(population))
+
+    # measure population diversity and adapt the mutation rate to it
+    # returns True when the population is below min_diversity
+    def measure_diversity(self, population):
+        if self.diversity_encoder is None:
+            self.diversity_encoder = PopulationEncoder(self.problem)
+        self.diversity = population_diversity(population, encoder=self.diversity_encoder)
+        distance = self.diversity["mean_distance"]
+
+        if self.adaptive_mutation:
+            if not self.initial_diversity:
+                self.initial_diversity = distance
+            if self.initial_diversity:
+                lost = max(0.0, 1 - distance / self.initial_diversity)
+                self.mutation_rate = self.p_mutation + (1 - self.p_mutation) * lost
+
+        return self.min_diversity is not None and distance < self.min_diversity
+
+    # keep a valid individual in the hall of fame (fitness already holds its hard score)
+    def offer_solution(self, schedule, eval_value, fit_value):
+        if hard_from_fitness(fit_value, eval_value, self.w_hard, self.w_soft) == 0:
+            self.hall_of_fame.offer(schedule, eval_value)
+
+    # relative distance of a valid schedule's soft penalty from the lower bound
+    def optimality_gap(self, soft):
+        if soft <= self.soft_bound:
+            return 0.0
+        return (soft - self.soft_bound) / soft
     
     # Robust mutation selection 
     def choose_mutation_type(self, schedule):
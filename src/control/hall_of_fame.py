@@ -0,0 +1,136 @@
+import heapq
+
+
+"""
+    Hall of fame: the k best valid schedules of a run, pairwise at least
+    `min_distance` assignments apart (Hamming distance over events), so the
+    department gets k real alternatives instead of k copies of the best one.
+
+    A schedule's fingerprint is the tuple of its slot indices in problem
+    event order. Exact duplicates are rejected with one dict lookup, and the
+    worst member sits on top of a heap, so the common case (a valid child no
+    better than the current worst) is rejected in O(1) and admitting one
+    costs O(log k) heap work. Only schedules that would get in are compared
+    with the members for the distance rule.
+"""
+
+
+class HallOfFame:
+
+    def __init__(self, problem, size, min_distance=1):
+        self.size = max(0, size)
+        self.min_distance = max(1, min_distance)
+        self.events = list(problem.events_by_id.values())
+        self.slot_index = {
+            slot.slot_key: i
+            for i, slot in enumerate(list(problem.lec_slots_by_key.values()) + list(problem.tut_slots_by_key.values()))
+        }
+
+        # fingerprint -> (soft, order, schedule)
+        self.members = {}
+
+        # (-soft, -order, fingerprint): worst (latest on ties) on top;
+        # entries of removed members are skipped lazily
+        self.heap = []
+        self.order = 0
+
+    def __len__(self):
+        return len(self.members)
+
+    def fingerprint(self, schedule):
+        get = schedule.assignments.get
+        return tuple(
+            self.slot_index[slot.slot_key] if slot is not None else -1
+            for slot in (get(event) for event in self.events)
+        )
+
+    def worst(self):
+        """
+        Soft penalty of the worst member (None while empty).
+        """
+        while self.heap:
+            neg_soft, neg_order, fp = self.heap[0]
+            member = self.members.get(fp)
+            if member is not None and member[1] == -neg_order:
+                return -neg_soft
+            heapq.heappop(self.heap)
+        return None
+
+    def _close(self, a, b):
+        # Hamming distance below min_distance (stops counting early)
+        differences = 0
+        for x, y in zip(a, b):
+            if x != y:
+                differences += 1
+                if differences >= self.min_distance:
+                    return False
+        return True
+
+    def offer(self, schedule, soft):
+        """
+        Offer a valid schedule with soft penalty `soft`.
+
+        A schedule closer than min_distance to members gets in only if it is
+        better than all of them, and then replaces them.
+
+        Returns:
+            True if the schedule was admitted
+        """
+        if self.size == 0:
+            return False
+        full = len(self.members) >= self.size
+        if full and soft >= self.worst():
+            return False
+
+        fp = self.fingerprint(schedule)
+        if fp in self.members:
+            return False
+
+        close = []
+        if self.min_distance > 1:
+            close = [other for other in self.members if self._close(fp, other)]
+            if any(self.members[other][0] <= soft for other in close):
+                return False
+        for other in close:
+            del self.members[other]
+
+        if full and not close:
+            worst_fp = self.heap[0][2]
+            del self.members[worst_fp]
+            heapq.heappop(self.heap)
+
+        self.order += 1
+        self.members[fp] = (soft, self.order, schedule.copy())
+        heapq.heappush(self.heap, (-soft, -self.order, fp))
+
+        # drop stale entries once they outnumber the members
+        if len(self.heap) > 2 * self.size + 16:
+            self.heap = [(-s, -o, f) for f, (s, o, _) in self.members.items()]
+            heapq.heapify(self.heap)
+        return True
+
+    def entries(self):
+        """
+        Members as (schedule, soft, order) for checkpoints, in admission order.
+        """
+        return [(schedule, soft, order) for soft, order, schedule in sorted(self.members.values(), key=lambda m: m[1])]
+
+    def restore(self, entries, order):
+        """
+        Replace the members with checkpointed entries (see entries()) and
+        the admission counter with `order`.
+        """
+        self.members = {self.fingerprint(schedule): (soft, o, schedule) for schedule, soft, o in entries}
+        self.heap = [(-soft, -o, fp) for fp, (soft, o, _) in self.members.items()]
+        heapq.heapify(self.heap)
+        self.order = order
+
+    def solutions(self):
+        """
+        Members best first (ties: first found first).
+
+        Returns:
+            [(schedule, soft), ...]
+        """
+        ranked = sorted(self.members.values(), key=lambda m: (m[0], m[1]))
+        return [(schedule, soft) for soft, _, schedule in ranked]
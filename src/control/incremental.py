@@ -0,0 +1,263 @@
+import random
+
+from model.schedule import Schedule
+from model.domains import compute_domains
+from parser.event import Event
+from parser.slot import LectureSlot
+from parser.constraint import NotCompatible, Unwanted, Preference
+from parser.helpers import normalize_event_id
+from parser.constants import SPECIAL_COURSE_851, SPECIAL_COURSE_913
+from eval.eval import eval as soft_eval
+from eval.selection import fitness
+from control.warm_start import place_greedily
+
+
+"""
+    Incremental instance edits.
+
+    A long-running session can absorb small registrar edits without
+    re-parsing the input file or building a new GeneticAlgorithm:
+
+        1. apply_delta updates the ProblemInstance in place (the Event and
+           Slot objects the population points at stay the same objects)
+        2. update_population drops removed events from every schedule, adds
+           the new ones, and re-scores only the individuals whose hard or
+           soft score can actually have changed
+        3. the GA continues from the updated population
+
+    GeneticAlgorithm.apply_delta does all three steps for a live GA.
+"""
+
+
+class InstanceDelta:
+    """
+    A structured edit of a problem instance. Entries use the fields of the
+    matching input file section:
+
+        add_lectures / add_tutorials : [(event_id, al_required), ...]
+                                       (a first CPSC 351 / 413 lecture also adds
+                                       the CPSC 851 / 913 tutorial, as the parser does)
+        remove_events                : [event_id, ...]
+        slot_capacities              : {slot_key: (max, min, al_max), ...}
+        add_not_compatible           : [(event_a_id, event_b_id), ...]
+        add_unwanted                 : [(event_id, day, start_time), ...]
+        add_preferences              : [(day, start_time, event_id, value), ...]
+    """
+
+    def __init__(
+        self,
+        add_lectures=(),
+        add_tutorials=(),
+        remove_events=(),
+        slot_capacities=None,
+        add_not_compatible=(),
+        add_unwanted=(),
+        add_preferences=()
+    ):
+        self.add_lectures = list(add_lectures)
+        self.add_tutorials = list(add_tutorials)
+        self.remove_events = [normalize_event_id(e) for e in remove_events]
+        self.slot_capacities = dict(slot_capacities or {})
+        self.add_not_compatible = list(add_not_compatible)
+        self.add_unwanted = list(add_unwanted)
+        self.add_preferences = list(add_preferences)
+
+
+class AppliedDelta:
+    """
+    What apply_delta changed, in terms the population can be checked against.
+    """
+
+    def __init__(self):
+        self.removed = set()          # event ids no longer in the instance
+        self.added = []               # new event ids
+        self.slots = set()            # slot keys whose max / AL max changed
+        self.min_changed = False      # some slot minimum changed (eval of every schedule)
+        self.not_compatible = []      # new (event_a_id, event_b_id)
+        self.unwanted = []            # new (event_id, slot_key)
+        self.preferences = []         # new (event_id, slot_key)
+
+    def affects(self, schedule, problem):
+        """
+        True if the cached eval / fitness of `schedule` may be out of date.
+        """
+        if self.removed or self.added or self.min_changed:
+            return True
+
+        if self.slots and any(slot.slot_key in self.slots for slot in schedule.assignments.values()):
+            return True
+
+        for event_id, slot_key in self.unwanted:
+            slot = schedule.get_assignment(problem.get_event(event_id))
+            if slot is not None and slot.slot_key == slot_key:
+                return True
+
+        for event_id, slot_key in self.preferences:
+            slot = schedule.get_assignment(problem.get_event(event_id))
+            if slot is not None and slot.slot_key != slot_key:
+                return True
+
+        for event_a_id, event_b_id in self.not_compatible:
+            a = schedule.get_assignment(problem.get_event(event_a_id))
+            b = schedule.get_assignment(problem.get_event(event_b_id))
+            if a is not None and b is not None and (a.day, a.start_time) == (b.day, b.start_time):
+                return True
+
+        return False
+
+
+# function to resolve (day, start_time) of an event to its slot key
+def _slot_key(problem, event, day, start_time, what):
+    index = problem.lec_slot_index if event.is_lecture() else problem.tut_slot_index
+    slot_key = index.get((day, start_time))
+    if slot_key is None:
+        raise ValueError(f"Unknown slot ({day}, {start_time}) for event {event.id} in {what}")
+    return slot_key
+
+
+def _event(problem, event_id, what):
+    event = problem.events_by_id.get(normalize_event_id(event_id))
+    if event is None:
+        raise ValueError(f"Unknown event in {what}: {event_id}")
+    return event
+
+
+def apply_delta(problem, delta):
+    """
+    Apply `delta` to `problem` in place. Constraints that mention a removed
+    event are removed with it.
+
+    Returns:
+        AppliedDelta
+    """
+    applied = AppliedDelta()
+
+    # removed events (and everything that refers to them)
+    for event_id in delta.remove_events:
+        event = _event(problem, event_id, "remove_events")
+        by_id, lists = (
+            (problem.lec_by_id, problem.course_list) if event.is_lecture() else (problem.tut_by_id, problem.tut_list)
+        )
+        del by_id[event.id]
+        del problem.events_by_id[event.id]
+        course_key = event.get_course_key()
+        lists[course_key].remove(event.id)
+        if not lists[course_key]:
+            del lists[course_key]
+        applied.removed.add(event.id)
+
+    if applied.removed:
+        gone = applied.removed
+        problem.not_compatible = [c for c in problem.not_compatible if c.event_a_id not in gone and c.event_b_id not in gone]
+        problem.pairs = [c for c in problem.pairs if c.event_a_id not in gone and c.event_b_id not in gone]
+        problem.unwanted = [c for c in problem.unwanted if c.event_id not in gone]
+        problem.preferences = [c for c in problem.preferences if c.event_id not in gone]
+        problem.partial_assignments = [c for c in problem.partial_assignments if c.event_id not in gone]
+
+    # new events
+    for identifier, al_required, lecture in (
+        [(i, al, True) for i, al in delta.add_lectures] + [(i, al, False) for i, al in delta.add_tutorials]
+    ):
+        event = Event(identifier, al_required)
+        if event.is_lecture() != lecture:
+            raise ValueError(f"Expected {'lecture' if lecture else 'tutorial/lab'}: {identifier}")
+        if event.id in problem.events_by_id:
+            raise ValueError(f"Event already in the instance: {event.id}")
+        by_id, lists = (problem.lec_by_id, problem.course_list) if lecture else (problem.tut_by_id, problem.tut_list)
+        by_id[event.id] = event
+        problem.events_by_id[event.id] = event
+        lists.setdefault(event.get_course_key(), []).append(event.id)
+        applied.added.append(event.id)
+
+    # CPSC 351 / 413 lectures need their special tutorial (see parser.handle_special_courses;
+    # its conflicts with the related course are checked per course, not via not_compatible)
+    for special, course_no in ((SPECIAL_COURSE_851, 351), (SPECIAL_COURSE_913, 413)):
+        special_id = f"{special} TUT 01"
+        if special_id in problem.events_by_id or not problem.get_lectures_for_course("CPSC", course_no):
+            continue
+        event = Event(special_id, al_required=False)
+        event.is_special_tut = True
+        problem.tut_by_id[event.id] = event
+        problem.events_by_id[event.id] = event
+        problem.tut_list.setdefault(event.get_course_key(), []).append(event.id)
+        applied.added.append(event.id)
+
+    # slot capacities (changed on the slot objects, which schedules share)
+    for slot_key, (high, low, al_high) in delta.slot_capacities.items():
+        slot = problem.get_slot(slot_key)
+        if slot is None:
+            raise ValueError(f"Unknown slot in slot_capacities: {slot_key}")
+        if isinstance(slot, LectureSlot):
+            old = (slot.lecture_max, slot.lecture_min, slot.al_lecture_max)
+            slot.lecture_max, slot.lecture_min, slot.al_lecture_max = high, low, al_high
+        else:
+            old = (slot.tutorial_max, slot.tutorial_min, slot.al_tutorial_max)
+            slot.tutorial_max, slot.tutorial_min, slot.al_tutorial_max = high, low, al_high
+        if (old[0], old[2]) != (high, al_high):
+            applied.slots.add(slot.slot_key)
+        if old[1] != low:
+            applied.min_changed = True
+
+    # new constraints
+    for event_a_id, event_b_id in delta.add_not_compatible:
+        a = _event(problem, event_a_id, "not compatible")
+        b = _event(problem, event_b_id, "not compatible")
+        problem.not_compatible.append(NotCompatible(a.id, b.id))
+        applied.not_compatible.append((a.id, b.id))
+
+    for event_id, day, start_time in delta.add_unwanted:
+        event = _event(problem, event_id, "unwanted")
+        slot_key = _slot_key(problem, event, day, start_time, "unwanted")
+        problem.unwanted.append(Unwanted(event.id, slot_key))
+        applied.unwanted.append((event.id, slot_key))
+
+    for day, start_time, event_id, value in delta.add_preferences:
+        event = _event(problem, event_id, "preferences")
+        slot_key = _slot_key(problem, event, day, start_time, "preferences")
+        problem.preferences.append(Preference(event.id, slot_key, int(value)))
+        applied.preferences.append((event.id, slot_key))
+
+    return applied
+
+
+def update_population(population, problem, applied, w_hard, w_soft, domains=None):
+    """
+    Bring a scored population up to date after apply_delta.
+
+    Removed events are dropped from every schedule. New events are placed
+    greedily in the best individual and at a random slot of their domain in
+    the others. Only individuals that applied.affects are re-scored.
+
+    Returns:
+        (population, rescored) - new (schedule, eval, fitness, prob) list,
+        best first, and how many individuals were re-evaluated
+    """
+    domains = domains if domains is not None else compute_domains(problem)
+    population = sorted(population, key=lambda x: x[2], reverse=True)
+
+    updated = []
+    rescored = 0
+    for rank, (schedule, eval_value, fit_value, prob) in enumerate(population):
+        if applied.removed or applied.added:
+            schedule = Schedule({
+                event: slot for event, slot in schedule.assignments.items() if event.id not in applied.removed
+            })
+            if rank == 0:
+                place_greedily(schedule, problem, applied.added, domains)
+            else:
+                for event_id in applied.added:
+                    event = problem.get_event(event_id)
+                    options = domains.get(event_id) or list(
+                        (problem.lec_slots_by_key if event.is_lecture() else problem.tut_slots_by_key).values()
+                    )
+                    schedule.assign(event, random.choice(options))
+
+        if applied.affects(schedule, problem):
+            schedule, eval_value, fit_value, prob = fitness(
+                (schedule, soft_eval(schedule, problem), 0, 0), problem, w_hard, w_soft
+            )
+            rescored += 1
+        updated.append((schedule, eval_value, fit_value, prob))
+
+    updated.sort(key=lambda x: x[2], reverse=True)
+    return updated, rescored
@@ -0,0 +1,135 @@
+import random
+
+from eval.eval import eval as soft_eval
+from eval.hard_constraints import Valid
+from model.domains import compute_domains
+from model.constraint_graph import build_constraint_graph
+from control.branch_and_bound import BranchAndBound
+
+
+class LargeNeighbourhoodSearch:
+    """
+    Large-neighbourhood search for polishing VALID schedules.
+
+    One LNS step:
+        1. destroy: pick a neighbourhood of correlated events
+              - "course"  : all lectures + tutorials of one course
+              - "slot"    : everything currently sitting in one slot
+              - "cluster" : a connected chunk of the constraint graph
+        2. repair: re-place those events exactly with BranchAndBound, keeping
+           everything else fixed
+        3. accept only if the result is still valid and strictly cheaper
+
+    The GA uses this as an elite-polishing stage once hard = 0, because the
+    moves that still lower the soft penalty usually involve several events
+    at once (all sections of a course, both halves of a pair, ...), which
+    single-event mutations almost never hit.
+    """
+
+    NEIGHBOURHOODS = ("course", "slot", "cluster")
+
+    def __init__(self, problem, max_free=6, node_limit=20000):
+        self.problem = problem
+        self.max_free = max_free
+        self.domains = compute_domains(problem)
+        self.graph = build_constraint_graph(problem)
+        self.solver = BranchAndBound(problem, self.domains, node_limit=node_limit)
+
+        # stats (how often each neighbourhood found an improvement)
+        self.attempts = {name: 0 for name in self.NEIGHBOURHOODS}
+        self.improvements = {name: 0 for name in self.NEIGHBOURHOODS}
+
+    # ------------------------------------------------------------------
+    # destroy operators, each returns a list of event_ids to free
+    # ------------------------------------------------------------------
+    def _movable(self, event_ids):
+        # events with a single-slot domain (partials, specials) can't move anyway
+        return [eid for eid in event_ids if len(self.domains.get(eid, ())) > 1]
+
+    def _cap(self, event_ids):
+        if len(event_ids) > self.max_free:
+            return random.sample(event_ids, self.max_free)
+        return event_ids
+
+    def destroy_course(self, schedule):
+        courses = sorted(set(self.problem.course_list) | set(self.problem.tut_list))
+        if not courses:
+            return []
+        course_key = random.choice(courses)
+        ids = self.problem.course_list.get(course_key, []) + self.problem.tut_list.get(course_key, [])
+        return self._cap(self._movable(ids))
+
+    def destroy_slot(self, schedule):
+        by_slot = {}
+        for event, slot in schedule.assignments.items():
+            by_slot.setdefault(slot.slot_key, []).append(event.id)
+        if not by_slot:
+            return []
+        ids = by_slot[random.choice(list(by_slot))]
+        return self._cap(self._movable(ids))
+
+    def destroy_cluster(self, schedule):
+        movable = self._movable(list(self.graph))
+        if not movable:
+            return []
+
+        # breadth-first walk from a random event
+        start = random.choice(movable)
+        seen = {start}
+        frontier = [start]
+        cluster = []
+        while frontier and len(cluster) < self.max_free:
+            event_id = frontier.pop(0)
+            if len(self.domains.get(event_id, ())) > 1:
+                cluster.append(event_id)
+            neighbours = sorted(self.graph[event_id] - seen)
+            random.shuffle(neighbours)
+            for other in neighbours:
+                seen.add(other)
+                frontier.append(other)
+        return cluster
+
+    # ------------------------------------------------------------------
+    # main entry point
+    # ------------------------------------------------------------------
+    def polish(self, schedule, soft=None, iterations=20):
+        """
+        Run `iterations` destroy/repair steps starting from a valid schedule.
+
+        Args:
+            schedule: Schedule with hard = 0 (left untouched)
+            soft: its soft penalty (computed if not given)
+            iterations: number of neighbourhoods to try
+
+        Returns:
+            (Schedule, soft) - the best schedule reached (the input itself if
+            nothing improved)
+        """
+        if soft is None:
+            soft = soft_eval(schedule, self.problem)
+
+        best, best_soft = schedule, soft
+
+        for _ in range(iterations):
+            if best_soft == 0:
+                break
+
+            name = random.choice(self.NEIGHBOURHOODS)
+            free = getattr(self, f"destroy_{name}")(best)
+            if not free:
+                continue
+
+            self.attempts[name] += 1
+            candidate, cand_soft, _ = self.solver.solve(best, free, upper_bound=best_soft)
+            if candidate is None:
+                continue
+
+            # double check with the real evaluators before accepting
+            if Valid(candidate, self.problem) != 0:
+                continue
+            cand_soft = soft_eval(candidate, self.problem)
+            if cand_soft < best_soft:
+                best, best_soft = candidate, cand_soft
+                self.improvements[name] += 1
+
+        return best, best_soft
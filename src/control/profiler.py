@@ -0,0 +1,61 @@
+from time import perf_counter_ns
+
+
+class PhaseProfiler:
+    """
+    Accumulates wall time and call counts per phase of the GA loop.
+
+    Usage:
+        t = profiler.start()
+        ... phase ...
+        profiler.stop("repair", t)
+
+    Overhead is two perf_counter_ns calls and a dict update per phase.
+    """
+
+    def __init__(self):
+        self.total_ns = {}
+        self.calls = {}
+        self.started_ns = perf_counter_ns()
+
+    @staticmethod
+    def start():
+        return perf_counter_ns()
+
+    def stop(self, phase, start_ns):
+        self.total_ns[phase] = self.total_ns.get(phase, 0) + perf_counter_ns() - start_ns
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    def report(self):
+        """Breakdown table, slowest phase first."""
+        wall_ns = max(1, perf_counter_ns() - self.started_ns)
+        measured_ns = sum(self.total_ns.values())
+
+        lines = [
+            "=== GA PHASE PROFILE ===",
+            f"{'phase':<18}{'calls':>10}{'total s':>11}{'mean us':>11}{'% wall':>9}",
+        ]
+        for phase, total in sorted(self.total_ns.items(), key=lambda kv: kv[1], reverse=True):
+            calls = self.calls[phase]
+            lines.append(
+                f"{phase:<18}{calls:>10}{total / 1e9:>11.3f}{total / calls / 1e3:>11.1f}{100 * total / wall_ns:>8.1f}%"
+            )
+        lines.append(
+            f"{'(unmeasured)':<18}{'':>10}{(wall_ns - measured_ns) / 1e9:>11.3f}{'':>11}"
+            f"{100 * (wall_ns - measured_ns) / wall_ns:>8.1f}%"
+        )
+        return "\n".join(lines)
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off: every hook is a no-op."""
+
+    @staticmethod
+    def start():
+        return 0
+
+    def stop(self, phase, start_ns):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
@@ -0,0 +1,114 @@
+import random
+
+from model.domains import compute_domains
+from model.initial_state import generate_initial_state
+from eval.eval import eval as soft_eval
+from eval.selection import fitness
+from control.warm_start import perturb
+from control.hall_of_fame import HallOfFame
+
+
+"""
+    Restart policies for GeneticAlgorithm.run.
+
+    Without a policy the GA stops once the best fitness has not improved for
+    plateau_limit generations. With one, a plateau starts a new "epoch"
+    instead, and the run only ends on its generation / time budget (or after
+    max_restarts restarts), so one invocation with a time limit keeps
+    searching where manual reruns would start from scratch:
+
+        reseed:      keep the elite (and the hall of fame), rebuild the rest
+                     with the constructive initialiser
+        hypermutate: keep the elite, move many random events of every other
+                     individual to another slot of their domain
+        luby:        reseed, and scale the population size and the epoch's
+                     plateau budget by the Luby sequence (1 1 2 1 1 2 4 ...)
+
+    Each epoch's budget is the number of generations without improvement
+    it may spend before the next restart: plateau_limit (times luby(epoch)
+    for the luby policy). The best individual survives every restart.
+"""
+
+RESTART_POLICIES = ("reseed", "hypermutate", "luby")
+
+# share of the population kept as elite through a restart
+ELITE_SHARE = 0.1
+
+# hypermutation moves this share of the events of each individual
+HYPERMUTATION_SHARE = 0.2
+
+
+def luby(i):
+    """
+    i-th term (1-based) of the Luby sequence: 1 1 2 1 1 2 4 1 1 2 1 1 2 4 8 ...
+    """
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    if i == (1 << k) - 1:
+        return 1 << (k - 1)
+    return luby(i - (1 << (k - 1)) + 1)
+
+
+def epoch_budget(policy, epoch, plateau_limit):
+    """
+    Generations without improvement allowed in epoch `epoch` (0 = the first run).
+    """
+    if policy == "luby":
+        return plateau_limit * luby(epoch + 1)
+    return plateau_limit
+
+
+def epoch_population_size(policy, epoch, base_size):
+    if policy == "luby":
+        return base_size * luby(epoch + 1)
+    return base_size
+
+
+def restart_population(population, problem, policy, size, w_hard, w_soft, keep=(), domains=None, fingerprint=None):
+    """
+    Population for a new epoch.
+
+    Args:
+        population: current (schedule, eval, fitness, prob) tuples
+        policy: one of RESTART_POLICIES
+        size: population size of the new epoch
+        keep: extra evaluated individuals to keep (e.g. the hall of fame)
+        domains: model.domains.compute_domains(problem), for hypermutate
+        fingerprint: schedule -> assignment key (HallOfFame.fingerprint); kept
+                     schedules equal to an elite one (e.g. the hall of
+                     fame's copies of it) are dropped
+
+    Returns:
+        [(schedule, eval, fitness, prob), ...] of `size` individuals, best first
+    """
+    if policy not in RESTART_POLICIES:
+        raise ValueError(f"Unknown restart policy: {policy} (expected one of {', '.join(RESTART_POLICIES)})")
+
+    ranked = sorted(population, key=lambda x: x[2], reverse=True)
+    n_elite = max(1, int(ELITE_SHARE * size))
+    survivors = ranked[:n_elite]
+    fingerprint = fingerprint or HallOfFame(problem, 0).fingerprint
+    seen = {fingerprint(individual[0]) for individual in survivors}
+    for individual in keep:
+        if len(survivors) >= size:
+            break
+        key = fingerprint(individual[0])
+        if key not in seen:
+            survivors.append(individual)
+            seen.add(key)
+    survivors = survivors[:size]
+
+    if policy == "hypermutate":
+        domains = domains if domains is not None else compute_domains(problem)
+        moves = max(2, int(HYPERMUTATION_SHARE * len(problem.events_by_id)))
+        others = ranked[n_elite:] or ranked
+        fresh = []
+        for i in range(size - len(survivors)):
+            mutated = perturb(others[i % len(others)][0], domains, random.randint(1, moves))
+            fresh.append(fitness((mutated, soft_eval(mutated, problem), 0, 0), problem, w_hard, w_soft))
+    else:
+        fresh = generate_initial_state(problem, size - len(survivors), w_hard=w_hard, w_soft=w_soft) \
+            if len(survivors) < size else []
+
+    return sorted(survivors + list(fresh), key=lambda x: x[2], reverse=True)
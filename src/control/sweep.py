@@ -0,0 +1,171 @@
+import io
+import os
+import copy
+import random
+import multiprocessing
+from contextlib import redirect_stdout
+
+from model.encoding import ScheduleCodec
+from eval.eval import eval_components, weighted_eval
+from eval.selection import fitness_from_scores, hard_from_fitness, probability, running_sum
+
+
+"""
+    Weight / penalty sweeps.
+
+    The soft penalty of a schedule is a weighted sum of five unweighted
+    components (eval.eval.eval_components), and the hard penalty does not
+    depend on the weights at all. So once a population has been evaluated,
+    it can be re-ranked for any other weight vector in O(population) without
+    touching the schedules again.
+
+    The instance is parsed once; every sweep point gets a shallow copy of it
+    with its own weights. Points run in waves of `workers` processes, and
+    each wave starts from the previous wave's final populations, re-ranked
+    for its own weights (warm start). With workers=1 every point continues
+    from the one before it.
+"""
+
+# order of the weights / penalties on the command line (and in sweep files)
+WEIGHT_NAMES = (
+    "w_minfilled", "w_pref", "w_pair", "w_secdiff",
+    "pen_lecturemin", "pen_tutorialmin", "pen_notpaired", "pen_section",
+)
+
+
+def parse_sweep_file(path):
+    """
+    Read sweep points: one line of 8 integers per point (in WEIGHT_NAMES
+    order, separated by spaces or commas); blank lines and '#' comments
+    are skipped.
+
+    Returns:
+        list of 8-tuples of ints
+    """
+    points = []
+    with open(path) as f:
+        for number, line in enumerate(f, start=1):
+            line = line.split("#", 1)[0].replace(",", " ").strip()
+            if not line:
+                continue
+            values = line.split()
+            if len(values) != len(WEIGHT_NAMES):
+                raise ValueError(
+                    f"{path}:{number}: expected {len(WEIGHT_NAMES)} values "
+                    f"({' '.join(WEIGHT_NAMES)}), got {len(values)}"
+                )
+            points.append(tuple(int(v) for v in values))
+    return points
+
+
+def problem_with_weights(problem, weights):
+    """
+    Shallow copy of `problem` (events, slots and constraints are shared)
+    with the given weights / penalties (WEIGHT_NAMES order).
+    """
+    w_minfilled, w_pref, w_pair, w_secdiff, pen_lecturemin, pen_tutorialmin, pen_notpaired, pen_section = weights
+    point = copy.copy(problem)
+    point.set_penalties(pen_lecturemin, pen_tutorialmin, pen_notpaired, pen_section)
+    point.set_weights(w_minfilled, w_pref, w_pair, w_secdiff)
+    return point
+
+
+def rerank(scored, problem, w_hard, w_soft):
+    """
+    Population for `problem`'s weights from already scored individuals.
+
+    Args:
+        scored: [(schedule, components, hard), ...] with unweighted
+                eval_components and the hard penalty (Valid)
+        problem: ProblemInstance carrying the weights to rank for
+        w_hard, w_soft: GA fitness weights
+
+    Returns:
+        [(schedule, eval, fitness, probability), ...] best first
+    """
+    population = []
+    for schedule, components, hard in scored:
+        soft = weighted_eval(components, problem)
+        population.append((schedule, soft, fitness_from_scores(hard, soft, w_hard, w_soft), 0))
+    population.sort(key=lambda x: x[2], reverse=True)
+    return probability(running_sum(population))
+
+
+def _run_point(payload):
+    """
+    Worker: run the GA for one sweep point, warm-started from the encoded
+    pool; returns plain data (encoded schedules) so it pickles cheaply.
+    """
+    from control.genetic_algorithm import GeneticAlgorithm
+
+    index, problem, weights, pool, ga_params, seed = payload
+    if seed is not None:
+        random.seed(seed + index)
+
+    point = problem_with_weights(problem, weights)
+    codec = ScheduleCodec(point)
+
+    with redirect_stdout(io.StringIO()):
+        ga = GeneticAlgorithm(point, **ga_params)
+        scored = [(codec.decode(data), components, hard) for data, components, hard in pool]
+        population = rerank(scored, point, ga.w_hard, ga.w_soft)[:ga.population_size]
+        schedule, soft, hard, best_fitness = ga.run(print_interval=ga.max_generations + 1, initial_population=population)
+
+    # unweighted scores of the final population, for the next wave
+    final = [
+        (codec.encode(s), eval_components(s, point), hard_from_fitness(fit, ev, ga.w_hard, ga.w_soft))
+        for s, ev, fit, _ in ga.population
+    ]
+    return index, codec.encode(schedule), soft, hard, best_fitness, eval_components(schedule, point), ga.generation, final
+
+
+def run_sweep(problem, weight_vectors, workers=1, ga_params=None, seed=None):
+    """
+    Solve `problem` once per weight vector.
+
+    Args:
+        problem: ProblemInstance (parsed once, shared by every point)
+        weight_vectors: list of 8-tuples in WEIGHT_NAMES order
+        workers: points solved in parallel per wave (None = cpu count, 1 = inline chain)
+        ga_params: extra GeneticAlgorithm kwargs for every point
+        seed: base random seed (point i uses seed + i)
+
+    Returns:
+        list (one per point, in input order) of dicts with keys
+        weights, schedule, soft, hard, fitness, components, generations
+    """
+    workers = workers or os.cpu_count() or 1
+    codec = ScheduleCodec(problem)
+    pool = []
+    results = []
+
+    for start in range(0, len(weight_vectors), workers):
+        wave = [
+            (index, problem, tuple(weight_vectors[index]), pool, dict(ga_params or {}), seed)
+            for index in range(start, min(start + workers, len(weight_vectors)))
+        ]
+        if len(wave) == 1:
+            outcomes = [_run_point(wave[0])]
+        else:
+            with multiprocessing.Pool(processes=len(wave)) as workers_pool:
+                outcomes = workers_pool.map(_run_point, wave)
+
+        # the next wave starts from the union of this wave's final populations
+        pool = []
+        seen = set()
+        for index, best, soft, hard, best_fitness, components, generations, final in sorted(outcomes, key=lambda r: r[0]):
+            results.append({
+                "weights": weight_vectors[index],
+                "schedule": codec.decode(best),
+                "soft": soft,
+                "hard": hard,
+                "fitness": best_fitness,
+                "components": components,
+                "generations": generations,
+            })
+            for data, components, hard in final:
+                if data not in seen:
+                    seen.add(data)
+                    pool.append((data, components, hard))
+
+    return results
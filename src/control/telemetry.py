@@ -0,0 +1,109 @@
+import json
+import time
+
+from eval.hard_constraints import hard_violation_counts
+from eval.selection import hard_from_fitness
+from control.diversity import population_diversity, PopulationEncoder
+
+
+class Telemetry:
+    """
+    JSONL telemetry sink for GeneticAlgorithm.run.
+
+    Every `interval` generations one JSON object is written per line:
+        generation, elapsed seconds, generations per second since the last line,
+        best / mean hard and soft, share of valid individuals,
+        per-constraint hard violations of the best individual,
+        diversity (share of events placed differently from the best, averaged
+        over the population), number of distinct schedules, mean pairwise
+        distance, allele entropy and cluster count (control.diversity),
+        the current mutation rate,
+        operator mix since the last line, LNS attempts / improvements
+
+    Lines go through a large write buffer and reach the disk on flush/close.
+    When no sink is passed to run() the GA does not touch any of this.
+    """
+
+    def __init__(self, path, interval=100, buffer_size=1 << 16):
+        self.path = path
+        self.interval = max(1, interval)
+        self.file = open(path, "w", buffering=buffer_size)
+        self.started = time.perf_counter()
+        self.last_time = self.started
+        self.last_generation = None
+        self.last_operators = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record(self, ga, population, best_hard):
+        """
+        Write one line for the current generation of `ga`.
+
+        Args:
+            ga: GeneticAlgorithm (generation, weights, operator_stats, lns)
+            population: list of (schedule, eval, fitness, prob), best first
+            best_hard: Valid() of population[0]
+        """
+        now = time.perf_counter()
+        best_schedule, best_eval, best_fitness, _ = population[0]
+
+        hards = [hard_from_fitness(fit, soft, ga.w_hard, ga.w_soft) for _, soft, fit, _ in population]
+        softs = [soft for _, soft, _, _ in population]
+
+        gens = ga.generation - (self.last_generation if self.last_generation is not None else ga.generation)
+        operators = {
+            name: count - self.last_operators.get(name, 0) for name, count in ga.operator_stats.items()
+        }
+
+        # one encoder per problem, shared with GeneticAlgorithm.measure_diversity
+        if ga.diversity_encoder is None:
+            ga.diversity_encoder = PopulationEncoder(ga.problem)
+
+        line = {
+            "generation": ga.generation,
+            "elapsed": round(now - self.started, 3),
+            "gens_per_sec": round(gens / (now - self.last_time), 1) if gens > 0 else None,
+            "best": {"hard": best_hard, "soft": best_eval, "fitness": best_fitness},
+            "mean": {"hard": sum(hards) / len(hards), "soft": sum(softs) / len(softs)},
+            "valid_share": sum(1 for h in hards if h == 0) / len(hards),
+            "violations": hard_violation_counts(best_schedule, ga.problem),
+            "diversity": _diversity(population),
+            "distinct": len({id(individual[0]) for individual in population}),
+            "population": population_diversity(population, encoder=ga.diversity_encoder),
+            "mutation_rate": round(ga.mutation_rate, 4),
+            "operators": operators,
+            "lns": (
+                {"attempts": sum(ga.lns.attempts.values()), "improvements": sum(ga.lns.improvements.values())}
+                if ga.lns is not None else None
+            ),
+        }
+        self.file.write(json.dumps(line) + "\n")
+
+        self.last_time = now
+        self.last_generation = ga.generation
+        self.last_operators = dict(ga.operator_stats)
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+# function to measure how far the population is from its best individual
+# (average share of events assigned to a different slot than in the best)
+def _diversity(population):
+    best = population[0][0].assignments
+    if not best or len(population) < 2:
+        return 0.0
+
+    total = 0
+    for schedule, _, _, _ in population[1:]:
+        assignments = schedule.assignments
+        total += sum(1 for event, slot in best.items() if assignments.get(event) is not slot)
+    return total / (len(best) * (len(population) - 1))
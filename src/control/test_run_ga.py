@@ -41,7 +41,7 @@ def test_ga():
     print(problem.tut_list.keys())
 
     ga = GeneticAlgorithm(problem)
-    best_schedule, best_soft, best_hard = ga.run(print_interval=200)
+    best_schedule, best_soft, best_hard, _ = ga.run(print_interval=200)
 
     from eval.hard_constraints import debug_all_hard_constraints
     debug_all_hard_constraints(best_schedule, problem)
@@ -0,0 +1,145 @@
+import random
+
+from model.schedule import Schedule
+from model.domains import compute_domains
+from parser.helpers import normalize_event_id
+from eval.eval import eval as soft_eval
+from eval.hard_constraints import Valid
+from eval.selection import fitness
+
+
+"""
+    Warm start from a previous output file.
+
+    When an instance changes a little (a course added or dropped, a new
+    unwanted slot, ...), last run's timetable in output/<name>_output.txt is
+    still almost right. It is read back and mapped onto the new instance:
+
+        - events that no longer exist are dropped
+        - events whose old slot is gone or now unwanted are placed again,
+          as are events the old file did not list
+        - partial assignments of the new instance always win
+
+    Events to (re)place are put greedily, most constrained first, into the
+    slot of their domain that adds the fewest hard violations and then the
+    lowest soft penalty. The GA then starts from that schedule and small
+    random perturbations of it instead of a random population.
+"""
+
+# moves applied to each perturbed copy are drawn from 1..PERTURB_MOVES
+PERTURB_MOVES = 3
+
+# a warm-started run is only polishing a near-solution, so it gives up sooner
+WARM_START_PLATEAU = 5000
+
+
+def read_output_assignments(path):
+    """
+    Read the schedule section of an output file written by ga_main
+    (lines like "CPSC 231 LEC 01 TUT 01 : MO, 8:00").
+
+    Returns:
+        dict: event_id -> (day, start_time)
+    """
+    assignments = {}
+    with open(path) as f:
+        for line in f:
+            if " : " not in line:
+                continue
+            left, right = line.split(" : ", 1)
+            parts = [p.strip() for p in right.split(",")]
+            if len(parts) != 2 or len(left.split()) < 4:
+                continue
+            assignments[normalize_event_id(left)] = (parts[0], parts[1])
+    return assignments
+
+
+def place_greedily(schedule, problem, event_ids, domains):
+    """
+    Assign every event of `event_ids` into `schedule` (in place), most
+    constrained first, choosing the slot with the lowest (hard, soft).
+    """
+    for event_id in sorted(event_ids, key=lambda e: (len(domains.get(e, ())), e)):
+        event = problem.get_event(event_id)
+        candidates = domains.get(event_id) or (
+            list(problem.lec_slots_by_key.values()) if event.is_lecture() else list(problem.tut_slots_by_key.values())
+        )
+
+        best_slot, best_cost = None, None
+        for slot in candidates:
+            schedule.assign(event, slot)
+            cost = (Valid(schedule, problem), soft_eval(schedule, problem))
+            if best_cost is None or cost < best_cost:
+                best_slot, best_cost = slot, cost
+        schedule.assign(event, best_slot)
+    return schedule
+
+
+def load_output_schedule(path, problem, domains=None):
+    """
+    Map the schedule of a previous output file onto `problem`.
+
+    Returns:
+        (schedule, stats) where stats counts the events that were
+        kept / dropped / placed (placed = new, or old slot gone / unwanted)
+    """
+    domains = domains if domains is not None else compute_domains(problem)
+    previous = read_output_assignments(path)
+
+    schedule = Schedule()
+    stats = {"kept": 0, "dropped": 0, "placed": 0}
+    pending = []
+
+    unwanted = {(uw.event_id, uw.slot_key) for uw in problem.unwanted}
+    partial = {pa.event_id: pa.slot_key for pa in problem.partial_assignments}
+    for event_id, event in problem.events_by_id.items():
+        if event_id in partial:
+            schedule.assign(event, problem.get_slot(partial[event_id]))
+            continue
+
+        old = previous.get(event_id)
+        if old is not None:
+            index = problem.lec_slot_index if event.is_lecture() else problem.tut_slot_index
+            slot_key = index.get(old)
+            slot = problem.get_slot(slot_key) if slot_key is not None else None
+            if slot is not None and (event_id, slot_key) not in unwanted:
+                schedule.assign(event, slot)
+                stats["kept"] += 1
+                continue
+        pending.append(event_id)
+
+    stats["dropped"] = sum(1 for event_id in previous if event_id not in problem.events_by_id)
+    stats["placed"] = len(pending)
+
+    place_greedily(schedule, problem, pending, domains)
+    return schedule, stats
+
+
+def perturb(schedule, domains, moves):
+    """
+    Copy of `schedule` with `moves` random events moved to another slot of
+    their domain (events with a single-slot domain never move).
+    """
+    perturbed = schedule.copy()
+    movable = [event for event in perturbed.assignments if len(domains.get(event.id, ())) > 1]
+    for event in random.sample(movable, min(moves, len(movable))):
+        current = perturbed.get_assignment(event)
+        perturbed.assign(event, random.choice([s for s in domains[event.id] if s is not current]))
+    return perturbed
+
+
+def warm_start_population(schedule, problem, size, w_hard, w_soft, domains=None):
+    """
+    Initial GA population: `schedule` itself plus size - 1 perturbed copies.
+
+    Returns:
+        [(schedule, eval, fitness, probability), ...]
+    """
+    domains = domains if domains is not None else compute_domains(problem)
+    schedules = [schedule] + [
+        perturb(schedule, domains, random.randint(1, PERTURB_MOVES)) for _ in range(size - 1)
+    ]
+    return [
+        fitness((s, soft_eval(s, problem), 0, 0), problem, w_hard, w_soft)
+        for s in schedules
+    ]
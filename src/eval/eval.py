@@ -171,6 +171,64 @@ def eval_pair(schedule, problem) -> int:
     return pair_penalty
 
 
+# names of the unweighted soft components returned by eval_components
+EVAL_COMPONENTS = ("lecturemin", "tutorialmin", "pref", "secdiff", "notpaired")
+
+
+# unweighted soft components of a schedule, in EVAL_COMPONENTS order:
+#   lecturemin  : missing lectures summed over lecture slots (max(0, min - assigned))
+#   tutorialmin : same for tutorial slots
+#   pref        : preference values of unmet preferences
+#   secdiff     : same-course lecture sections sharing a slot (int(count / 2) per slot)
+#   notpaired   : pairs whose events are in different slots
+# eval(schedule, problem) == weighted_eval(eval_components(schedule, problem), problem)
+def eval_components(schedule, problem):
+    lec_count, tut_count, same_section = {}, {}, {}
+    for event, slot in schedule.assignments.items():
+        if event.is_tutorial():
+            key = ("TUT", slot.day, slot.start_time)
+            tut_count[key] = tut_count.get(key, 0) + 1
+        else:
+            key = ("LEC", slot.day, slot.start_time)
+            lec_count[key] = lec_count.get(key, 0) + 1
+            section_key = (" ".join(event.id.split()[:3]), slot.day, slot.start_time)
+            same_section[section_key] = same_section.get(section_key, 0) + 1
+
+    lecturemin = sum(
+        max(0, slot.lecture_min - lec_count.get(key, 0)) for key, slot in problem.lec_slots_by_key.items()
+    )
+    tutorialmin = sum(
+        max(0, slot.tutorial_min - tut_count.get(key, 0)) for key, slot in problem.tut_slots_by_key.items()
+    )
+    secdiff = sum(count // 2 for count in same_section.values() if count > 1)
+
+    notpaired = 0
+    for pair in problem.pairs:
+        event_a = problem.events_by_id[pair.event_a_id]
+        event_b = problem.events_by_id[pair.event_b_id]
+        if schedule.is_assigned(event_a) and schedule.is_assigned(event_b):
+            if schedule.get_assignment(event_a) != schedule.get_assignment(event_b):
+                notpaired += 1
+
+    return (lecturemin, tutorialmin, eval_pref(schedule, problem), secdiff, notpaired)
+
+
+# coefficients that turn eval_components into eval for the problem's weights and penalties
+def component_coefficients(problem):
+    return (
+        problem.w_minfilled * problem.pen_lecturemin,
+        problem.w_minfilled * problem.pen_tutorialmin,
+        problem.w_pref,
+        problem.w_secdiff * problem.pen_section,
+        problem.w_pair * problem.pen_notpaired,
+    )
+
+
+# eval from unweighted components (O(1), no pass over the schedule)
+def weighted_eval(components, problem):
+    return sum(c * x for c, x in zip(component_coefficients(problem), components))
+
+
 # helper function to format slot keys to "DAY, TIME"
 def format_slot_keys(slot_key):
     kind, day, time = slot_key
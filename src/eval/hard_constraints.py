@@ -91,6 +91,19 @@ def _events_in_slot(schedule: Schedule, slot_key: SlotKey):
     return events
 
 
+def _events_by_slot(schedule: Schedule):
+    """
+    Groups the assigned events by slot key in one pass over the schedule
+    (slot_key -> [events]), instead of one _events_in_slot scan per slot.
+    """
+    by_slot = defaultdict(list)
+
+    for event, slot in _iter_assignments(schedule):
+        by_slot[slot.slot_key].append(event)
+
+    return by_slot
+
+
 # ---------------------------------------------------------------------------
 # constraint-specific checkers
 #  - these all return integer penalties, but they are stubbed at 0 for now
@@ -108,11 +121,12 @@ def _check_capacity(schedule: Schedule, problem: ProblemInstance) -> int:
     Returns how many hard constraint violations occured
     """
     penalty = 0
+    by_slot = _events_by_slot(schedule)
 
     # lecture slot capacity
     for slot_key, slot in problem.lec_slots_by_key.items():
 
-        events_here = _events_in_slot(schedule, slot_key)
+        events_here = by_slot.get(slot_key, ())
 
         # checks how many lectures are in this slot
         total_lectures = sum(1 for e in events_here if e.is_lecture())
@@ -131,7 +145,7 @@ def _check_capacity(schedule: Schedule, problem: ProblemInstance) -> int:
     # tutorial slot capcity
     for slot_key, slot in problem.tut_slots_by_key.items():
 
-        events_here = _events_in_slot(schedule, slot_key)
+        events_here = by_slot.get(slot_key, ())
 
         total_tutorials = sum(1 for e in events_here if e.is_tutorial())
 
@@ -249,25 +263,36 @@ def _check_tutorials_section_diff_from_lecture(schedule: Schedule, problem: Prob
         # compare
         for lec in lec_slots:
             for tut in tut_slots:
-                tut_start_time = int(tut.start_time.split(":")[0])
-                lec_start_time = int(lec.start_time.split(":")[0])
-                # if day and start_time match = conflict
-
-                if tut.day == "FR" and lec.day == "MO":
-                    tut_end_time = tut_start_time + 2
-                    if tut_start_time <= lec_start_time <= tut_end_time:
-                        penalty += PEN_HARD
-                elif tut.day == "TU" and lec.day == tut.day:
-                    tut_start_time_2 = int(tut.start_time.split(":")[1])
-                    tut_end_time = tut_start_time + tut_start_time_2 + 1.5
-                    lec_end_time = lec_start_time + 1.5
-                    if tut_start_time <= lec_start_time <= tut_end_time:
-                        penalty += PEN_HARD
-                    if lec_start_time <= tut_start_time <= lec_end_time:
-                        penalty += PEN_HARD
-                elif lec.day == tut.day and lec_start_time == tut_start_time:
-                    penalty += PEN_HARD
-    
+                penalty += _lecture_tutorial_overlap(lec, tut)
+
+    return penalty
+
+def _lecture_tutorial_overlap(lec, tut) -> int:
+    """
+    C9 penalty for ONE lecture slot vs ONE tutorial slot of the same section.
+    Split out of _check_tutorials_section_diff_from_lecture so search code can
+    test a single placement without rebuilding the section map.
+    """
+    penalty = 0
+    tut_start_time = int(tut.start_time.split(":")[0])
+    lec_start_time = int(lec.start_time.split(":")[0])
+    # if day and start_time match = conflict
+
+    if tut.day == "FR" and lec.day == "MO":
+        tut_end_time = tut_start_time + 2
+        if tut_start_time <= lec_start_time <= tut_end_time:
+            penalty += PEN_HARD
+    elif tut.day == "TU" and lec.day == tut.day:
+        tut_start_time_2 = int(tut.start_time.split(":")[1])
+        tut_end_time = tut_start_time + tut_start_time_2 + 1.5
+        lec_end_time = lec_start_time + 1.5
+        if tut_start_time <= lec_start_time <= tut_end_time:
+            penalty += PEN_HARD
+        if lec_start_time <= tut_start_time <= lec_end_time:
+            penalty += PEN_HARD
+    elif lec.day == tut.day and lec_start_time == tut_start_time:
+        penalty += PEN_HARD
+
     return penalty
 
 # checks C2 : for all in notcompatible, they are assigned to different slots (can be lecture/tutorials)
@@ -732,6 +757,20 @@ def debug_all_hard_constraints(schedule: Schedule, problem: ProblemInstance):
 # Public API
 # ------------
 
+# every check that Valid adds up, with the name used in reports
+_HARD_CHECKS = (
+    ("C1_C8_C14_C15_capacity", _check_capacity),
+    ("C2_not_compatible", _check_not_compatible),
+    ("C4_unwanted", _check_unwanted),
+    ("C3_partial_assign", _check_partial_assignments),
+    ("C16_active_learning", _check_active_learning_requirements),
+    ("C11_C12_C13_evening", _check_evening_rules),
+    ("C6_dept_blackout", _check_department_blackout),
+    ("C5_500_level", _check_5xx_lectures),
+    ("C5_500_level_time", _check_5xx_time_overlap),
+    ("C9_tutorial_same_slot", _check_tutorials_section_diff_from_lecture),
+)
+
 # TODO: idk if we wanna change this to match the proposal and check all the Pass functions... 
 def Valid(schedule: Schedule, problem: ProblemInstance) -> int:
     """
@@ -742,19 +781,18 @@ def Valid(schedule: Schedule, problem: ProblemInstance) -> int:
     else -> invalid schedule
     """
     penalty = 0
-    penalty += _check_capacity(schedule, problem)
-    penalty += _check_not_compatible(schedule, problem)
-    penalty += _check_unwanted(schedule, problem)
-    penalty += _check_partial_assignments(schedule, problem)
-    penalty += _check_active_learning_requirements(schedule, problem)
-    penalty += _check_evening_rules(schedule, problem)
-    penalty += _check_department_blackout(schedule, problem)
-    penalty += _check_5xx_lectures(schedule, problem)
-    penalty += _check_5xx_time_overlap(schedule, problem)
-    penalty += _check_tutorials_section_diff_from_lecture(schedule, problem)
+    for _, check in _HARD_CHECKS:
+        penalty += check(schedule, problem)
     return penalty
 
 
+def hard_violation_counts(schedule: Schedule, problem: ProblemInstance) -> dict:
+    """
+    Same checks as Valid, reported per constraint (name -> penalty).
+    """
+    return {name: check(schedule, problem) for name, check in _HARD_CHECKS}
+
+
 def PassLectures(schedule: Schedule, problem: ProblemInstance) -> bool:
     """
     Returns True if the schedule passes all hard constraints
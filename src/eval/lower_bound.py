@@ -0,0 +1,147 @@
+# Lower bound on the soft penalty (eval) of ANY valid schedule of a problem
+# if a valid schedule reaches it, that schedule is optimal
+
+from model.domains import compute_domains
+
+
+def soft_lower_bound_terms(problem, domains=None):
+    """
+    Lower bound on every term of eval.eval, weights included.
+
+    - minfilled : slot minimums that cannot be covered even if every event
+                  went to a slot whose minimum it helps fill (max flow of
+                  events into slot minimums over the domains)
+    - pref      : cheapest preference penalty of each event over its domain
+    - pair      : pairs that can never share a slot (no common slot in their
+                  domains, or the two events must not overlap in time)
+    - secdiff   : lecture sections of one course that outnumber the slots
+                  they can use (pigeonhole)
+
+    Each term is a bound on its own part of eval, so their sum bounds eval.
+
+    Args:
+        problem: ProblemInstance
+        domains: optional precomputed compute_domains(problem)
+
+    Returns:
+        dict: term name -> int
+    """
+    if domains is None:
+        domains = compute_domains(problem)
+
+    return {
+        "minfilled": problem.w_minfilled * _minfilled_bound(problem, domains),
+        "pref": problem.w_pref * _pref_bound(problem, domains),
+        "pair": problem.w_pair * _pair_bound(problem, domains),
+        "secdiff": problem.w_secdiff * _secdiff_bound(problem, domains),
+    }
+
+
+def soft_lower_bound(problem, domains=None):
+    """
+    Sum of soft_lower_bound_terms: no valid schedule has a lower eval.
+    """
+    return sum(soft_lower_bound_terms(problem, domains).values())
+
+
+# function to compute the shortfall of slot minimums no assignment can avoid
+def _minfilled_bound(problem, domains):
+    lec_ids = [e for e in domains if problem.get_event(e).is_lecture()]
+    tut_ids = [e for e in domains if not problem.get_event(e).is_lecture()]
+
+    lec_need = {k: max(0, min(s.lecture_min, s.lecture_max)) for k, s in problem.lec_slots_by_key.items()}
+    tut_need = {k: max(0, min(s.tutorial_min, s.tutorial_max)) for k, s in problem.tut_slots_by_key.items()}
+
+    # the impossible part of a minimum (above the slot max) is always paid
+    lec_over = sum(max(0, s.lecture_min - max(0, s.lecture_max)) for s in problem.lec_slots_by_key.values())
+    tut_over = sum(max(0, s.tutorial_min - max(0, s.tutorial_max)) for s in problem.tut_slots_by_key.values())
+
+    lec_filled = match_events(lec_ids, domains, lec_need)
+    tut_filled = match_events(tut_ids, domains, tut_need)
+    lec_short = sum(lec_need.values()) - sum(map(len, lec_filled.values())) + lec_over
+    tut_short = sum(tut_need.values()) - sum(map(len, tut_filled.values())) + tut_over
+
+    return problem.pen_lecturemin * lec_short + problem.pen_tutorialmin * tut_short
+
+
+def match_events(event_ids, domains, need):
+    """
+    Maximum bipartite b-matching of events into slots (augmenting paths):
+    every event takes one unit of one slot in its domain, slot key k has
+    need[k] units.
+
+    Returns:
+        dict: slot_key -> list of matched event_ids
+    """
+    filled = {key: [] for key in need}
+
+    def augment(event_id, seen):
+        for slot in domains[event_id]:
+            key = slot.slot_key
+            if need.get(key, 0) == 0 or key in seen:
+                continue
+            seen.add(key)
+            if len(filled[key]) < need[key]:
+                filled[key].append(event_id)
+                return True
+            # try to move one of the slot's events somewhere else
+            for i, other in enumerate(filled[key]):
+                if augment(other, seen):
+                    filled[key][i] = event_id
+                    return True
+        return False
+
+    for event_id in sorted(event_ids, key=lambda e: len(domains[e])):
+        augment(event_id, set())
+    return filled
+
+
+# function to sum the cheapest reachable preference penalty of every event
+def _pref_bound(problem, domains):
+    prefs = {}
+    for pref in problem.preferences:
+        prefs.setdefault(pref.event_id, []).append(pref)
+
+    total = 0
+    for event_id, event_prefs in prefs.items():
+        domain = domains.get(event_id, [])
+        if not domain:
+            continue
+        # eval_pref compares "DAY, TIME", so only day and time matter here
+        total += min(
+            sum(p.value for p in event_prefs if p.slot_key[1:] != (slot.day, slot.start_time))
+            for slot in domain
+        )
+    return total
+
+
+# function to count pairs that can never be placed in the same slot
+def _pair_bound(problem, domains):
+    never_together = set()
+    for nc in problem.not_compatible:
+        never_together.add(frozenset((nc.event_a_id, nc.event_b_id)))
+
+    forced = 0
+    for pair in problem.pairs:
+        a, b = pair.event_a_id, pair.event_b_id
+        if a not in domains or b not in domains:
+            continue
+        shared = set(map(id, domains[a])) & set(map(id, domains[b]))
+        if not shared or frozenset((a, b)) in never_together:
+            forced += 1
+    return problem.pen_notpaired * forced
+
+
+# function to bound the same-slot penalty of lecture sections of one course
+def _secdiff_bound(problem, domains):
+    forced = 0
+    for lec_ids in problem.course_list.values():
+        usable = set()
+        for lec_id in lec_ids:
+            usable.update(slot.slot_key for slot in domains.get(lec_id, []))
+        # k sections in m slots: every doubled-up section beyond one per slot
+        # costs at least half a penalty (eval_secdiff charges count // 2)
+        extra = len(lec_ids) - len(usable)
+        if extra > 0:
+            forced += (extra + 1) // 2
+    return problem.pen_section * forced
@@ -0,0 +1,201 @@
+# Presolve: cheap proofs that a problem has NO valid schedule
+# (run right after parsing, before any search)
+
+from parser.constants import EVENT_KIND_LECTURE, SPECIAL_COURSE_851, SPECIAL_COURSE_913
+from model.domains import compute_domains, unary_violation
+from eval.lower_bound import match_events
+
+# list at most this many events per reason
+_SHOWN = 6
+
+
+def presolve(problem, domains=None):
+    """
+    Look for hard constraints that can never be satisfied together.
+
+    Checks:
+    - partial assignments that break a single-event rule (C4, C6, C11, C12/C13, C16, ...)
+    - events left with no allowed slot at all
+    - counting / pigeonhole bounds: every event needs a unit of slot capacity
+      (C1/C8) and every AL event a unit of AL capacity (C14/C15) in its domain;
+      a maximum matching of events into capacities that leaves an event out
+      names a group of events that outnumbers the slots it can use
+    - clique bounds: events that pairwise must not share a time (not compatible,
+      CPSC 851/913 vs 351/413, 5XX lectures) need as many distinct times
+
+    An empty result does NOT mean a valid schedule exists.
+
+    Args:
+        problem: ProblemInstance
+        domains: optional precomputed compute_domains(problem)
+
+    Returns:
+        list of str: one line per provable reason of infeasibility
+    """
+    if domains is None:
+        domains = compute_domains(problem)
+
+    reasons = []
+    reasons += _check_partial_assignments(problem)
+    reasons += _check_empty_domains(problem, domains)
+    reasons += _check_capacity(problem, domains)
+    reasons += _check_cliques(problem, domains)
+    return reasons
+
+
+def _names(event_ids):
+    event_ids = sorted(event_ids)
+    shown = ", ".join(event_ids[:_SHOWN])
+    return shown + (f", ... (+{len(event_ids) - _SHOWN} more)" if len(event_ids) > _SHOWN else "")
+
+
+def _slot_names(keys):
+    return ", ".join(f"{kind} {day} {time}" for kind, day, time in sorted(keys))
+
+
+# function to check that every fixed slot is allowed for its event
+def _check_partial_assignments(problem):
+    unwanted = {}
+    for uw in problem.unwanted:
+        unwanted.setdefault(uw.event_id, set()).add(uw.slot_key)
+
+    reasons = []
+    fixed = {}
+    for pa in problem.partial_assignments:
+        event = problem.get_event(pa.event_id)
+        slot = problem.get_slot(pa.slot_key)
+        if event is None or slot is None:
+            continue
+
+        if pa.event_id in fixed and fixed[pa.event_id] != pa.slot_key:
+            reasons.append(
+                f"C3 partial assignment: {pa.event_id} is fixed to both "
+                f"{_slot_names([fixed[pa.event_id]])} and {_slot_names([pa.slot_key])}"
+            )
+        fixed[pa.event_id] = pa.slot_key
+
+        rule = unary_violation(event, slot, unwanted.get(pa.event_id, ()))
+        if rule is not None:
+            reasons.append(f"C3 partial assignment: {pa.event_id} -> {_slot_names([pa.slot_key])} breaks {rule}")
+    return reasons
+
+
+# function to report events that no slot accepts
+def _check_empty_domains(problem, domains):
+    partial = {pa.event_id for pa in problem.partial_assignments}
+    return [
+        f"no allowed slot for {event_id} (unwanted / evening / AL / special tutorial rules rule out every slot)"
+        for event_id, domain in sorted(domains.items())
+        if not domain and event_id not in partial
+    ]
+
+
+# function to run the pigeonhole check on slot capacity and AL capacity
+def _check_capacity(problem, domains):
+    slots = list(problem.lec_slots_by_key.values()) + list(problem.tut_slots_by_key.values())
+    cap = {}
+    al_cap = {}
+    for slot in slots:
+        top, al_top = (
+            (slot.lecture_max, slot.al_lecture_max) if slot.kind == EVENT_KIND_LECTURE
+            else (slot.tutorial_max, slot.al_tutorial_max)
+        )
+        cap[slot.slot_key] = max(0, top)
+        al_cap[slot.slot_key] = max(0, min(top, al_top))
+
+    placeable = [e for e in domains if domains[e]]
+    al_events = [e for e in placeable if problem.get_event(e).al_required]
+
+    reasons = []
+    for label, event_ids, capacity in (
+        ("C1/C8 slot capacity", placeable, cap),
+        ("C14/C15 AL capacity", al_events, al_cap),
+    ):
+        filled = match_events(event_ids, domains, capacity)
+        matched = {e for ids in filled.values() for e in ids}
+        reported = set()
+        for event_id in event_ids:
+            if event_id in matched:
+                continue
+            group, keys = _hall_set(event_id, domains, capacity, filled)
+            if frozenset(keys) in reported:
+                continue
+            reported.add(frozenset(keys))
+            total = sum(capacity[k] for k in keys)
+            reasons.append(
+                f"{label}: {len(group)} events ({_names(group)}) can only use "
+                f"{_slot_names(keys) or 'no slot'} with room for {total}"
+            )
+    return reasons
+
+
+# function to collect the events reachable by alternating paths from an
+# unmatched event; together they need more units than their slots hold
+def _hall_set(start, domains, capacity, filled):
+    group = {start}
+    keys = set()
+    stack = [start]
+    while stack:
+        event_id = stack.pop()
+        for slot in domains[event_id]:
+            key = slot.slot_key
+            if capacity.get(key, 0) == 0 or key in keys:
+                continue
+            keys.add(key)
+            for other in filled[key]:
+                if other not in group:
+                    group.add(other)
+                    stack.append(other)
+    return group, keys
+
+
+# function to find groups of events that pairwise must not share a time
+# but have fewer distinct times available than members
+def _check_cliques(problem, domains):
+    graph = {event_id: set() for event_id in problem.events_by_id}
+
+    def link(a, b):
+        if a != b and a in graph and b in graph:
+            graph[a].add(b)
+            graph[b].add(a)
+
+    for nc in problem.not_compatible:
+        link(nc.event_a_id, nc.event_b_id)
+
+    # special tutorials vs every lecture / tutorial of their related course
+    # (the parser does not add these to not_compatible)
+    related = {SPECIAL_COURSE_851: ("CPSC", 351), SPECIAL_COURSE_913: ("CPSC", 413)}
+    for event_id, event in problem.events_by_id.items():
+        course_key = related.get(f"{event.program_code} {event.course_no}")
+        if not event.is_special_tut or course_key is None:
+            continue
+        for other_id in problem.course_list.get(course_key, []) + problem.tut_list.get(course_key, []):
+            link(event_id, other_id)
+    five_hundreds = [e.id for e in problem.lec_by_id.values() if e.is_500_course]
+    for i, a in enumerate(five_hundreds):
+        for b in five_hundreds[i + 1:]:
+            link(a, b)
+
+    # greedy maximal clique around every event (big-degree neighbours first)
+    reasons = []
+    seen = set()
+    for start in sorted(graph, key=lambda e: -len(graph[e])):
+        if not graph[start]:
+            continue
+        clique = [start]
+        for other in sorted(graph[start], key=lambda e: (-len(graph[e]), e)):
+            if all(other in graph[member] for member in clique):
+                clique.append(other)
+
+        key = frozenset(clique)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        times = {(slot.day, slot.start_time) for member in clique for slot in domains[member]}
+        if len(clique) > len(times):
+            reasons.append(
+                f"C2/C5/C12/C13 time conflicts: {len(clique)} events ({_names(clique)}) "
+                f"must all be at different times but only {len(times)} distinct day/time(s) are available"
+            )
+    return reasons
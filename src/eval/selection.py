@@ -17,11 +17,44 @@ def fitness(f, problem, w_hard, w_soft):
 
     valid_value = Valid(schedule, problem)
 
+    new_fit_value = fitness_from_scores(valid_value, eval_value, w_hard, w_soft)
+
+    return (schedule, eval_value, new_fit_value, probability)
+
+
+# w_hard = LEXICOGRAPHIC: any hard violation outweighs any soft penalty
+LEXICOGRAPHIC = float("inf")
+
+# soft penalties stay below this in lexicographic keys
+LEX_SCALE = 10 ** 12
+
+
+def fitness_from_scores(valid_value, eval_value, w_hard, w_soft):
+    """
+    Fitness of an individual whose hard penalty (Valid) and soft penalty
+    (eval) are already known.
+
+    With w_hard = LEXICOGRAPHIC the fitness is the exact integer key
+    -(hard * LEX_SCALE + soft) instead: it ranks by hard, then soft, with
+    no float rounding or ties between different (hard, soft) pairs, and 0
+    is optimal. Larger is still better.
+    """
+    if w_hard == LEXICOGRAPHIC:
+        return -(valid_value * LEX_SCALE + eval_value)
+
     # closer to 1 is more fit
     # fit = 1 an optimal solution => can return
-    new_fit_value = 1 / (1 + (w_hard * valid_value) + (w_soft * eval_value))
+    return 1 / (1 + (w_hard * valid_value) + (w_soft * eval_value))
 
-    return (schedule, eval_value, new_fit_value, probability)
+
+def hard_from_fitness(fit_value, eval_value, w_hard, w_soft):
+    """
+    Recover the hard penalty (Valid) of an individual from its fitness and
+    eval without re-running the hard constraint checks.
+    """
+    if w_hard == LEXICOGRAPHIC:
+        return -fit_value // LEX_SCALE
+    return round((1 / fit_value - 1 - w_soft * eval_value) / w_hard)
 
 
 def probability(f):
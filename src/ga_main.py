@@ -1,8 +1,24 @@
 import os
 import sys
+import time
+import random
+import pstats
+import argparse
+import cProfile
 
 from parser.parser import parse_from_command_line
 from control.genetic_algorithm import GeneticAlgorithm
+from control.decomposition import solve_decomposed
+from control.branch_and_bound import solve_exact, EXACT_EVENT_LIMIT
+from eval.selection import fitness, fitness_from_scores
+from eval.presolve import presolve
+from control.checkpoint import checkpoint_path_for, load_checkpoint
+from control.telemetry import Telemetry
+from control.profiler import PhaseProfiler
+from control.sweep import parse_sweep_file, run_sweep
+from control.warm_start import load_output_schedule, warm_start_population, WARM_START_PLATEAU
+from control.archive import RunArchive, GenerationLog
+from control.restart import RESTART_POLICIES
 
 
 # Require a filename as a command-line argument
@@ -27,19 +43,219 @@ ROOT = find_project_root(os.path.dirname(__file__))
 
 sys.path.insert(0, os.path.join(ROOT, "src"))
 
+# optional flags go after the 9 positional arguments
+def parse_cli_args(argv):
+    cli = argparse.ArgumentParser(
+        usage="python src/ga_main.py <input_file> <w_minfilled> <w_pref> <w_pair> <w_secdiff> "
+              "<pen_lecturemin> <pen_tutorialmin> <pen_notpaired> <pen_section> [options]"
+    )
+    cli.add_argument("input_file")
+    cli.add_argument("weights", nargs=8)
+    cli.add_argument("--decompose", action="store_true",
+                     help="solve independent constraint-graph components in parallel (falls back to the full GA)")
+    cli.add_argument("--workers", type=int, default=None,
+                     help="number of worker processes for --decompose / --sweep (default: cpu count)")
+    cli.add_argument("--time-limit", type=float, default=None,
+                     help="stop after this many seconds in total (exact solver, components and GA) "
+                          "and keep the best schedule so far")
+    cli.add_argument("--seed", type=int, default=None,
+                     help="seed the random number generator, so a run can be repeated (recorded by --archive)")
+    cli.add_argument("--telemetry", metavar="PATH", default=None,
+                     help="write one JSON line of GA statistics every --telemetry-interval generations")
+    cli.add_argument("--telemetry-interval", type=int, default=100,
+                     help="generations between telemetry lines (default: 100)")
+    cli.add_argument("--profile", action="store_true",
+                     help="time every phase of the GA loop and print a breakdown table at the end")
+    cli.add_argument("--cprofile", metavar="PATH", default=None,
+                     help="run the search under cProfile, dump pstats to PATH and print the top functions")
+    cli.add_argument("--checkpoint-interval", type=int, default=5000,
+                     help="generations between GA checkpoints in output/ (0 disables them)")
+    cli.add_argument("--resume", action="store_true",
+                     help="continue the GA from the last checkpoint of this input file")
+    cli.add_argument("--no-presolve", action="store_true",
+                     help="search even when presolve proves the instance infeasible (prints a best attempt)")
+    cli.add_argument("--no-exact", action="store_true",
+                     help=f"skip the exact branch-and-bound solver on small instances (<= {EXACT_EVENT_LIMIT} events)")
+    cli.add_argument("--no-cache", action="store_true",
+                     help="always parse the input file instead of loading it from cache/")
+    cli.add_argument("--warm-start", metavar="FILE", nargs="?", const="", default=None,
+                     help="start the GA from a previous output file (default: output/<input>_output.txt) "
+                          "mapped onto the current instance, instead of a random population")
+    cli.add_argument("--archive", metavar="PATH", nargs="?", const="", default=None,
+                     help="record the run in an SQLite archive (default: archive.sqlite) and compare it "
+                          "with the best known result for this instance and weights")
+    cli.add_argument("--warm-start-best", action="store_true",
+                     help="with --archive: warm-start from the best archived schedule of this instance")
+    cli.add_argument("--restart", choices=RESTART_POLICIES, default=None,
+                     help="on a plateau restart instead of terminating: keep the elite and reseed the rest, "
+                          "hypermutate the population, or reseed with Luby-scaled population and budget")
+    cli.add_argument("--max-restarts", type=int, default=None,
+                     help="with --restart: terminate on the plateau after this many restarts (default: no limit)")
+    cli.add_argument("--adaptive-mutation", action="store_true",
+                     help="raise the mutation rate as the population loses diversity")
+    cli.add_argument("--min-diversity", metavar="X", type=float, default=None,
+                     help="with --restart: also restart when the mean pairwise distance drops below "
+                          "this share of events")
+    cli.add_argument("--lexicographic", action="store_true",
+                     help="rank individuals by (hard, soft) exactly instead of the weighted float fitness")
+    cli.add_argument("--solutions", metavar="K", type=int, default=1,
+                     help="also export the K best valid schedules found by the run as alternatives "
+                          "(output/<input>_solNN_output.txt)")
+    cli.add_argument("--min-distance", metavar="D", type=int, default=None,
+                     help="alternatives differ in at least D assignments (default: 5%% of the events)")
+    cli.add_argument("--sweep", metavar="FILE", default=None,
+                     help="also solve for every weight/penalty vector in FILE (8 numbers per line), "
+                          "warm-starting each point from the previous ones")
+    return cli.parse_args(argv)
+
+# seconds left until `deadline` (a time.time() value), None without a time limit
+def time_left(deadline):
+    return None if deadline is None else round(max(0.0, deadline - time.time()), 3)
+
 def start_search():
+    cli_args = parse_cli_args(sys.argv[1:])
+    # --time-limit is one budget for the whole run: every stage gets what is left of it
+    deadline = time.time() + cli_args.time_limit if cli_args.time_limit is not None else None
+    if cli_args.seed is not None:
+        random.seed(cli_args.seed)
     input_path = os.path.join(ROOT, "input", TESTFILE)
 
-    args = [
-        input_path,
-        sys.argv[2], sys.argv[3], sys.argv[4], sys.argv[5],
-        sys.argv[6], sys.argv[7], sys.argv[8], sys.argv[9]
-    ]
-
-    problem = parse_from_command_line(args)
-
-    ga = GeneticAlgorithm(problem)
-    best_schedule, best_soft, best_hard, best_fitness = ga.run(print_interval=200)
+    args = [input_path] + cli_args.weights
+
+    cache_dir = None if cli_args.no_cache else os.path.join(ROOT, "cache")
+    problem = parse_from_command_line(args, cache_dir=cache_dir)
+
+    # provably infeasible instances are reported instead of searched
+    reasons = presolve(problem)
+    if reasons:
+        print("\n[PRESOLVE] No valid schedule can exist:")
+        for reason in reasons:
+            print(f"  - {reason}")
+        if not cli_args.no_presolve:
+            print("\n>> No valid schedule (use --no-presolve to search for a best attempt anyway).")
+            sys.exit(1)
+
+    if cli_args.sweep:
+        run_weight_sweep(problem, cli_args)
+        return
+
+    checkpoint_path = checkpoint_path_for(TESTFILE, ROOT)
+    resume_state = None
+    if cli_args.resume:
+        if not os.path.exists(checkpoint_path):
+            print(f"Error: no checkpoint to resume from at {checkpoint_path}")
+            sys.exit(1)
+        resume_state = load_checkpoint(checkpoint_path, problem)
+
+    # small instances: try to prove optimality (or infeasibility) exactly first
+    solved = None
+    seeds = []
+    ga_bounds = {}
+    if resume_state is None and not cli_args.no_exact and len(problem.events_by_id) <= EXACT_EVENT_LIMIT:
+        exact_budget = time_left(deadline)
+        exact_budget = 10.0 if exact_budget is None else min(10.0, exact_budget)
+        exact_schedule, exact_soft, complete = solve_exact(problem, time_limit=exact_budget)
+        if complete and exact_schedule is not None and cli_args.solutions <= 1:
+            solved = (exact_schedule, exact_soft, 0, 0)
+        elif complete and exact_schedule is None:
+            # proven infeasible -> a short GA run is enough for a best attempt
+            ga_bounds = dict(max_generations=2000, plateau_limit=500)
+        elif exact_schedule is not None:
+            seeds = [exact_schedule]
+
+    archive = None
+    best_known = None
+    if cli_args.archive is not None:
+        archive = RunArchive(cli_args.archive or os.path.join(ROOT, "archive.sqlite"))
+        best_known = archive.best_known(problem)
+
+    # warm start: last run's timetable, adapted to the edited instance
+    warm_schedule = None
+    if solved is None and resume_state is None and cli_args.warm_start_best:
+        archived = archive.best_known(problem, any_weights=True) if archive is not None else None
+        if archived is None:
+            print("Error: --warm-start-best needs --archive holding a run of this instance")
+            sys.exit(1)
+        warm_schedule = archived[0]
+        print(f"\n[WARM START] archived run {archived[3]} (hard={archived[1]}, soft={archived[2]})")
+        ga_bounds.setdefault("plateau_limit", WARM_START_PLATEAU)
+    elif solved is None and resume_state is None and cli_args.warm_start is not None:
+        warm_path = cli_args.warm_start or os.path.join(
+            ROOT, "output", f"{os.path.splitext(TESTFILE)[0]}_output.txt"
+        )
+        if not os.path.exists(warm_path):
+            print(f"Error: no previous output to warm-start from at {warm_path}")
+            sys.exit(1)
+        warm_schedule, stats = load_output_schedule(warm_path, problem)
+        print(
+            f"\n[WARM START] {warm_path}: kept {stats['kept']} events, "
+            f"dropped {stats['dropped']}, placed {stats['placed']}"
+        )
+        ga_bounds.setdefault("plateau_limit", WARM_START_PLATEAU)
+
+    min_distance = cli_args.min_distance
+    if min_distance is None:
+        min_distance = max(1, len(problem.events_by_id) // 20)
+    ga = GeneticAlgorithm(
+        problem, time_limit=cli_args.time_limit, max_valid_solutions=max(1, cli_args.solutions),
+        solution_distance=min_distance, restart=cli_args.restart, max_restarts=cli_args.max_restarts,
+        adaptive_mutation=cli_args.adaptive_mutation, min_diversity=cli_args.min_diversity,
+        lexicographic=cli_args.lexicographic,
+        **ga_bounds
+    )
+    initial_population = None
+    if warm_schedule is not None:
+        initial_population = warm_start_population(warm_schedule, problem, ga.population_size, ga.w_hard, ga.w_soft)
+
+    if solved is None and resume_state is None and cli_args.decompose:
+        solved = solve_decomposed(problem, workers=cli_args.workers, seed=cli_args.seed, deadline=deadline)
+
+    # anytime snapshots: the output file always holds the best schedule so far
+    def write_snapshot(schedule, soft, hard, fitness_value, generation):
+        write_output_to_file(
+            input_filename=TESTFILE,
+            best_schedule=schedule,
+            best_soft=soft,
+            best_hard=hard,
+            generation=generation,
+            best_fitness=fitness_value,
+            problem=problem,
+            root_dir=ROOT,
+            verbose=False
+        )
+
+    started = time.perf_counter()
+    ga.time_limit = time_left(deadline)
+    if solved is not None:
+        best_schedule, best_soft, best_hard, ga.generation = solved
+        _, _, best_fitness, _ = fitness((best_schedule, best_soft, 0, 0), problem, ga.w_hard, ga.w_soft)
+    else:
+        telemetry = Telemetry(cli_args.telemetry, cli_args.telemetry_interval) if cli_args.telemetry else None
+        if archive is not None:
+            telemetry = GenerationLog(cli_args.telemetry_interval, forward=telemetry)
+        cprofiler = cProfile.Profile() if cli_args.cprofile else None
+        try:
+            if cprofiler is not None:
+                cprofiler.enable()
+            best_schedule, best_soft, best_hard, best_fitness = ga.run(
+                print_interval=200,
+                seed_schedules=seeds,
+                resume=resume_state,
+                checkpoint_path=checkpoint_path,
+                checkpoint_interval=cli_args.checkpoint_interval,
+                on_improvement=write_snapshot,
+                telemetry=telemetry,
+                profiler=PhaseProfiler() if cli_args.profile else None,
+                initial_population=initial_population
+            )
+        finally:
+            if telemetry is not None:
+                telemetry.close()
+            if cprofiler is not None:
+                cprofiler.disable()
+                cprofiler.dump_stats(cli_args.cprofile)
+                print(f"\n[PROFILE] cProfile stats written to: {cli_args.cprofile}")
+                pstats.Stats(cli_args.cprofile).sort_stats("cumulative").print_stats(25)
 
     from eval.hard_constraints import debug_all_hard_constraints
     debug_all_hard_constraints(best_schedule, problem)
@@ -63,6 +279,93 @@ def start_search():
         root_dir=ROOT
     )
 
+    if cli_args.solutions > 1 and solved is None:
+        export_solutions(ga, problem, cli_args.solutions)
+    elif cli_args.solutions > 1:
+        print("\n[SOLUTIONS] Alternatives are collected by the GA; --decompose returns a single schedule.")
+
+    if archive is not None:
+        run_id = archive.record_run(
+            problem, best_schedule, best_hard, best_soft,
+            generations=ga.generation,
+            wall_time=round(time.perf_counter() - started, 3),
+            seed=cli_args.seed,
+            params={"population_size": ga.base_population_size, "max_generations": ga.max_generations,
+                    "plateau_limit": ga.plateau_limit, "time_limit": cli_args.time_limit,
+                    "restart": cli_args.restart, "restarts": ga.restarts},
+            history=telemetry if solved is None else None
+        )
+        if best_known is None:
+            print(f"\n[ARCHIVE] run {run_id} is the first archived run of this instance and weights")
+        else:
+            _, known_hard, known_soft, known_id = best_known
+            verdict = ("better than" if (best_hard, best_soft) < (known_hard, known_soft)
+                       else "same as" if (best_hard, best_soft) == (known_hard, known_soft) else "worse than")
+            print(f"\n[ARCHIVE] run {run_id}: hard={best_hard}, soft={best_soft}, {verdict} "
+                  f"best known run {known_id} (hard={known_hard}, soft={known_soft})")
+        archive.close()
+
+    # the run finished, so its checkpoint is no longer needed
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+# alternatives: the GA's hall of fame, best first, one output file each (<input>_solNN_output.txt)
+def export_solutions(ga, problem, wanted):
+    solutions = ga.hall_of_fame.solutions()
+    print(f"\n=== {len(solutions)} OF {wanted} ALTERNATIVE VALID SCHEDULES "
+          f"(at least {ga.hall_of_fame.min_distance} assignments apart) ===")
+    if not solutions:
+        print("No valid schedule found.")
+        return
+
+    base_name = os.path.splitext(TESTFILE)[0]
+    best = solutions[0][0]
+    for index, (schedule, soft) in enumerate(solutions, start=1):
+        changed = sum(1 for event, slot in schedule.assignments.items() if best.get_assignment(event) != slot)
+        print(f"{index:>3}  soft={soft:<8} {changed} assignments differ from #1")
+        write_output_to_file(
+            input_filename=f"{base_name}_sol{index:02d}.txt",
+            best_schedule=schedule,
+            best_soft=soft,
+            best_hard=0,
+            generation=ga.generation,
+            best_fitness=fitness_from_scores(0, soft, ga.w_hard, ga.w_soft),
+            problem=problem,
+            root_dir=ROOT,
+            verbose=False
+        )
+    print(f"\n[OUTPUT] Alternatives written to: {os.path.join(ROOT, 'output', base_name + '_solNN_output.txt')}")
+
+# weight sweep: the command-line weights are the first point, the file's vectors follow
+# one output file per point (<input>_sweepNN_output.txt) and a summary table at the end
+def run_weight_sweep(problem, cli_args):
+    points = [tuple(int(w) for w in cli_args.weights)] + parse_sweep_file(cli_args.sweep)
+    ga_params = {"time_limit": cli_args.time_limit} if cli_args.time_limit is not None else None
+
+    print(f"\n[SWEEP] {len(points)} weight vectors")
+    results = run_sweep(problem, points, workers=cli_args.workers, ga_params=ga_params, seed=cli_args.seed)
+
+    base_name = os.path.splitext(TESTFILE)[0]
+    print("\n=== SWEEP RESULTS ===")
+    print(f"{'#':>3}  {'weights':<28} {'hard':>5} {'soft':>8}  components (lecmin tutmin pref secdiff notpaired)")
+    for index, result in enumerate(results):
+        weights = " ".join(str(w) for w in result["weights"])
+        components = " ".join(str(c) for c in result["components"])
+        print(f"{index:>3}  {weights:<28} {result['hard']:>5} {result['soft']:>8}  {components}")
+
+        write_output_to_file(
+            input_filename=f"{base_name}_sweep{index:02d}.txt",
+            best_schedule=result["schedule"],
+            best_soft=result["soft"],
+            best_hard=result["hard"],
+            generation=result["generations"],
+            best_fitness=result["fitness"],
+            problem=problem,
+            root_dir=ROOT,
+            verbose=False
+        )
+    print(f"\n[OUTPUT] Results written to: {os.path.join(ROOT, 'output', base_name + '_sweepNN_output.txt')}")
+
 # Print the schedule grouped by lecture and its tutorials
 # Should be able to reuse this for final version
 def print_schedule_formatted(schedule, problem, eval_value):
@@ -106,6 +409,13 @@ def print_schedule_formatted(schedule, problem, eval_value):
                     right2 = f"{tut_slot.day}, {tut_slot.start_time}"
                     rows.append((left2, right2, (dept, num)))
 
+            # tutorials that belong to no lecture section (e.g. CPSC 233 TUT 01)
+            for tut_id in sorted(problem.tut_list.get((dept, num), [])):
+                tut_ev = problem.get_event(tut_id)
+                if tut_ev.section_label is None:
+                    tut_slot = schedule.get_assignment(tut_ev)
+                    rows.append((f"{dept} {num} {tut_ev.tutorial_label}", f"{tut_slot.day}, {tut_slot.start_time}", (dept, num)))
+
     # Also include special courses (CPSC 851, CPSC 913)
     for (dept, num) in course_keys:
         if (dept, num) not in problem.course_list and (dept, num) in problem.tut_list:
@@ -131,9 +441,11 @@ def print_schedule_formatted(schedule, problem, eval_value):
 
     print("\n=======================================================\n")
 
-def write_output_to_file(input_filename, best_schedule, best_soft, best_hard, generation, best_fitness, problem, root_dir, output_dir="output"):
+def write_output_to_file(input_filename, best_schedule, best_soft, best_hard, generation, best_fitness, problem, root_dir, output_dir="output", verbose=True):
     """
     Write the final GA results and formatted schedule to a text file.
+    The file is written under a temporary name and then renamed, so it is
+    never seen half-written (anytime snapshots overwrite it during a run).
     
     Args:
         input_filename: Name of the input file (e.g., 'test1.txt')
@@ -145,6 +457,7 @@ def write_output_to_file(input_filename, best_schedule, best_soft, best_hard, ge
         problem: Problem instance
         root_dir: Project root directory
         output_dir: Directory to write output file (default: 'output')
+        verbose: print where the file was written
     """
     import os
     
@@ -158,7 +471,8 @@ def write_output_to_file(input_filename, best_schedule, best_soft, best_hard, ge
     output_filename = f"{base_name}_output.txt"
     output_path = os.path.join(output_path_dir, output_filename)
     
-    with open(output_path, 'w') as f:
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, 'w') as f:
         # write GA summary
         f.write("=== GA RESULTS ===\n")
         f.write(f"Generations: {generation}\n")
@@ -209,6 +523,15 @@ def write_output_to_file(input_filename, best_schedule, best_soft, best_hard, ge
                     left2 = f"{dept} {num} {lec_ev.section_label} {tut_ev.tutorial_label}"
                     right2 = f"{tut_slot.day}, {tut_slot.start_time}"
                     rows.append((left2, right2, (dept, num)))
+            
+            # add tutorials that belong to no lecture section (e.g. CPSC 233 TUT 01)
+            for tut_id in sorted(problem.tut_list.get((dept, num), [])):
+                tut_ev = problem.get_event(tut_id)
+                if tut_ev.section_label is None:
+                    tut_slot = best_schedule.get_assignment(tut_ev)
+                    left = f"{dept} {num} {tut_ev.tutorial_label}"
+                    right = f"{tut_slot.day}, {tut_slot.start_time}"
+                    rows.append((left, right, (dept, num)))
         
         # add special courses (tutorials without lectures, e.g., CPSC 851, CPSC 913)
         for (dept, num) in course_keys:
@@ -232,8 +555,12 @@ def write_output_to_file(input_filename, best_schedule, best_soft, best_hard, ge
             last_course = ck
         
         f.write("\n=======================================================\n")
-    
-    print(f"\n[OUTPUT] Results written to: {output_path}")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, output_path)
+
+    if verbose:
+        print(f"\n[OUTPUT] Results written to: {output_path}")
     return output_path
 
 if __name__ == "__main__":
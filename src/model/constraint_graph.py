@@ -0,0 +1,106 @@
+# Constraint graph over events (which events directly constrain each other)
+
+from parser.constants import SPECIAL_COURSE_851, SPECIAL_COURSE_913
+
+
+def build_constraint_graph(problem):
+    """
+    Build an undirected graph with one node per event and an edge between
+    two events whenever a hard or soft constraint couples their slots:
+
+    - not compatible pairs (C2)
+    - 5XX lectures with each other (C5)
+    - a lecture and the tutorials of its own section (C9)
+    - CPSC 851/913 with every CPSC 351/413 lecture and tutorial (C12/C13)
+    - pair constraints (soft)
+    - lecture sections of the same course (secdiff, soft)
+
+    Slot capacities and slot minimums couple everything that shares a slot,
+    so they are deliberately left out; callers deal with them separately.
+
+    Args:
+        problem: ProblemInstance
+
+    Returns:
+        dict: event_id -> set of neighbouring event_ids
+    """
+    graph = {event_id: set() for event_id in problem.events_by_id}
+
+    def link(a_id, b_id):
+        if a_id == b_id or a_id not in graph or b_id not in graph:
+            return
+        graph[a_id].add(b_id)
+        graph[b_id].add(a_id)
+
+    for nc in problem.not_compatible:
+        link(nc.event_a_id, nc.event_b_id)
+
+    for pair in problem.pairs:
+        link(pair.event_a_id, pair.event_b_id)
+
+    # 5XX lectures form a clique
+    five_hundreds = [e.id for e in problem.lec_by_id.values() if e.is_500_course]
+    for i in range(len(five_hundreds)):
+        for j in range(i + 1, len(five_hundreds)):
+            link(five_hundreds[i], five_hundreds[j])
+
+    # lecture sections of one course + each lecture with its own tutorials
+    for course_key, lec_ids in problem.course_list.items():
+        for i in range(len(lec_ids)):
+            for j in range(i + 1, len(lec_ids)):
+                link(lec_ids[i], lec_ids[j])
+
+        tut_ids = problem.tut_list.get(course_key, [])
+        for lec_id in lec_ids:
+            lec = problem.get_event(lec_id)
+            for tut_id in tut_ids:
+                if problem.get_event(tut_id).section_label == lec.section_label:
+                    link(lec_id, tut_id)
+
+    # special tutorials vs. their related course
+    related = {SPECIAL_COURSE_851: ("CPSC", 351), SPECIAL_COURSE_913: ("CPSC", 413)}
+    for event_id, event in problem.events_by_id.items():
+        if not event.is_special_tut:
+            continue
+        course_key = related.get(f"{event.program_code} {event.course_no}")
+        if course_key is None:
+            continue
+        for other_id in problem.course_list.get(course_key, []) + problem.tut_list.get(course_key, []):
+            link(event_id, other_id)
+
+    return graph
+
+
+def connected_components(graph):
+    """
+    Split a constraint graph into connected components.
+
+    Args:
+        graph: dict event_id -> set of neighbouring event_ids
+
+    Returns:
+        list of components (each a sorted list of event_ids), largest first
+    """
+    seen = set()
+    components = []
+
+    for start in sorted(graph):
+        if start in seen:
+            continue
+
+        # iterative DFS so big components don't hit the recursion limit
+        seen.add(start)
+        stack = [start]
+        component = []
+        while stack:
+            event_id = stack.pop()
+            component.append(event_id)
+            for other in graph[event_id]:
+                if other not in seen:
+                    seen.add(other)
+                    stack.append(other)
+
+        components.append(sorted(component))
+
+    components.sort(key=lambda c: (-len(c), c[0]))
+    return components
@@ -0,0 +1,96 @@
+# Per-event slot domains (unary hard constraints compiled once per problem)
+
+from parser.constants import (
+    EVENT_KIND_LECTURE,
+    FORBIDDEN_LECTURE_DAY, FORBIDDEN_LECTURE_TIME,
+    SPECIAL_TUTORIAL_DAY_TU, SPECIAL_TUTORIAL_TIME
+)
+
+
+def compute_domains(problem):
+    """
+    Build the domain of every event: the slots it can take without breaking
+    any hard constraint that only looks at that one event.
+
+    Filters applied (see eval/hard_constraints.py for the constraint numbers):
+    - slot kind matches event kind (lecture -> lecture slot, tutorial -> tutorial slot)
+    - C3  : partially assigned events only keep their fixed slot
+    - C4  : unwanted slots are removed
+    - C6  : lectures never go in (TU, 11:00)
+    - C11 : evening events only keep evening slots
+    - C12/C13 : CPSC 851/913 only keep the (TU, 18:00) tutorial slot
+    - C16 : AL events only keep slots with AL capacity
+    - C1/C8 : slots with a max of 0 are removed
+
+    Binary and capacity constraints are NOT applied here, so a non-empty
+    domain does not mean the event can actually be placed.
+
+    Args:
+        problem: ProblemInstance
+
+    Returns:
+        dict: event_id -> list of slot objects (in problem slot order)
+    """
+    unwanted = {}
+    for uw in problem.unwanted:
+        unwanted.setdefault(uw.event_id, set()).add(uw.slot_key)
+
+    partial = {}
+    for pa in problem.partial_assignments:
+        partial[pa.event_id] = pa.slot_key
+
+    lec_slots = list(problem.lec_slots_by_key.values())
+    tut_slots = list(problem.tut_slots_by_key.values())
+
+    domains = {}
+    for event_id, event in problem.events_by_id.items():
+
+        # partial assignments override everything else, even if the fixed slot
+        # breaks another rule (presolve is what reports that case)
+        if event_id in partial:
+            slot = problem.get_slot(partial[event_id])
+            domains[event_id] = [slot] if slot is not None else []
+            continue
+
+        candidates = lec_slots if event.is_lecture() else tut_slots
+        banned = unwanted.get(event_id, set())
+        domain = [slot for slot in candidates if unary_violation(event, slot, banned) is None]
+
+        domains[event_id] = domain
+
+    return domains
+
+
+def unary_violation(event, slot, banned=()):
+    """
+    Name the first single-event hard constraint that `slot` breaks for
+    `event` (None if the slot is allowed). `banned` holds the event's
+    unwanted slot keys.
+    """
+    if event.is_lecture() != (slot.kind == EVENT_KIND_LECTURE):
+        return "slot kind"
+
+    if slot.slot_key in banned:
+        return "C4 unwanted"
+
+    if event.is_lecture():
+        if slot.day == FORBIDDEN_LECTURE_DAY and slot.start_time == FORBIDDEN_LECTURE_TIME:
+            return "C6 no lectures on (TU, 11:00)"
+        if slot.lecture_max <= 0:
+            return "C1 lecture max is 0"
+        if event.al_required and slot.al_lecture_max <= 0:
+            return "C16 no AL capacity"
+    else:
+        if event.is_special_tut and not (
+            slot.day == SPECIAL_TUTORIAL_DAY_TU and slot.start_time == SPECIAL_TUTORIAL_TIME
+        ):
+            return "C12/C13 special tutorial only at (TU, 18:00)"
+        if slot.tutorial_max <= 0:
+            return "C8 tutorial max is 0"
+        if event.al_required and slot.al_tutorial_max <= 0:
+            return "C16 no AL capacity"
+
+    if event.is_evening_event and not slot.is_evening_slot:
+        return "C11 evening event"
+
+    return None
@@ -0,0 +1,47 @@
+# Compact encoding of schedules (for checkpoints, archives, ...)
+
+import sys
+from array import array
+
+from model.schedule import Schedule
+
+
+class ScheduleCodec:
+    """
+    Turn a Schedule into bytes and back for one problem instance.
+
+    Events and slots are numbered in problem order (events_by_id, then
+    lecture slots followed by tutorial slots), and a schedule is stored as
+    (event index, slot index) pairs of unsigned 16-bit little-endian ints.
+
+    The pairs keep the schedule's insertion order, because crossover walks
+    `assignments` in that order: a decoded schedule behaves exactly like
+    the original.
+    """
+
+    def __init__(self, problem):
+        self.problem = problem
+        self.events = list(problem.events_by_id.values())
+        self.slots = list(problem.lec_slots_by_key.values()) + list(problem.tut_slots_by_key.values())
+        self.event_index = {event.id: i for i, event in enumerate(self.events)}
+        self.slot_index = {slot.slot_key: i for i, slot in enumerate(self.slots)}
+
+    def encode(self, schedule):
+        values = array("H")
+        for event, slot in schedule.assignments.items():
+            values.append(self.event_index[event.id])
+            values.append(self.slot_index[slot.slot_key])
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values.tobytes()
+
+    def decode(self, data):
+        values = array("H")
+        values.frombytes(data)
+        if sys.byteorder != "little":
+            values.byteswap()
+
+        schedule = Schedule()
+        for i in range(0, len(values), 2):
+            schedule.assign(self.events[values[i]], self.slots[values[i + 1]])
+        return schedule
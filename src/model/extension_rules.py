@@ -194,8 +194,9 @@ def crossover(f_a, f_b):
 # function to purge the bottom k schedules from a population
 # population: list of (schedule, fitness) tuples
 # k: number of schedules to purge
+# key: sort key (ascending, the first k are removed; default: eval)
 # returns the purged population
-def purge(population, k):
+def purge(population, k, key=None):
 
     # if the k value is less than or equal to 0, return the original population (don't purge anything)
     if k <= 0:
@@ -206,7 +207,7 @@ def purge(population, k):
         return []
 
     # sort population by fitness (ascending)
-    population.sort(key=lambda x: x[1])
+    population.sort(key=key if key is not None else lambda x: x[1])
 
     # return population without the bottom k schedules
     return population[k:]
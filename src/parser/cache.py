@@ -0,0 +1,69 @@
+# cache of parsed problem instances, so repeat runs on the same input file skip parsing
+
+import os
+import pickle
+import hashlib
+
+from .stream import parse_input_file_streaming
+
+# bump to invalidate every cached instance (the parser sources are hashed as well)
+CACHE_VERSION = 1
+
+PARSER_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# function to fingerprint the parser: any change to its sources gives a new fingerprint
+# returns a hex digest string
+def parser_fingerprint():
+    digest = hashlib.sha1(f"v{CACHE_VERSION}".encode())
+    for name in sorted(os.listdir(PARSER_DIR)):
+        if name.endswith(".py"):
+            with open(os.path.join(PARSER_DIR, name), "rb") as f:
+                digest.update(name.encode())
+                digest.update(f.read())
+    return digest.hexdigest()
+
+# function to find the cache file of an input file
+# the name depends on the file content and the parser fingerprint, so an edited
+# input file or a changed parser never hits a stale entry
+# returns the cache file path
+def cache_path_for(filepath, cache_dir):
+    with open(filepath, "rb") as f:
+        content = f.read()
+    key = hashlib.sha1(content + parser_fingerprint().encode()).hexdigest()[:20]
+    base = os.path.splitext(os.path.basename(filepath))[0]
+    return os.path.join(cache_dir, f"{base}-{key}.pickle")
+
+# function to parse an input file through the cache
+# penalties and weights are not part of the cache key: they are set on the
+# loaded instance, so weight sweeps over one file share a single entry
+# returns a ProblemInstance object
+def parse_input_file_cached(filepath, cache_dir, pen_lecturemin=1, pen_tutorialmin=1,
+                            pen_notpaired=1, pen_section=1,
+                            w_minfilled=1, w_pref=1, w_pair=1, w_secdiff=1):
+    try:
+        path = cache_path_for(filepath, cache_dir)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file not found: {filepath}")
+
+    problem = None
+    if os.path.exists(path):
+        try:
+            with open(path, "rb") as f:
+                problem = pickle.load(f)
+            print(f"Loaded parsed instance from cache: {path}")
+        except Exception as e:
+            # an unreadable entry never stops a run: parse again and rewrite it
+            print(f"Ignoring unreadable cache entry {path}: {e}")
+            problem = None
+
+    if problem is None:
+        problem = parse_input_file_streaming(filepath)
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(problem, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    problem.set_penalties(pen_lecturemin, pen_tutorialmin, pen_notpaired, pen_section)
+    problem.set_weights(w_minfilled, w_pref, w_pair, w_secdiff)
+    return problem
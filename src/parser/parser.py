@@ -1,5 +1,7 @@
 # Main parser module for reading and parsing the input file
 
+from functools import partial
+
 from .helpers import is_empty_line
 from .event import Event, parse_lectures, parse_tutorials
 from .slot import parse_lecture_slots, parse_tutorial_slots
@@ -232,11 +234,14 @@ def validate_partial_assignments(problem):
 
 # function to parse preference constraints from lines
 # returns a list of Preference objects
-def parse_from_command_line(args):
+def parse_from_command_line(args, cache_dir=None):
     """
     Expected format:
     python main.py <input_file> <w_minfilled> <w_pref> <w_pair> <w_secdiff>
                    <pen_lecturemin> <pen_tutorialmin> <pen_notpaired> <pen_section>
+
+    With a cache_dir the parsed instance is loaded from / stored in that
+    directory (see parser.cache).
     """
     if len(args) < 9:
         raise ValueError(
@@ -254,7 +259,14 @@ def parse_from_command_line(args):
     pen_notpaired = int(args[7])
     pen_section = int(args[8])
     
-    return parse_input_file(
+    # single-pass parser (same result as parse_input_file, see parser.stream)
+    from .stream import parse_input_file_streaming
+    parse = parse_input_file_streaming
+    if cache_dir is not None:
+        from .cache import parse_input_file_cached
+        parse = partial(parse_input_file_cached, cache_dir=cache_dir)
+    
+    return parse(
         filepath,
         pen_lecturemin=pen_lecturemin,
         pen_tutorialmin=pen_tutorialmin,
@@ -0,0 +1,282 @@
+# single-pass streaming parser: builds the same ProblemInstance as
+# parser.parse_input_file, but reads the file line by line and hands every
+# line to its section handler as it arrives (no readlines(), no per-section
+# line lists). Event IDs are normalised once and interned, so constraints
+# share the Event's id string and the slot's slot_key tuple.
+
+from .helpers import strip_and_split, parse_boolean
+from .constants import (
+    SECTION_NAME, SECTION_LECTURE_SLOTS, SECTION_TUTORIAL_SLOTS,
+    SECTION_LECTURES, SECTION_TUTORIALS, SECTION_NOT_COMPATIBLE,
+    SECTION_UNWANTED, SECTION_PREFERENCES, SECTION_PAIR,
+    SECTION_PARTIAL_ASSIGNMENTS
+)
+from .event import Event
+from .slot import LectureSlot, TutorialSlot
+from .constraint import NotCompatible, Unwanted, Preference, Pair, PartialAssignment
+from .problem_instance import ProblemInstance
+from .parser import handle_special_courses, validate_partial_assignments
+
+# sections that only refer to events / slots declared elsewhere in the file
+CONSTRAINT_SECTIONS = {
+    SECTION_NOT_COMPATIBLE, SECTION_UNWANTED, SECTION_PREFERENCES,
+    SECTION_PAIR, SECTION_PARTIAL_ASSIGNMENTS
+}
+
+# function to read a file lazily, one line at a time
+# yields stripped, non-empty lines
+def stream_lines(filepath):
+    try:
+        f = open(filepath, 'r')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file not found: {filepath}")
+    with f:
+        for line in f:
+            stripped = line.strip()
+            if stripped:
+                yield stripped
+
+
+class StreamingParser:
+    """
+    Incremental builder of a ProblemInstance.
+
+    feed(line) dispatches one line to the handler of the current section;
+    finish() returns the instance. Constraint lines are handled as soon as
+    they arrive once all slot and event sections have been read (the order
+    of every bundled instance); in a file that declares constraints first
+    they are kept and handled at the end, as parse_input_file would. (A
+    lecture / tutorial section that reopens after the constraints started is
+    still added, but constraints before it cannot refer to its events.)
+    """
+
+    def __init__(self):
+        self.problem = ProblemInstance()
+        self.section = None
+        self.seen = set()
+        self.deferred = []
+        self.constraints_ready = False
+
+        # raw event id text -> canonical (normalised, interned) id
+        self.ids = {}
+
+        self.handlers = {
+            SECTION_NAME: self.name_line,
+            SECTION_LECTURE_SLOTS: self.lecture_slot_line,
+            SECTION_TUTORIAL_SLOTS: self.tutorial_slot_line,
+            SECTION_LECTURES: self.lecture_line,
+            SECTION_TUTORIALS: self.tutorial_line,
+            SECTION_NOT_COMPATIBLE: self.not_compatible_line,
+            SECTION_UNWANTED: self.unwanted_line,
+            SECTION_PREFERENCES: self.preference_line,
+            SECTION_PAIR: self.pair_line,
+            SECTION_PARTIAL_ASSIGNMENTS: self.partial_assignment_line,
+        }
+
+    # =====================================================================
+    # Dispatch
+    # =====================================================================
+    def feed(self, line):
+        if line in self.handlers:
+            self.section = line
+            self.seen.add(line)
+            if line in CONSTRAINT_SECTIONS and not self.constraints_ready and self.declarations_seen():
+                self.start_constraints()
+            return
+
+        if self.section is None:
+            return
+
+        if self.section in CONSTRAINT_SECTIONS and not self.constraints_ready:
+            self.deferred.append((self.section, line))
+            return
+
+        self.handlers[self.section](line)
+
+    def declarations_seen(self):
+        return all(
+            header in self.seen
+            for header in (SECTION_LECTURE_SLOTS, SECTION_TUTORIAL_SLOTS, SECTION_LECTURES, SECTION_TUTORIALS)
+        )
+
+    def start_constraints(self):
+        problem = self.problem
+        problem.events_by_id = {**problem.lec_by_id, **problem.tut_by_id}
+        self.ids.update((event_id, event_id) for event_id in problem.events_by_id)
+
+        handle_special_courses(problem)
+        for event_id, event in problem.events_by_id.items():
+            event.id = self.ids.setdefault(event_id, event_id)
+
+        # parse_input_file replaces the not-compatible list after the special
+        # courses were handled, so their pairs do not survive; keep it identical
+        problem.not_compatible = []
+
+        self.constraints_ready = True
+        for section, line in self.deferred:
+            self.handlers[section](line)
+        self.deferred = []
+
+    def finish(self, pen_lecturemin=1, pen_tutorialmin=1, pen_notpaired=1, pen_section=1,
+               w_minfilled=1, w_pref=1, w_pair=1, w_secdiff=1):
+        problem = self.problem
+        if not self.constraints_ready:
+            self.start_constraints()
+
+        if problem.name is None:
+            problem.name = "Unnamed Problem"
+
+        problem.set_penalties(pen_lecturemin, pen_tutorialmin, pen_notpaired, pen_section)
+        problem.set_weights(w_minfilled, w_pref, w_pair, w_secdiff)
+
+        validate_partial_assignments(problem)
+
+        print(f"Parsing complete: {problem}")
+        return problem
+
+    # =====================================================================
+    # Helpers
+    # =====================================================================
+    # function to turn the raw text of an event id into its canonical id
+    # (normalised once per distinct spelling)
+    def event_id(self, raw):
+        canonical = self.ids.get(raw)
+        if canonical is None:
+            canonical = ' '.join(raw.split())
+            canonical = self.ids.setdefault(canonical, canonical)
+            self.ids[raw] = canonical
+        return canonical
+
+    # function to find the slot_key of (day, start_time) for an event
+    # returns the slot_key or None when the instance has no such slot
+    def slot_key_for(self, event, day, start_time):
+        if event.is_lecture():
+            return self.problem.lec_slot_index.get((day, start_time))
+        return self.problem.tut_slot_index.get((day, start_time))
+
+    def add_event(self, event, by_id, course_lists):
+        # share the canonical id string (Event normalises it into a new one)
+        event.id = self.event_id(event.id)
+        by_id[event.id] = event
+        if self.constraints_ready:
+            self.problem.events_by_id[event.id] = event
+        course_key = event.get_course_key()
+        if course_key not in course_lists:
+            course_lists[course_key] = []
+        course_lists[course_key].append(event.id)
+
+    # =====================================================================
+    # Section handlers (same formats and errors as the batch parsers)
+    # =====================================================================
+    def name_line(self, line):
+        if self.problem.name is None:
+            self.problem.name = line
+
+    def lecture_slot_line(self, line):
+        parts = strip_and_split(line, ',')
+        if len(parts) != 5:
+            raise ValueError(f"Invalid lecture slot line format: {line}. Expected 5 fields.")
+        slot = LectureSlot(parts[0], parts[1], int(parts[2]), int(parts[3]), int(parts[4]))
+        self.problem.lec_slots_by_key[slot.slot_key] = slot
+        self.problem.lec_slot_index[(slot.day, slot.start_time)] = slot.slot_key
+
+    def tutorial_slot_line(self, line):
+        parts = strip_and_split(line, ',')
+        if len(parts) != 5:
+            raise ValueError(f"Invalid tutorial slot line format: {line}. Expected 5 fields.")
+        slot = TutorialSlot(parts[0], parts[1], int(parts[2]), int(parts[3]), int(parts[4]))
+        self.problem.tut_slots_by_key[slot.slot_key] = slot
+        self.problem.tut_slot_index[(slot.day, slot.start_time)] = slot.slot_key
+
+    def lecture_line(self, line):
+        parts = strip_and_split(line, ',')
+        if len(parts) != 2:
+            raise ValueError(f"Invalid lecture line format: {line}")
+        event = Event(parts[0], parse_boolean(parts[1]))
+        if not event.is_lecture():
+            raise ValueError(f"Expected lecture but got tutorial: {parts[0]}")
+        self.add_event(event, self.problem.lec_by_id, self.problem.course_list)
+
+    def tutorial_line(self, line):
+        parts = strip_and_split(line, ',')
+        if len(parts) != 2:
+            raise ValueError(f"Invalid tutorial line format: {line}")
+        event = Event(parts[0], parse_boolean(parts[1]))
+        if not event.is_tutorial():
+            raise ValueError(f"Expected tutorial/lab but got lecture: {parts[0]}")
+        self.add_event(event, self.problem.tut_by_id, self.problem.tut_list)
+
+    def event_pair(self, line, what):
+        parts = strip_and_split(line, ',')
+        if len(parts) != 2:
+            raise ValueError(f"Invalid {what} line format: {line}")
+        event_a_id = self.event_id(parts[0])
+        event_b_id = self.event_id(parts[1])
+        if event_a_id not in self.problem.events_by_id:
+            raise ValueError(f"Unknown event in {what}: {event_a_id}")
+        if event_b_id not in self.problem.events_by_id:
+            raise ValueError(f"Unknown event in {what}: {event_b_id}")
+        return event_a_id, event_b_id
+
+    def not_compatible_line(self, line):
+        self.problem.not_compatible.append(NotCompatible(*self.event_pair(line, "not compatible")))
+
+    def pair_line(self, line):
+        self.problem.pairs.append(Pair(*self.event_pair(line, "pair")))
+
+    def unwanted_line(self, line):
+        parts = strip_and_split(line, ',')
+        if len(parts) != 3:
+            raise ValueError(f"Invalid unwanted line format: {line}")
+        event_id = self.event_id(parts[0])
+        event = self.problem.events_by_id.get(event_id)
+        if event is None:
+            raise ValueError(f"Unknown event in unwanted: {event_id}")
+        slot_key = self.slot_key_for(event, parts[1], parts[2])
+        if slot_key is None:
+            raise ValueError(f"Unknown slot ({parts[1]}, {parts[2]}) for event {event_id}")
+        self.problem.unwanted.append(Unwanted(event_id, slot_key))
+
+    def preference_line(self, line):
+        parts = strip_and_split(line, ',')
+        if len(parts) != 4:
+            raise ValueError(f"Invalid preference line format: {line}")
+        event_id = self.event_id(parts[2])
+        value = int(parts[3])
+        event = self.problem.events_by_id.get(event_id)
+        if event is None:
+            print(f"Warning: Unknown event in preferences: {event_id}. Skipping.")
+            return
+        slot_key = self.slot_key_for(event, parts[0], parts[1])
+        if slot_key is None:
+            print(f"Warning: Unknown slot ({parts[0]}, {parts[1]}) for event {event_id}. Skipping.")
+            return
+        self.problem.preferences.append(Preference(event_id, slot_key, value))
+
+    def partial_assignment_line(self, line):
+        parts = strip_and_split(line, ',')
+        if len(parts) != 3:
+            raise ValueError(f"Invalid partial assignment line format: {line}")
+        event_id = self.event_id(parts[0])
+        event = self.problem.events_by_id.get(event_id)
+        if event is None:
+            raise ValueError(f"Unknown event in partial assignment: {event_id}")
+        slot_key = self.slot_key_for(event, parts[1], parts[2])
+        if slot_key is None:
+            raise ValueError(f"Invalid slot ({parts[1]}, {parts[2]}) for event {event_id} in partial assignment")
+        self.problem.partial_assignments.append(PartialAssignment(event_id, slot_key))
+
+
+# main function of the streaming parser, drop-in replacement for parse_input_file
+# returns a ProblemInstance object
+def parse_input_file_streaming(filepath, pen_lecturemin=1, pen_tutorialmin=1,
+                               pen_notpaired=1, pen_section=1,
+                               w_minfilled=1, w_pref=1, w_pair=1, w_secdiff=1):
+    builder = StreamingParser()
+    for line in stream_lines(filepath):
+        builder.feed(line)
+    return builder.finish(
+        pen_lecturemin=pen_lecturemin, pen_tutorialmin=pen_tutorialmin,
+        pen_notpaired=pen_notpaired, pen_section=pen_section,
+        w_minfilled=w_minfilled, w_pref=w_pref, w_pair=w_pair, w_secdiff=w_secdiff
+    )
@@ -0,0 +1,39 @@
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from control.daemon import SolverService, make_server
+
+
+# long-running solver service on localhost (protocol: see control/daemon.py)
+def main(argv=None):
+    cli = argparse.ArgumentParser(usage="python src/solver_daemon.py [options]")
+    cli.add_argument("--host", default="127.0.0.1",
+                     help="address to listen on (default: 127.0.0.1, local clients only)")
+    cli.add_argument("--port", type=int, default=8765,
+                     help="port to listen on (default: 8765)")
+    cli.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                     help="GA jobs that run at the same time, one process each (default: cpu count)")
+    cli.add_argument("--cache-size", type=int, default=16,
+                     help="parsed instances kept in memory (default: 16)")
+    cli.add_argument("--verbose", action="store_true",
+                     help="log every request")
+    args = cli.parse_args(argv)
+
+    service = SolverService(workers=args.workers, cache_size=args.cache_size)
+    server = make_server(service, args.host, args.port, verbose=args.verbose)
+    host, port = server.server_address[:2]
+    print(f"[DAEMON] Listening on http://{host}:{port} with {args.workers} workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[DAEMON] Shutting down.")
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import sys
+import os
+import shutil
+import random
+import tempfile
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.stream import parse_input_file_streaming
+from control.archive import RunArchive, GenerationLog, instance_hash
+from control.sweep import problem_with_weights
+from control.genetic_algorithm import GeneticAlgorithm
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def test_archive_runs():
+    tmp = tempfile.mkdtemp()
+    try:
+        problem = parse_input_file_streaming(os.path.join(project_root, "input", "deptinst1.txt"))
+        random.seed(1)
+        ga = GeneticAlgorithm(problem, population_size=20, max_generations=50)
+        log = GenerationLog(10)
+        schedule, soft, hard, _ = ga.run(print_interval=1000, telemetry=log)
+        check(len(log.rows) == 5 and log.rows[-1][0] == 40, "summary every 10 generations")
+
+        path = os.path.join(tmp, "archive.sqlite")
+        with RunArchive(path) as archive:
+            check(archive.best_known(problem) is None, "empty archive")
+            first = archive.record_run(problem, schedule, hard, soft, generations=ga.generation,
+                                       seed=1, history=log)
+            worse = archive.record_run(problem, schedule, hard, soft + 100)
+
+        # a new connection sees the same runs
+        with RunArchive(path) as archive:
+            best, best_hard, best_soft, run_id = archive.best_known(problem)
+            check(run_id == first and (best_hard, best_soft) == (hard, soft), "lowest score wins")
+            check(all(best.get_assignment(e) == schedule.get_assignment(e)
+                      for e in problem.events_by_id.values()), "schedule decodes unchanged")
+            check([r["id"] for r in archive.runs(problem)] == [worse, first], "runs listed newest first")
+            check(len(archive.history(first)) == 5 and archive.history(worse) == [], "history per run")
+
+            reweighted = problem_with_weights(problem, (1, 5, 1, 1, 10, 10, 10, 10))
+            check(instance_hash(reweighted) == instance_hash(problem), "weights are not part of the hash")
+            check(archive.best_known(reweighted) is None, "other weights: no comparable run")
+            check(archive.best_known(reweighted, any_weights=True)[3] == first, "any weights: warm start found")
+
+            problem.unwanted = problem.unwanted[1:]
+            check(instance_hash(problem) != instance_hash(reweighted), "edited constraints change the hash")
+            check(archive.best_known(problem, any_weights=True) is None, "edited instance has no runs")
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == "__main__":
+    test_archive_runs()
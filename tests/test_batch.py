@@ -0,0 +1,82 @@
+import sys
+import os
+import shutil
+import tempfile
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from control.batch import run_batch, read_table
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def test_batch_and_resume():
+    tmp = tempfile.mkdtemp()
+    try:
+        instances = [os.path.join(project_root, "input", name) for name in ("HC1-LS.txt", "HC14-SPTU.txt")]
+        weights = [(1, 1, 1, 1, 10, 10, 10, 10), (1, 5, 1, 1, 10, 10, 10, 10)]
+        ga_params = {"population_size": 10, "max_generations": 20}
+
+        for output in (os.path.join(tmp, "results.csv"), os.path.join(tmp, "results.json")):
+            rows = run_batch(instances, weights, [1, 2], output, workers=1, ga_params=ga_params)
+            check(len(rows) == 8 and len(read_table(output)) == 8, f"{os.path.basename(output)}: one row per run")
+
+            ok = [r for r in read_table(output) if r["status"] == "ok"]
+            failed = [r for r in read_table(output) if r["status"] != "ok"]
+            check(len(ok) == 4 and all(int(r["generations"]) > 0 for r in ok), "results recorded")
+            check(len(failed) == 4 and all("SystemExit" in r["error"] for r in failed), "failed runs recorded, not fatal")
+
+            # same seed, same result
+            again = run_batch(instances[:1], weights[:1], [1], os.path.join(tmp, "again" + os.path.splitext(output)[1]),
+                              workers=1, ga_params=ga_params)
+            first = [r for r in ok if r["weights"] == "1 1 1 1 10 10 10 10" and r["seed"] == 1][0]
+            check(str(again[0]["soft"]) == str(first["soft"]), "seeded runs are reproducible")
+
+            # resume: finished runs are skipped, failed runs repeated, new seeds added
+            new_rows = []
+            rows = run_batch(instances, weights[:1], [1, 2, 3], output, workers=1, ga_params=ga_params,
+                             on_row=new_rows.append)
+            check(len(new_rows) == 4, "only failed and missing runs are run again")
+            check(len(rows) == 10, "other rows are kept")
+    finally:
+        shutil.rmtree(tmp)
+
+
+def test_same_name_in_two_directories():
+    tmp = tempfile.mkdtemp()
+    try:
+        paths = []
+        for folder in ("a", "b"):
+            os.makedirs(os.path.join(tmp, folder))
+            paths.append(os.path.join(tmp, folder, "instance.txt"))
+        shutil.copy(os.path.join(project_root, "input", "input2.txt"), paths[0])
+        shutil.copy(os.path.join(project_root, "input", "SC1-MINF.txt"), paths[1])
+
+        output = os.path.join(tmp, "results.csv")
+        ga_params = {"population_size": 10, "max_generations": 20}
+        rows = run_batch(paths, [(1, 1, 1, 1, 10, 10, 10, 10)], [1], output, workers=1, ga_params=ga_params)
+        check(len(rows) == 2 and len({r["instance"] for r in rows}) == 2, "same-named instances get a row each")
+
+        # another spelling of the same files finds their rows
+        again = [os.path.join(tmp, folder, os.pardir, folder, "instance.txt") for folder in ("a", "b")]
+        new_rows = []
+        run_batch(again, [(1, 1, 1, 1, 10, 10, 10, 10)], [1], output, workers=1, ga_params=ga_params,
+                  on_row=new_rows.append)
+        check(new_rows == [], "runs are matched by normalized path")
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == "__main__":
+    test_batch_and_resume()
+    test_same_name_in_two_directories()
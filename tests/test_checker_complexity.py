@@ -0,0 +1,70 @@
+import sys
+import os
+
+# add src and benchmarks directories to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+sys.path.insert(0, os.path.join(project_root, 'benchmarks'))
+
+from checker_complexity import CHECKERS, measure, fit_exponent
+from eval.hard_constraints import _events_in_slot
+
+# allowed growth of a checker's cost in the number of events / slots; the
+# cost is counted in traced Python operations, so the fits are exact and
+# do not depend on the machine's load
+MAX_EXPONENT = 1.5
+MAX_SLOT_EXPONENT = 0.5
+SIZES = [50, 100, 200, 400]
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def test_fit_exponent():
+    sizes = [10, 20, 40, 80]
+    check(abs(fit_exponent(sizes, [n * 1e-6 for n in sizes]) - 1) < 1e-9, "linear data fits n^1")
+    check(abs(fit_exponent(sizes, [n * n * 1e-6 for n in sizes]) - 2) < 1e-9, "quadratic data fits n^2")
+
+
+def test_checkers_stay_linear():
+    results = measure(SIZES, operations=True)
+    for name, _ in CHECKERS:
+        row = results["checkers"][name]
+        check(row["exponent"] <= MAX_EXPONENT, f"{name}: n^{row['exponent']} in events")
+        check(row["slot_exponent"] <= MAX_SLOT_EXPONENT, f"{name}: n^{row['slot_exponent']} in slots")
+
+
+def test_quadratic_checker_detected():
+    # compares every assignment with every other one, like a naive pairwise check
+    def quadratic_check(schedule, problem):
+        items = list(schedule.assignments.items())
+        return sum(1 for _, a in items for _, b in items if a is b)
+
+    results = measure(SIZES[:3], checkers=(("quadratic", quadratic_check),), slot_shares=(), operations=True)
+    exponent = results["checkers"]["quadratic"]["exponent"]
+    check(exponent > MAX_EXPONENT, f"naive pairwise check flagged (n^{exponent})")
+
+
+def test_per_slot_scan_detected():
+    # scans the whole schedule once per slot, like a naive capacity check (O(S * E))
+    def per_slot_check(schedule, problem):
+        keys = list(problem.lec_slots_by_key) + list(problem.tut_slots_by_key)
+        return sum(len(_events_in_slot(schedule, key)) for key in keys)
+
+    results = measure(SIZES[:2], checkers=(("per_slot", per_slot_check),), operations=True)
+    exponent = results["checkers"]["per_slot"]["slot_exponent"]
+    check(exponent > MAX_SLOT_EXPONENT, f"per-slot scan flagged (n^{exponent} in slots)")
+
+
+if __name__ == "__main__":
+    test_fit_exponent()
+    test_checkers_stay_linear()
+    test_quadratic_checker_detected()
+    test_per_slot_scan_detected()
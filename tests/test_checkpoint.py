@@ -0,0 +1,185 @@
+import sys
+import os
+import gzip
+import json
+import time
+import random
+import tempfile
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.parser import parse_input_file
+from model.encoding import ScheduleCodec
+from model.initial_state import generate_initial_state
+from control.genetic_algorithm import GeneticAlgorithm
+from control.checkpoint import load_checkpoint, CHECKPOINT_VERSION
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def load(name, w_pref=1):
+    return parse_input_file(
+        os.path.join(project_root, "input", name),
+        pen_lecturemin=10,
+        pen_tutorialmin=10,
+        pen_notpaired=10,
+        pen_section=10,
+        w_minfilled=1,
+        w_pref=w_pref,
+        w_pair=1,
+        w_secdiff=1,
+    )
+
+
+def test_codec_roundtrip():
+    problem = load("deptinst1.txt")
+    codec = ScheduleCodec(problem)
+    schedule = generate_initial_state(problem, 1, seed=4)[0][0]
+    decoded = codec.decode(codec.encode(schedule))
+    check(list(decoded.assignments.items()) == list(schedule.assignments.items()), "order and slots survive")
+    check(len(codec.encode(schedule)) == 4 * schedule.count_assignments(), "4 bytes per assignment")
+
+
+def test_resume_is_bit_for_bit():
+    problem = load("input2.txt")
+    params = dict(max_generations=900, plateau_limit=10000, population_size=20, polish_interval=100)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ga.json.gz")
+
+        # uninterrupted run, checkpointing along the way (last one at gen 600)
+        random.seed(11)
+        full = GeneticAlgorithm(problem, **params)
+        full_result = full.run(print_interval=1000, checkpoint_path=path, checkpoint_interval=300)
+
+        state = load_checkpoint(path, problem)
+        check(state["counters"]["generation"] == 600, "last checkpoint taken at generation 600")
+
+        # fresh GA (other bounds, other RNG state) continued from the checkpoint
+        random.seed(999)
+        resumed = GeneticAlgorithm(problem, max_generations=5)
+        resumed_result = resumed.run(print_interval=1000, resume=state)
+
+        codec = ScheduleCodec(problem)
+        check(resumed.generation == full.generation, "same final generation")
+        check(resumed_result[1:] == full_result[1:], "same soft / hard / fitness")
+        check(codec.encode(resumed_result[0]) == codec.encode(full_result[0]), "same best schedule")
+        check(resumed.operator_stats == full.operator_stats, "same operator statistics")
+
+        # a checkpoint cannot be applied to other weights
+        try:
+            load_checkpoint(path, load("input2.txt", w_pref=5))
+            check(False, "mismatched checkpoint rejected")
+        except ValueError:
+            check(True, "mismatched checkpoint rejected")
+
+
+def test_resume_with_restarts_and_hall_of_fame():
+    problem = load("input2.txt")
+    params = dict(max_generations=900, plateau_limit=50, population_size=20, polish_interval=100,
+                  restart="reseed", max_valid_solutions=4, solution_distance=2)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ga.json.gz")
+
+        random.seed(12)
+        full = GeneticAlgorithm(problem, **params)
+        full_result = full.run(print_interval=1000, checkpoint_path=path, checkpoint_interval=300)
+        state = load_checkpoint(path, problem)
+        check(state["counters"]["restarts"] > 0 and state["hall_of_fame"]["members"], "restarts and alternatives saved")
+
+        random.seed(999)
+        resumed = GeneticAlgorithm(problem, max_generations=5)
+        resumed_result = resumed.run(print_interval=1000, resume=state)
+
+        codec = ScheduleCodec(problem)
+        check(full.restarts > state["counters"]["restarts"], "restarts after the checkpoint")
+        check(resumed_result[1:] == full_result[1:] and resumed.operator_stats == full.operator_stats,
+              "resumed run identical")
+        check(resumed.restarts == full.restarts, "same restarts")
+        check([(codec.encode(s), soft) for s, soft in resumed.hall_of_fame.solutions()]
+              == [(codec.encode(s), soft) for s, soft in full.hall_of_fame.solutions()], "same hall of fame")
+
+
+def test_resume_with_adaptive_mutation():
+    problem = load("deptinst1.txt")
+    params = dict(max_generations=700, plateau_limit=10000, population_size=20, polish_interval=0,
+                  adaptive_mutation=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ga.json.gz")
+
+        random.seed(13)
+        full = GeneticAlgorithm(problem, **params)
+        full_result = full.run(print_interval=1000, checkpoint_path=path, checkpoint_interval=450)
+        state = load_checkpoint(path, problem)
+        check(state["counters"]["mutation_rate"] > full.p_mutation, "adapted mutation rate saved")
+
+        random.seed(999)
+        resumed = GeneticAlgorithm(problem, max_generations=5)
+        resumed_result = resumed.run(print_interval=1000, resume=state)
+
+        check(resumed.initial_diversity == full.initial_diversity, "same reference diversity")
+        check(resumed.mutation_rate == full.mutation_rate, "same mutation rate")
+        check(resumed_result[1:] == full_result[1:] and resumed.operator_stats == full.operator_stats,
+              "resumed run identical")
+
+
+def test_old_checkpoint_rejected():
+    problem = load("input2.txt")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ga.json.gz")
+        random.seed(1)
+        GeneticAlgorithm(problem, max_generations=20, population_size=10).run(
+            print_interval=1000, checkpoint_path=path, checkpoint_interval=10
+        )
+        with open(path, "rb") as f:
+            state = json.loads(gzip.decompress(f.read()))
+        state["version"] = CHECKPOINT_VERSION - 1
+        with open(path, "wb") as f:
+            f.write(gzip.compress(json.dumps(state).encode()))
+        try:
+            load_checkpoint(path, problem)
+            check(False, "old checkpoint version rejected")
+        except ValueError:
+            check(True, "old checkpoint version rejected")
+
+
+def test_time_limit_and_snapshots():
+    problem = load("deptinst1.txt")
+    snapshots = []
+
+    random.seed(5)
+    ga = GeneticAlgorithm(problem, population_size=30, polish_interval=0, time_limit=1.5)
+    started = time.perf_counter()
+    _, soft, hard, fit = ga.run(
+        print_interval=100000,
+        on_improvement=lambda *best: snapshots.append(best),
+        snapshot_interval=0.5
+    )
+    elapsed = time.perf_counter() - started
+
+    check(elapsed < 4, f"time limit respected ({elapsed:.1f}s)")
+    check(ga.generation < ga.max_generations - 1, "stopped by the clock, not the generation bound")
+    check(len(snapshots) >= 1, f"{len(snapshots)} snapshots reported")
+    check([s[3] for s in snapshots] == sorted({s[3] for s in snapshots}), "snapshots only on improvement")
+    check(snapshots[-1][3] <= fit, "last snapshot is never better than the result")
+
+
+if __name__ == "__main__":
+    test_codec_roundtrip()
+    test_resume_is_bit_for_bit()
+    test_resume_with_restarts_and_hall_of_fame()
+    test_resume_with_adaptive_mutation()
+    test_old_checkpoint_rejected()
+    test_time_limit_and_snapshots()
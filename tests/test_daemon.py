@@ -0,0 +1,88 @@
+import sys
+import os
+import json
+import threading
+import urllib.request
+import urllib.error
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from control.daemon import SolverService, make_server
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def request(base, method, path, body=None):
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(base + path, method=method, data=data, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req, timeout=60) as f:
+            return f.status, json.loads(f.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_daemon_jobs():
+    service = SolverService(workers=1)
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with open(os.path.join(project_root, "input", "deptinst1.txt")) as f:
+            text = f.read()
+
+        code, first = request(base, "POST", "/jobs", {
+            "instance": text, "weights": [1, 1, 1, 1, 10, 10, 10, 10],
+            "ga": {"population_size": 20, "max_generations": 100},
+        })
+        check(code == 202 and "id" in first, "job submitted")
+
+        # one worker: the second job waits in the queue until it is cancelled
+        _, second = request(base, "POST", "/jobs", {
+            "instance": text, "ga": {"population_size": 20, "max_generations": 1000000},
+        })
+        check(len(service.instances) == 1, "instance parsed once for both jobs")
+        check(service.status(second["id"])["status"] == "queued", "second job queued behind the first")
+
+        with urllib.request.urlopen(f"{base}/jobs/{first['id']}/stream", timeout=60) as f:
+            lines = [json.loads(line) for line in f]
+        check(lines[-1]["status"] == "done", "stream ends with the final status")
+        check(all("soft" in line for line in lines[:-1]), "stream lines are best-so-far updates")
+
+        _, status = request(base, "GET", f"/jobs/{first['id']}")
+        check(status["status"] == "done", "job done")
+        check(len(status["result"]["schedule"]) == 185, "result holds the whole schedule")
+
+        check(service.wait(second["id"], timeout=0.5) is None, "second job still running")
+        code, body = request(base, "DELETE", f"/jobs/{second['id']}")
+        check(code == 200 and body["cancelled"], "running job cancelled")
+        check(service.status(second["id"])["status"] == "cancelled", "cancelled status")
+
+        code, _ = request(base, "GET", "/jobs/nope")
+        check(code == 404, "unknown job is 404")
+        code, body = request(base, "POST", "/jobs", {"instance": text, "weights": [1, 2]})
+        check(code == 400 and "weights" in body["error"], "bad request is 400")
+        for bad in ([text], 5, {"instance": text, "ga": 5}, {"instance": text, "weights": [[1]] * 8}):
+            code, body = request(base, "POST", "/jobs", bad)
+            check(code == 400 and "error" in body, f"malformed body {json.dumps(bad)[:30]} is 400")
+        check(service.wait("nope", timeout=0.1) is None, "waiting for an unknown job returns None")
+        check(service.context.get_start_method() != "fork", "workers are not forked from the threaded service")
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    test_daemon_jobs()
@@ -0,0 +1,99 @@
+import sys
+import os
+import time
+import random
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.parser import parse_input_file
+from model.domains import compute_domains
+from model.constraint_graph import build_constraint_graph, connected_components
+from eval.hard_constraints import Valid
+from control.decomposition import allocate_budgets, build_subproblem, solve_decomposed
+import control.decomposition as decomposition
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def load(name):
+    return parse_input_file(
+        os.path.join(project_root, "input", name),
+        pen_lecturemin=10,
+        pen_tutorialmin=10,
+        pen_notpaired=10,
+        pen_section=10,
+        w_minfilled=1,
+        w_pref=1,
+        w_pair=1,
+        w_secdiff=1,
+    )
+
+
+def test_components_and_budgets():
+    problem = load("deptinst1.txt")
+    components = connected_components(build_constraint_graph(problem))
+
+    check(sum(len(c) for c in components) == len(problem.events_by_id), "components cover every event once")
+    check(len(components) > 1, f"deptinst1 splits into {len(components)} components")
+
+    budgets = allocate_budgets(problem, components, compute_domains(problem))
+    check(budgets is not None, "capacities can be split")
+
+    for key, slot in problem.lec_slots_by_key.items():
+        check(sum(b[key][0] for b in budgets) <= slot.lecture_max, f"lecture budget of {key} within max")
+    for key, slot in problem.tut_slots_by_key.items():
+        check(sum(b[key][2] for b in budgets) <= slot.al_tutorial_max, f"AL budget of {key} within AL max")
+
+    sub = build_subproblem(problem, components[0], budgets[0], 0)
+    check(set(sub.events_by_id) == set(components[0]), "sub-problem holds exactly its component")
+    check(all(c.event_a_id in sub.events_by_id for c in sub.not_compatible), "constraints filtered to the component")
+
+
+def test_solve_and_fallback():
+    random.seed(3)
+    params = dict(max_generations=600, population_size=30, polish_interval=100)
+
+    problem = load("input2.txt")
+    result = solve_decomposed(problem, workers=1, ga_params=params, seed=3)
+    check(result is not None, "input2 solved by components")
+    schedule, soft, hard, _ = result
+    check(hard == 0 and Valid(schedule, problem) == 0, "stitched schedule is valid")
+    check(schedule.count_assignments() == 15, "every event assigned once")
+
+    # STARTER is one big component plus a tiny one -> too coupled
+    check(solve_decomposed(load("STARTER.txt"), workers=1, ga_params=params) is None, "falls back when coupled")
+
+
+def test_deadline_bounds_every_component():
+    random.seed(3)
+    # generation budgets far beyond the deadline: only the deadline can stop the components
+    params = dict(max_generations=10 ** 7, plateau_limit=10 ** 7, population_size=30, polish_interval=0)
+    problem = load("input2.txt")
+
+    # every component goes to the GA; with the deadline already passed, none may search
+    exact_limit = decomposition.EXACT_EVENT_LIMIT
+    decomposition.EXACT_EVENT_LIMIT = 0
+    try:
+        started = time.time()
+        result = solve_decomposed(problem, workers=1, ga_params=params, seed=3, deadline=started - 1.0)
+        elapsed = time.time() - started
+    finally:
+        decomposition.EXACT_EVENT_LIMIT = exact_limit
+    check(elapsed < 2.0, f"components stop at the shared deadline ({elapsed:.2f}s)")
+    check(result is None or result[3] <= 1, "no component runs generations past the deadline")
+
+
+if __name__ == "__main__":
+    test_components_and_budgets()
+    test_solve_and_fallback()
+    test_deadline_bounds_every_component()
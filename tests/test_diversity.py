@@ -0,0 +1,61 @@
+import sys
+import os
+import random
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.stream import parse_input_file_streaming
+from model.initial_state import generate_initial_state
+from control.genetic_algorithm import GeneticAlgorithm
+from control.diversity import population_diversity, PopulationEncoder
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def test_metrics():
+    problem = parse_input_file_streaming(os.path.join(project_root, "input", "deptinst1.txt"))
+    population = generate_initial_state(problem, 40, w_hard=3000, w_soft=1, seed=5)
+
+    # mean pairwise distance against the direct O(n^2) computation
+    rows = [PopulationEncoder(problem).row(schedule) for schedule, _, _, _ in population]
+    pairs = [(a, b) for i, a in enumerate(rows) for b in rows[i + 1:]]
+    expected = sum(sum(1 for x, y in zip(a, b) if x != y) for a, b in pairs) / (len(pairs) * len(rows[0]))
+    metrics = population_diversity(population, problem)
+    check(abs(metrics["mean_distance"] - expected) < 1e-6, "mean pairwise distance")
+    check(metrics["entropy"] > 0 and 1 < metrics["clusters"] <= 40, "random population is diverse")
+
+    converged = [population[0]] * 40
+    check(population_diversity(converged, problem) == {"mean_distance": 0.0, "entropy": 0.0, "clusters": 1},
+          "identical population: no diversity, one cluster")
+
+
+def test_diversity_policies():
+    problem = parse_input_file_streaming(os.path.join(project_root, "input", "deptinst1.txt"))
+
+    random.seed(6)
+    ga = GeneticAlgorithm(problem, population_size=20, max_generations=601, plateau_limit=100000,
+                          adaptive_mutation=True)
+    ga.run(print_interval=10000)
+    check(ga.diversity["mean_distance"] < ga.initial_diversity, "population converges")
+    check(ga.mutation_rate > ga.p_mutation, "mutation rate rises as diversity is lost")
+
+    random.seed(6)
+    ga = GeneticAlgorithm(problem, population_size=20, max_generations=601, plateau_limit=100000,
+                          restart="hypermutate", min_diversity=0.5)
+    ga.run(print_interval=10000)
+    check(ga.restarts > 0, "low diversity triggers a restart")
+
+
+if __name__ == "__main__":
+    test_metrics()
+    test_diversity_policies()
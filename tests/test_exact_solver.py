@@ -0,0 +1,90 @@
+import sys
+import os
+import random
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.parser import parse_input_file
+from parser.constraint import Preference
+from model.schedule import Schedule
+from eval.eval import eval as soft_eval
+from eval.hard_constraints import Valid
+from control.branch_and_bound import BranchAndBound, solve_exact
+from control.genetic_algorithm import GeneticAlgorithm
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def load(name):
+    return parse_input_file(
+        os.path.join(project_root, "input", name),
+        pen_lecturemin=10,
+        pen_tutorialmin=10,
+        pen_notpaired=10,
+        pen_section=10,
+        w_minfilled=1,
+        w_pref=1,
+        w_pair=1,
+        w_secdiff=1,
+    )
+
+
+def test_small_instances_solved_exactly():
+    for name in ["SC1-MINF.txt", "SC2-SECD.txt", "SC3-PREF.txt", "SC4-PAIR.txt", "input2.txt"]:
+        problem = load(name)
+        schedule, soft, complete = solve_exact(problem)
+        check(complete and schedule is not None, f"{name}: optimum proven")
+        check(Valid(schedule, problem) == 0, f"{name}: optimal schedule is valid")
+        check(soft == soft_eval(schedule, problem), f"{name}: reported soft matches eval")
+
+
+def test_preferences_match_day_and_time():
+    # eval_pref compares day and time only; the kind in a preference's slot key must not matter
+    problem = load("SC3-PREF.txt")
+    _, expected_soft, _ = solve_exact(problem)
+    swapped = {"LEC": "TUT", "TUT": "LEC"}
+    problem.preferences = [
+        Preference(pref.event_id, (swapped[pref.slot_key[0]],) + tuple(pref.slot_key[1:]), pref.value)
+        for pref in problem.preferences
+    ]
+    schedule, soft, complete = solve_exact(problem)
+    check(complete and soft == soft_eval(schedule, problem), "reported soft matches eval with other-kind keys")
+    check(soft == expected_soft, "same optimum whatever the kind in the preference keys")
+
+
+def test_infeasible_instances_proven():
+    for name in ["HC11-EV.txt", "HC6-NC1.txt"]:
+        schedule, _, complete = solve_exact(load(name))
+        check(complete and schedule is None, f"{name}: proven infeasible")
+
+
+def test_budget_exhausted_and_seeding():
+    problem = load("deptinst1.txt")
+    solver = BranchAndBound(problem, node_limit=50)
+    _, _, complete = solver.solve(Schedule(), problem.get_all_event_ids())
+    check(not complete, "node limit stops the search without a proof")
+
+    # a seeded schedule ends up in the GA's initial population
+    random.seed(1)
+    small = load("input2.txt")
+    seed_schedule, seed_soft, _ = solve_exact(small)
+    ga = GeneticAlgorithm(small, max_generations=1, population_size=10, polish_interval=0)
+    _, best_soft, best_hard, _ = ga.run(print_interval=10, seed_schedules=[seed_schedule])
+    check(best_hard == 0 and best_soft <= seed_soft, "GA keeps the seeded optimum")
+
+
+if __name__ == "__main__":
+    test_small_instances_solved_exactly()
+    test_preferences_match_day_and_time()
+    test_infeasible_instances_proven()
+    test_budget_exhausted_and_seeding()
@@ -0,0 +1,71 @@
+import sys
+import os
+import random
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.stream import parse_input_file_streaming
+from parser.event import EVENT_KIND_LECTURE
+from eval.hard_constraints import Valid
+from control.genetic_algorithm import GeneticAlgorithm
+from control.hall_of_fame import HallOfFame
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def distance(a, b):
+    return sum(1 for event, slot in a.assignments.items() if b.get_assignment(event) != slot)
+
+
+def test_alternative_solutions():
+    problem = parse_input_file_streaming(os.path.join(project_root, "input", "input2.txt"))
+    random.seed(3)
+    ga = GeneticAlgorithm(problem, max_valid_solutions=4, solution_distance=2, population_size=30,
+                          max_generations=3000, time_limit=20)
+    _, best_soft, best_hard, _ = ga.run(print_interval=10000)
+
+    solutions = ga.hall_of_fame.solutions()
+    check(best_hard == 0 and 1 < len(solutions) <= 4, "several alternatives kept, at most k")
+    check(solutions[0][1] == best_soft, "first alternative is the best schedule")
+    check([soft for _, soft in solutions] == sorted(soft for _, soft in solutions), "best first")
+    check(all(Valid(schedule, problem) == 0 for schedule, _ in solutions), "all alternatives valid")
+    check(all(distance(a, b) >= 2 for i, (a, _) in enumerate(solutions) for b, _ in solutions[i + 1:]),
+          "alternatives pairwise at least min_distance apart")
+
+
+def test_admission_rules():
+    problem = parse_input_file_streaming(os.path.join(project_root, "input", "input2.txt"))
+    random.seed(3)
+    ga = GeneticAlgorithm(problem, population_size=30, max_generations=3000, time_limit=20)
+    schedule, soft, _, _ = ga.run(print_interval=10000)
+
+    # a neighbour: one event moved to another slot of its kind
+    event = next(e for e in schedule.assignments if e.kind == EVENT_KIND_LECTURE)
+    other = next(s for s in problem.lec_slots_by_key.values() if s != schedule.get_assignment(event))
+    neighbour = schedule.copy()
+    neighbour.assign(event, other)
+
+    hof = HallOfFame(problem, 2, min_distance=2)
+    check(hof.offer(schedule, soft) and not hof.offer(schedule.copy(), soft), "duplicates rejected")
+    check(not hof.offer(neighbour, soft + 1), "worse schedule too close to a member rejected")
+    check(hof.offer(neighbour, soft - 1) and len(hof) == 1, "better close schedule replaces the member")
+
+    hof = HallOfFame(problem, 1, min_distance=1)
+    hof.offer(schedule, soft)
+    check(not hof.offer(neighbour, soft) and hof.offer(neighbour, soft - 1), "full: only better ones get in")
+    check(hof.solutions()[0][1] == soft - 1 and hof.worst() == soft - 1, "worst member evicted")
+
+
+if __name__ == "__main__":
+    test_alternative_solutions()
+    test_admission_rules()
@@ -0,0 +1,128 @@
+import sys
+import os
+import random
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.parser import parse_input_file
+from model.initial_state import generate_initial_state
+from eval.eval import eval as soft_eval
+from eval.selection import fitness
+from control.incremental import InstanceDelta, apply_delta, update_population
+from control.genetic_algorithm import GeneticAlgorithm
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def load():
+    return parse_input_file(os.path.join(project_root, "input", "deptinst1.txt"), 1, 1, 1, 1, 10, 10, 10, 10)
+
+
+def scores_current(population, problem):
+    return all(
+        (ev, fit) == fitness((s, soft_eval(s, problem), 0, 0), problem, 3000, 1)[1:3]
+        for s, ev, fit, _ in population
+    )
+
+
+def test_only_affected_rescored():
+    random.seed(7)
+    problem = load()
+    population = generate_initial_state(problem, 20, w_hard=3000, w_soft=1)
+
+    # a preference for the slot the first individual gives this lecture
+    event = problem.get_event("CPSC 231 LEC 01")
+    slot = population[0][0].get_assignment(event)
+    expected = sum(1 for s, _, _, _ in population if s.get_assignment(event) is not slot)
+
+    applied = apply_delta(problem, InstanceDelta(add_preferences=[(slot.day, slot.start_time, event.id, 50)]))
+    population, rescored = update_population(population, problem, applied, 3000, 1)
+    check(rescored == expected, f"only individuals missing the preference re-scored ({rescored})")
+    check(scores_current(population, problem), "cached scores match a full evaluation")
+
+
+def test_add_and_remove_events():
+    random.seed(8)
+    problem = load()
+    population = generate_initial_state(problem, 10, w_hard=3000, w_soft=1)
+    pairs_before = len(problem.not_compatible)
+
+    delta = InstanceDelta(
+        add_lectures=[("CPSC 998 LEC 01", False)],
+        add_tutorials=[("CPSC 998 LEC 01 TUT 01", False)],
+        remove_events=["CPSC 233 TUT 02"],
+        slot_capacities={("LEC", "MO", "8:00"): (1, 0, 0)},
+    )
+    applied = apply_delta(problem, delta)
+    check("CPSC 233 TUT 02" not in problem.events_by_id, "event removed")
+    check("CPSC 233 TUT 02" not in problem.tut_list[("CPSC", 233)], "event removed from its course")
+    check(len(problem.not_compatible) < pairs_before, "constraints of the removed event removed")
+    check(("CPSC", 998) in problem.course_list and ("CPSC", 998) in problem.tut_list, "new course listed")
+    check(problem.get_slot(("LEC", "MO", "8:00")).lecture_max == 1, "slot capacity changed in place")
+
+    population, rescored = update_population(population, problem, applied, 3000, 1)
+    check(rescored == len(population), "every individual re-scored")
+    check(
+        all(set(s.assignments) == set(problem.events_by_id.values()) for s, _, _, _ in population),
+        "schedules hold exactly the new events",
+    )
+    check(scores_current(population, problem), "cached scores match a full evaluation")
+
+    try:
+        apply_delta(problem, InstanceDelta(add_not_compatible=[("CPSC 233 TUT 02", "CPSC 231 LEC 01")]))
+        check(False, "unknown event rejected")
+    except ValueError as e:
+        check("Unknown event in not compatible" in str(e), "unknown event rejected")
+
+
+def test_special_tutorial_added():
+    random.seed(10)
+    # input2 has CPSC 413 (and so CPSC 913 TUT 01) but no CPSC 351
+    problem = parse_input_file(os.path.join(project_root, "input", "input2.txt"), 1, 1, 1, 1, 10, 10, 10, 10)
+    population = generate_initial_state(problem, 10, w_hard=3000, w_soft=1)
+
+    applied = apply_delta(problem, InstanceDelta(add_lectures=[("CPSC 351 LEC 01", False)]))
+    special = problem.get_event("CPSC 851 TUT 01")
+    check(special is not None and special.is_special_tut, "first CPSC 351 lecture adds CPSC 851 TUT 01")
+    check(applied.added == ["CPSC 351 LEC 01", "CPSC 851 TUT 01"], "special tutorial reported as added")
+    check(problem.tut_list[("CPSC", 851)] == ["CPSC 851 TUT 01"], "special tutorial listed under its course")
+
+    population, _ = update_population(population, problem, applied, 3000, 1)
+    check(
+        all((s.get_assignment(special).day, s.get_assignment(special).start_time) == ("TU", "18:00")
+            for s, _, _, _ in population),
+        "special tutorial placed at TU 18:00",
+    )
+    check(scores_current(population, problem), "cached scores match a full evaluation")
+
+    applied = apply_delta(problem, InstanceDelta(add_lectures=[("CPSC 351 LEC 02", False)]))
+    check(applied.added == ["CPSC 351 LEC 02"], "special tutorial added only once")
+
+
+def test_live_ga_continues():
+    random.seed(9)
+    problem = load()
+    ga = GeneticAlgorithm(problem, population_size=20, max_generations=50)
+    ga.run(print_interval=1000)
+
+    ga.apply_delta(InstanceDelta(add_lectures=[("CPSC 998 LEC 01", False)]))
+    schedule, soft, hard, _ = ga.run(print_interval=1000, initial_population=ga.population)
+    check(schedule.count_assignments() == len(problem.events_by_id), "continued run schedules the new event")
+    check(soft == soft_eval(schedule, problem), "continued run reports the new instance's eval")
+
+
+if __name__ == "__main__":
+    test_only_affected_rescored()
+    test_add_and_remove_events()
+    test_special_tutorial_added()
+    test_live_ga_continues()
@@ -0,0 +1,67 @@
+import sys
+import os
+import tempfile
+
+# add src and benchmarks directories to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+sys.path.insert(0, os.path.join(project_root, 'benchmarks'))
+
+from parser.parser import parse_input_file
+from eval.presolve import presolve
+from generate_instance import generate_instance, write_instance
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def generate_and_parse(**params):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.txt")
+        write_instance(path, **params)
+        return parse_input_file(path)
+
+
+def test_sizes_match_parameters():
+    problem = generate_and_parse(courses=30, sections_per_course=3, tutorials_per_section=2, seed=1)
+    special = sum(1 for event in problem.events_by_id.values() if event.is_special_tut)
+
+    check(len(problem.lec_by_id) == 90, "3 sections for each of 30 courses")
+    check(len(problem.tut_by_id) - special == 180, "2 tutorials per section")
+    check(len(problem.lec_slots_by_key) == 21 and len(problem.tut_slots_by_key) == 32, "full slot grids by default")
+
+
+def test_constraints_parsed():
+    problem = generate_and_parse(
+        courses=40, not_compatible_density=1.0, unwanted_density=0.5, preference_density=1.0,
+        pair_density=0.2, partial_fraction=0.05, lecture_slots=10, tutorial_slots=12, seed=2,
+    )
+    check(len(problem.lec_slots_by_key) == 10, "lecture slot count")
+    check(("TUT", "TU", "18:00") in problem.tut_slots_by_key, "special tutorial slot always present")
+    check(len(problem.not_compatible) > 0 and len(problem.pairs) > 0, "not-compatible and pair lines")
+    check(len(problem.unwanted) > 0 and len(problem.preferences) > 0, "unwanted and preference lines")
+    check(len(problem.partial_assignments) > 0, "partial assignments")
+
+
+def test_deterministic_and_feasible_by_default():
+    check(generate_instance(courses=50, seed=3) == generate_instance(courses=50, seed=3), "same seed, same file")
+    check(generate_instance(courses=50, seed=3) != generate_instance(courses=50, seed=4), "other seed, other file")
+
+    problem = generate_and_parse(courses=150, seed=5)
+    check(presolve(problem) == [], "default instance passes presolve")
+
+    graduate = [event for event in problem.lec_by_id.values() if event.is_500_course]
+    check(len(graduate) <= len(problem.lec_slots_by_key), "500-level lectures fit in distinct slots")
+
+
+if __name__ == "__main__":
+    test_sizes_match_parameters()
+    test_constraints_parsed()
+    test_deterministic_and_feasible_by_default()
@@ -0,0 +1,60 @@
+import sys
+import os
+import random
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.stream import parse_input_file_streaming
+from eval.selection import fitness_from_scores
+from control.genetic_algorithm import GeneticAlgorithm
+import control.genetic_algorithm as genetic_algorithm
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def test_weighted_gate():
+    problem = parse_input_file_streaming(os.path.join(project_root, "input", "deptinst2.txt"))
+    random.seed(8)
+    ga = GeneticAlgorithm(problem, population_size=30, max_generations=1500, polish_interval=0)
+
+    # every gate decision, with the population's worst fitness at that moment
+    decisions = []
+    gate = ga.hard_dominated
+
+    def recording_gate(child_hard, population):
+        skipped = gate(child_hard, population)
+        decisions.append((child_hard, min(x[2] for x in population), len(population), skipped))
+        return skipped
+
+    ga.hard_dominated = recording_gate
+
+    evaluated = []
+    real_eval = genetic_algorithm.soft_eval
+    genetic_algorithm.soft_eval = lambda schedule, p: evaluated.append(schedule) or real_eval(schedule, p)
+    try:
+        ga.run(print_interval=10000)
+    finally:
+        genetic_algorithm.soft_eval = real_eval
+
+    skipped = [d for d in decisions if d[3]]
+    check(len(skipped) == ga.skipped_soft_evals > 0, "weighted mode skips some children")
+    check(all(fitness_from_scores(hard, 0, ga.w_hard, ga.w_soft) < worst and size >= ga.population_size
+              for hard, worst, size, _ in skipped), "only children below the worst fitness at soft 0 are skipped")
+    check(all(fitness_from_scores(hard, 0, ga.w_hard, ga.w_soft) >= worst
+              for hard, worst, size, skip in decisions if not skip and size >= ga.population_size),
+          "every child that could enter is evaluated")
+    check(len(evaluated) == len(decisions) - len(skipped), "soft eval runs exactly for the admitted children")
+
+
+if __name__ == "__main__":
+    test_weighted_gate()
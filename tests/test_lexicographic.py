@@ -0,0 +1,62 @@
+import sys
+import os
+import random
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.stream import parse_input_file_streaming
+from eval.eval import eval as soft_eval
+from eval.hard_constraints import Valid
+from eval.selection import fitness_from_scores, hard_from_fitness, LEXICOGRAPHIC
+from model.extension_rules import purge
+from control.genetic_algorithm import GeneticAlgorithm
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def test_keys():
+    scores = [(0, 0), (0, 3001), (1, 0), (1, 5), (40000, 10 ** 9)]
+    keys = [fitness_from_scores(hard, soft, LEXICOGRAPHIC, 1) for hard, soft in scores]
+    check(keys == sorted(keys, reverse=True) and len(set(keys)) == len(keys), "ranked by hard, then soft, no ties")
+    check(all(isinstance(key, int) for key in keys), "integer keys")
+    check([hard_from_fitness(key, soft, LEXICOGRAPHIC, 1) for key, (_, soft) in zip(keys, scores)]
+          == [hard for hard, _ in scores], "hard recovered exactly")
+
+    # the weighted float fitness prefers one hard violation over 3001 soft penalty
+    check(fitness_from_scores(1, 0, 3000, 1) > fitness_from_scores(0, 3001, 3000, 1), "weighted mode differs")
+
+
+def test_purge_key():
+    population = [("a", 5, -3, 0), ("b", 1, -1, 0), ("c", 9, -2, 0)]
+    check([x[0] for x in purge(list(population), 1)] == ["a", "c"], "default purge key is eval")
+    check([x[0] for x in purge(list(population), 1, key=lambda x: x[2])] == ["c", "b"], "purge by rank key")
+
+
+def test_lexicographic_run():
+    problem = parse_input_file_streaming(os.path.join(project_root, "input", "deptinst1.txt"))
+    random.seed(4)
+    ga = GeneticAlgorithm(problem, population_size=30, max_generations=1500, lexicographic=True)
+    schedule, soft, hard, best_key = ga.run(print_interval=10000)
+
+    check(best_key == fitness_from_scores(Valid(schedule, problem), soft_eval(schedule, problem), LEXICOGRAPHIC, 1)
+          and hard == Valid(schedule, problem), "best key matches the schedule")
+    check(all(x[2] <= best_key for x in ga.population), "best individual first")
+    check(all(hard_from_fitness(key, ev, ga.w_hard, ga.w_soft) == Valid(s, problem) for s, ev, key, _ in ga.population),
+          "population keys are exact")
+    check(ga.skipped_soft_evals > 0, "children losing on hard score skip soft evaluation")
+
+
+if __name__ == "__main__":
+    test_keys()
+    test_purge_key()
+    test_lexicographic_run()
@@ -0,0 +1,97 @@
+import sys
+import os
+import random
+import itertools
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.parser import parse_input_file
+from model.schedule import Schedule
+from model.domains import compute_domains
+from eval.eval import eval as soft_eval
+from eval.hard_constraints import Valid
+from control.branch_and_bound import BranchAndBound
+from control.lns import LargeNeighbourhoodSearch
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def load(name):
+    return parse_input_file(
+        os.path.join(project_root, "input", name),
+        pen_lecturemin=10,
+        pen_tutorialmin=10,
+        pen_notpaired=10,
+        pen_section=10,
+        w_minfilled=1,
+        w_pref=1,
+        w_pair=1,
+        w_secdiff=1,
+    )
+
+
+def brute_force(problem):
+    # cheapest valid schedule by trying every combination of domain values
+    domains = compute_domains(problem)
+    ids = problem.get_all_event_ids()
+    best = None
+    for combo in itertools.product(*[domains[i] for i in ids]):
+        schedule = Schedule({problem.get_event(i): s for i, s in zip(ids, combo)})
+        if Valid(schedule, problem) == 0:
+            value = soft_eval(schedule, problem)
+            if best is None or value < best:
+                best = value
+    return best
+
+
+def test_branch_and_bound_matches_brute_force():
+    for name in ["SC2-SECD.txt", "SC3-PREF.txt", "SC4-PAIR.txt", "input1.txt", "HC1-LS.txt"]:
+        problem = load(name)
+        schedule, soft, complete = BranchAndBound(problem).solve(Schedule(), problem.get_all_event_ids())
+        expected = brute_force(problem)
+
+        check(complete, f"{name}: search finished inside the node limit")
+        if expected is None:
+            check(schedule is None, f"{name}: no valid schedule, none returned")
+        else:
+            check(Valid(schedule, problem) == 0, f"{name}: returned schedule is valid")
+            check(soft == soft_eval(schedule, problem) == expected, f"{name}: optimal soft {expected}")
+
+
+def test_lns_polish_never_worsens():
+    random.seed(7)
+    problem = load("input2.txt")
+    solver = BranchAndBound(problem)
+
+    # start from a valid but shuffled schedule
+    schedule, _, _ = solver.solve(Schedule(), problem.get_all_event_ids())
+    for _ in range(200):
+        event = random.choice(list(schedule.assignments))
+        moved = schedule.copy()
+        moved.assign(event, random.choice(solver.domains[event.id]))
+        if Valid(moved, problem) == 0:
+            schedule = moved
+    start_soft = soft_eval(schedule, problem)
+
+    lns = LargeNeighbourhoodSearch(problem)
+    polished, polished_soft = lns.polish(schedule, start_soft, iterations=50)
+
+    check(Valid(polished, problem) == 0, "polished schedule is still valid")
+    check(polished_soft == soft_eval(polished, problem), "reported soft matches eval")
+    check(polished_soft <= start_soft, f"soft did not get worse ({start_soft} -> {polished_soft})")
+    check(polished.count_assignments() == schedule.count_assignments(), "no events lost")
+
+
+if __name__ == "__main__":
+    test_branch_and_bound_matches_brute_force()
+    test_lns_polish_never_worsens()
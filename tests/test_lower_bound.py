@@ -0,0 +1,64 @@
+import sys
+import os
+import random
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.parser import parse_input_file
+from eval.lower_bound import soft_lower_bound, soft_lower_bound_terms
+from control.branch_and_bound import solve_exact
+from control.genetic_algorithm import GeneticAlgorithm
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def load(name):
+    return parse_input_file(
+        os.path.join(project_root, "input", name),
+        pen_lecturemin=10,
+        pen_tutorialmin=10,
+        pen_notpaired=10,
+        pen_section=10,
+        w_minfilled=1,
+        w_pref=1,
+        w_pair=1,
+        w_secdiff=1,
+    )
+
+
+def test_bound_below_optimum():
+    for name in ["SC1-MINF.txt", "SC2-SECD.txt", "SC3-PREF.txt", "SC4-PAIR.txt",
+                 "STARTER.txt", "input1.txt", "input2.txt", "HC14-SPTU3.txt"]:
+        problem = load(name)
+        bound = soft_lower_bound(problem)
+        _, optimum, _ = solve_exact(problem)
+        check(bound <= optimum, f"{name}: bound {bound} <= optimum {optimum}")
+
+    # SC2 has more lecture sections of one course than lecture slots
+    terms = soft_lower_bound_terms(load("SC2-SECD.txt"))
+    check(terms["secdiff"] == 10, "forced section overlap is counted")
+
+
+def test_ga_stops_at_bound():
+    random.seed(2)
+    problem = load("SC2-SECD.txt")
+    ga = GeneticAlgorithm(problem, max_generations=20000, population_size=30, polish_interval=0)
+    _, soft, hard, _ = ga.run(print_interval=5000)
+    check(hard == 0 and soft == ga.soft_bound, "GA reaches the bound on SC2")
+    check(ga.generation < ga.max_generations - 1, f"GA stopped early at generation {ga.generation}")
+    check(ga.optimality_gap(soft) == 0.0, "gap is zero at the bound")
+
+
+if __name__ == "__main__":
+    test_bound_below_optimum()
+    test_ga_stops_at_bound()
@@ -0,0 +1,83 @@
+import sys
+import os
+import shutil
+import tempfile
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.parser import parse_input_file, parse_from_command_line
+from parser.cache import parse_input_file_cached, cache_path_for
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def summary(problem):
+    return (
+        problem.name,
+        sorted(problem.events_by_id),
+        sorted(problem.lec_slots_by_key),
+        sorted(problem.tut_slots_by_key),
+        sorted((c.event_a_id, c.event_b_id) for c in problem.not_compatible),
+        sorted((p.event_id, p.slot_key, p.value) for p in problem.preferences),
+        sorted((p.event_a_id, p.event_b_id) for p in problem.pairs),
+    )
+
+
+def test_cache_roundtrip():
+    path = os.path.join(project_root, "input", "deptinst1.txt")
+    cache_dir = tempfile.mkdtemp()
+    try:
+        fresh = parse_input_file(path)
+        first = parse_input_file_cached(path, cache_dir)
+        check(os.path.exists(cache_path_for(path, cache_dir)), "cache entry written on a miss")
+
+        cached = parse_input_file_cached(path, cache_dir, pen_section=7, w_pref=3)
+        check(summary(cached) == summary(fresh) == summary(first), "cached instance equals a fresh parse")
+        check(cached.pen_section == 7 and cached.w_pref == 3, "penalties / weights applied after loading")
+
+        slot_key = next(iter(cached.lec_slots_by_key))
+        check(cached.get_slot(slot_key) is cached.lec_slots_by_key[slot_key], "slot objects shared after loading")
+
+        args = [path, "1", "2", "1", "1", "10", "10", "10", "10"]
+        check(parse_from_command_line(args, cache_dir=cache_dir).w_pref == 2, "command line path uses the cache")
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+def test_cache_invalidation():
+    cache_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(cache_dir, "instance.txt")
+        shutil.copy(os.path.join(project_root, "input", "STARTER.txt"), path)
+        parse_input_file_cached(path, cache_dir)
+        old_entry = cache_path_for(path, cache_dir)
+
+        with open(path, "a") as f:
+            f.write("\n")
+        check(cache_path_for(path, cache_dir) != old_entry, "edited input file gets a new cache entry")
+
+        # a truncated entry is ignored and rewritten
+        entry = cache_path_for(path, cache_dir)
+        parse_input_file_cached(path, cache_dir)
+        with open(entry, "r+b") as f:
+            f.truncate(10)
+        problem = parse_input_file_cached(path, cache_dir)
+        check(summary(problem) == summary(parse_input_file(path)), "corrupt entry falls back to parsing")
+        check(os.path.getsize(entry) > 10, "corrupt entry rewritten")
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+if __name__ == "__main__":
+    test_cache_roundtrip()
+    test_cache_invalidation()
@@ -0,0 +1,78 @@
+import sys
+import os
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.parser import parse_input_file
+from parser.constraint import PartialAssignment
+from eval.presolve import presolve
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def load(name):
+    return parse_input_file(
+        os.path.join(project_root, "input", name),
+        pen_lecturemin=10,
+        pen_tutorialmin=10,
+        pen_notpaired=10,
+        pen_section=10,
+        w_minfilled=1,
+        w_pref=1,
+        w_pair=1,
+        w_secdiff=1,
+    )
+
+
+def test_infeasible_instances_named():
+    expected = {
+        "HC1-LS.txt": "C1/C8 slot capacity",
+        "HC3-AL.txt": "C14/C15 AL capacity",
+        "HC11-EV.txt": "no allowed slot for CPSC 103 LEC 91",
+        "HC12-5XX.txt": "time conflicts",
+        "HC6-NC1.txt": "time conflicts",
+    }
+    for name, text in expected.items():
+        reasons = presolve(load(name))
+        check(any(text in r for r in reasons), f"{name}: reports '{text}'")
+
+
+def test_feasible_instances_pass():
+    for name in ["SC1-MINF.txt", "SC4-PAIR.txt", "STARTER.txt", "input2.txt", "deptinst1.txt", "deptinst2.txt"]:
+        check(presolve(load(name)) == [], f"{name}: no false alarm")
+
+
+def test_bad_partial_assignment():
+    problem = load("HC11-EV1.txt")
+    problem.partial_assignments.append(PartialAssignment("CPSC 103 LEC 91", ("LEC", "MO", "8:00")))
+    reasons = presolve(problem)
+    check(any("C3 partial assignment" in r and "C11" in r for r in reasons), "evening event fixed to a day slot")
+
+
+def test_special_tutorial_clique():
+    # CPSC 913 TUT 01 may only go to TU 18:00; fixing a CPSC 413 tutorial there as well
+    # leaves the two (which must not overlap) a single time
+    problem = load("input2.txt")
+    problem.partial_assignments.append(PartialAssignment("CPSC 413 LEC 01 TUT 01", ("TUT", "TU", "18:00")))
+    reasons = presolve(problem)
+    check(
+        any("time conflicts" in r and "CPSC 913 TUT 01" in r and "CPSC 413 LEC 01 TUT 01" in r for r in reasons),
+        "special tutorial and its related course form a clique",
+    )
+
+
+if __name__ == "__main__":
+    test_infeasible_instances_named()
+    test_feasible_instances_pass()
+    test_bad_partial_assignment()
+    test_special_tutorial_clique()
@@ -0,0 +1,74 @@
+import sys
+import os
+import random
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.stream import parse_input_file_streaming
+from control.genetic_algorithm import GeneticAlgorithm
+from control.restart import luby, restart_population
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def test_luby():
+    check([luby(i) for i in range(1, 16)] == [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8], "Luby sequence")
+
+
+def test_restart_population():
+    problem = parse_input_file_streaming(os.path.join(project_root, "input", "input2.txt"))
+    random.seed(2)
+    ga = GeneticAlgorithm(problem, population_size=20, max_generations=200)
+    ga.run(print_interval=1000)
+    best = ga.population[0]
+
+    for policy in ("reseed", "hypermutate", "luby"):
+        population = restart_population(ga.population, problem, policy, 30, ga.w_hard, ga.w_soft)
+        check(len(population) == 30 and best in population and population[0][2] >= best[2], f"{policy}: size and best kept")
+        check(sum(1 for individual in population if individual in ga.population) < 30, f"{policy}: new individuals")
+
+    # the hall of fame holds copies of schedules, so the elite (3 of 30) appears twice otherwise
+    ranked = sorted(ga.population, key=lambda x: x[2], reverse=True)
+    copies = [(schedule.copy(), eval_v, fit_v, prob) for schedule, eval_v, fit_v, prob in ranked[:3]]
+    population = restart_population(ga.population, problem, "reseed", 30, ga.w_hard, ga.w_soft, keep=copies,
+                                    fingerprint=ga.hall_of_fame.fingerprint)
+    check(not any(copy[0] is individual[0] for copy in copies for individual in population),
+          "copies of elite schedules are not kept twice")
+
+
+def test_restart_on_plateau():
+    problem = parse_input_file_streaming(os.path.join(project_root, "input", "deptinst1.txt"))
+
+    random.seed(1)
+    ga = GeneticAlgorithm(problem, population_size=20, plateau_limit=30, max_generations=5000)
+    _, _, _, stopped_fitness = ga.run(print_interval=10000)
+    stopped_at = ga.generation
+
+    random.seed(1)
+    ga = GeneticAlgorithm(problem, population_size=20, plateau_limit=30, max_generations=5000,
+                          restart="luby", max_restarts=2)
+    _, _, _, best_fitness = ga.run(print_interval=10000)
+    check(ga.restarts == 2 and ga.generation > stopped_at, "plateaus restart until max_restarts")
+    check(ga.population_size == 40, "Luby-scaled population (1 1 2)")
+    check(best_fitness >= stopped_fitness, "restarts never lose the best individual")
+
+    # a second run starts again from the first epoch
+    ga.max_restarts = 0
+    ga.run(print_interval=10000, initial_population=ga.population)
+    check(ga.restarts == 0 and ga.population_size == 20, "follow-up run resets the epochs")
+
+
+if __name__ == "__main__":
+    test_luby()
+    test_restart_population()
+    test_restart_on_plateau()
@@ -0,0 +1,96 @@
+import sys
+import os
+import shutil
+import tempfile
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.parser import parse_input_file
+from parser.stream import parse_input_file_streaming, StreamingParser
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+# everything the search reads from a ProblemInstance, in insertion order
+def snapshot(problem):
+    return (
+        problem.name,
+        [(event_id, vars(event)) for event_id, event in problem.events_by_id.items()],
+        list(problem.lec_by_id), list(problem.tut_by_id),
+        problem.course_list, problem.tut_list,
+        [(key, vars(slot)) for key, slot in problem.lec_slots_by_key.items()],
+        [(key, vars(slot)) for key, slot in problem.tut_slots_by_key.items()],
+        problem.lec_slot_index, problem.tut_slot_index,
+        [vars(c) for c in problem.not_compatible],
+        [vars(c) for c in problem.unwanted],
+        [vars(c) for c in problem.preferences],
+        [vars(c) for c in problem.pairs],
+        [vars(c) for c in problem.partial_assignments],
+        (problem.pen_lecturemin, problem.pen_section, problem.w_minfilled, problem.w_secdiff),
+    )
+
+
+def test_same_instance_as_batch_parser():
+    for name in sorted(os.listdir(os.path.join(project_root, "input"))):
+        path = os.path.join(project_root, "input", name)
+        batch = parse_input_file(path, 2, 3, 4, 5, 6, 7, 8, 9)
+        streamed = parse_input_file_streaming(path, 2, 3, 4, 5, 6, 7, 8, 9)
+        check(snapshot(streamed) == snapshot(batch), f"{name}: identical instance")
+
+
+def test_ids_shared():
+    problem = parse_input_file_streaming(os.path.join(project_root, "input", "deptinst1.txt"))
+    ids = {event_id: event_id for event_id in problem.events_by_id}
+    check(all(event.id is ids[event.id] for event in problem.events_by_id.values()), "event.id is the dict key")
+    check(all(p.event_id is ids[p.event_id] for p in problem.preferences), "preferences share the event id")
+    check(
+        all(p.slot_key is problem.get_slot(p.slot_key).slot_key for p in problem.preferences),
+        "preferences share the slot key",
+    )
+
+
+def test_constraints_before_declarations():
+    with open(os.path.join(project_root, "input", "deptinst1.txt")) as f:
+        text = f.read()
+    head, constraints = text.split("Not compatible:", 1)
+
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, "reordered.txt")
+        with open(path, "w") as f:
+            f.write("Not compatible:" + constraints + "\n" + head)
+        check(
+            snapshot(parse_input_file_streaming(path)) == snapshot(parse_input_file(path)),
+            "constraint sections first: still identical",
+        )
+    finally:
+        shutil.rmtree(tmp)
+
+
+def test_errors():
+    builder = StreamingParser()
+    for line in ["Lecture slots:", "MO, 8:00, 1, 0, 0", "Tutorial slots:", "Lectures:", "CPSC 101 LEC 01, false",
+                 "Tutorials:", "Not compatible:"]:
+        builder.feed(line)
+    try:
+        builder.feed("CPSC 101 LEC 01, CPSC 999 LEC 01")
+        check(False, "unknown event rejected")
+    except ValueError as e:
+        check("Unknown event in not compatible: CPSC 999 LEC 01" in str(e), "unknown event rejected")
+
+
+if __name__ == "__main__":
+    test_same_instance_as_batch_parser()
+    test_ids_shared()
+    test_constraints_before_declarations()
+    test_errors()
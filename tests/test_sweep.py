@@ -0,0 +1,73 @@
+import sys
+import os
+import random
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.parser import parse_input_file
+from model.initial_state import generate_single_complete_schedule
+from eval.eval import eval as soft_eval, eval_components, weighted_eval
+from eval.hard_constraints import Valid
+from control.sweep import problem_with_weights, rerank, run_sweep
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def load(name="deptinst1.txt"):
+    return parse_input_file(os.path.join(project_root, "input", name))
+
+
+def test_weighted_components_match_eval():
+    random.seed(3)
+    problem = load()
+    for _ in range(20):
+        schedule = generate_single_complete_schedule(problem)
+        components = eval_components(schedule, problem)
+        weights = tuple(random.randint(0, 9) for _ in range(8))
+        point = problem_with_weights(problem, weights)
+        check(weighted_eval(components, point) == soft_eval(schedule, point), f"weights {weights}: same eval")
+    check(problem.w_pref == 1, "sweep points do not change the parsed instance")
+
+
+def test_rerank():
+    random.seed(4)
+    problem = load()
+    scored = []
+    for _ in range(10):
+        schedule = generate_single_complete_schedule(problem)
+        scored.append((schedule, eval_components(schedule, problem), Valid(schedule, problem)))
+
+    point = problem_with_weights(problem, (1, 7, 1, 1, 10, 10, 10, 10))
+    population = rerank(scored, point, 3000, 1)
+    check(len(population) == len(scored), "every individual kept")
+    check(all(a[2] >= b[2] for a, b in zip(population, population[1:])), "best first")
+    check(all(soft == soft_eval(s, point) for s, soft, _, _ in population), "evals for the new weights")
+
+
+def test_small_sweep():
+    random.seed(5)
+    problem = load()
+    points = [(1, 1, 1, 1, 10, 10, 10, 10), (1, 5, 1, 1, 10, 10, 10, 10)]
+    results = run_sweep(problem, points, workers=1, ga_params={"population_size": 10, "max_generations": 20}, seed=1)
+    check(len(results) == 2, "one result per point")
+    for result in results:
+        point = problem_with_weights(problem, result["weights"])
+        check(result["soft"] == soft_eval(result["schedule"], point), f"{result['weights']}: reported soft")
+        check(result["hard"] == Valid(result["schedule"], problem), f"{result['weights']}: reported hard")
+        check(result["components"] == eval_components(result["schedule"], problem), "reported components")
+
+
+if __name__ == "__main__":
+    test_weighted_components_match_eval()
+    test_rerank()
+    test_small_sweep()
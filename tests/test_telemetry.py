@@ -0,0 +1,95 @@
+import sys
+import os
+import json
+import random
+import tempfile
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.parser import parse_input_file
+from eval.hard_constraints import Valid, hard_violation_counts
+from eval.selection import hard_from_fitness
+from model.initial_state import generate_initial_state
+from control.genetic_algorithm import GeneticAlgorithm
+from control.telemetry import Telemetry
+from control.profiler import PhaseProfiler
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+def load(name):
+    return parse_input_file(
+        os.path.join(project_root, "input", name),
+        pen_lecturemin=10,
+        pen_tutorialmin=10,
+        pen_notpaired=10,
+        pen_section=10,
+        w_minfilled=1,
+        w_pref=1,
+        w_pair=1,
+        w_secdiff=1,
+    )
+
+
+def test_hard_from_fitness():
+    problem = load("deptinst1.txt")
+    for schedule, soft, fit, _ in generate_initial_state(problem, 5, w_hard=3000, w_soft=1, seed=7):
+        hard = Valid(schedule, problem)
+        check(hard_from_fitness(fit, soft, 3000, 1) == hard, f"hard {hard} recovered from fitness")
+        check(sum(hard_violation_counts(schedule, problem).values()) == hard, "per-constraint counts add up to Valid")
+
+
+def test_telemetry_lines():
+    problem = load("input2.txt")
+    random.seed(3)
+    ga = GeneticAlgorithm(problem, max_generations=250, plateau_limit=10000, population_size=30, polish_interval=0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "run.jsonl")
+        with Telemetry(path, interval=50) as telemetry:
+            ga.run(print_interval=1000, telemetry=telemetry)
+
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+
+    check([line["generation"] for line in lines] == [0, 50, 100, 150, 200], "one line per interval")
+    check(all(0.0 <= line["diversity"] <= 1.0 for line in lines), "diversity is a share")
+    check(all(line["population"]["clusters"] >= 1 and line["population"]["entropy"] >= 0 for line in lines),
+          "population diversity metrics recorded")
+    check(sum(sum(line["operators"].values()) for line in lines) == 200, "operator mix counts every child")
+    check(lines[-1]["best"]["soft"] <= lines[-1]["mean"]["soft"] or lines[-1]["best"]["hard"] < lines[-1]["mean"]["hard"],
+          "best is no worse than the mean")
+
+
+def test_phase_profiler():
+    problem = load("input2.txt")
+    random.seed(4)
+    ga = GeneticAlgorithm(problem, max_generations=120, plateau_limit=10000, population_size=30, polish_interval=0)
+    profiler = PhaseProfiler()
+    ga.run(print_interval=1000, profiler=profiler)
+
+    generations = ga.generation + 1
+    check(profiler.calls["valid (elite)"] == generations, "elite checked once per generation")
+    evaluated = profiler.calls["soft eval"]
+    check(profiler.calls["valid"] == generations, "one child hard-scored per generation")
+    check(evaluated + ga.skipped_soft_evals == generations, "soft eval skipped only for dominated children")
+    check(profiler.calls["sort"] == generations + evaluated, "second sort only after an evaluated child")
+    check(profiler.calls["selection"] == generations, "one selection phase per generation")
+    report = profiler.report()
+    check("repair" in report and "(unmeasured)" in report, "breakdown table lists the phases")
+
+
+if __name__ == "__main__":
+    test_hard_from_fitness()
+    test_telemetry_lines()
+    test_phase_profiler()
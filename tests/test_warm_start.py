@@ -0,0 +1,82 @@
+import sys
+import os
+import random
+import shutil
+import tempfile
+
+# add src directory to Python path (same pattern as test_eval.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+sys.path.insert(0, src_dir)
+
+from parser.parser import parse_input_file
+from model.initial_state import generate_single_complete_schedule
+from control.warm_start import read_output_assignments, load_output_schedule, warm_start_population
+
+
+def check(cond, msg):
+    if cond:
+        print(f"PASS: {msg}")
+    else:
+        print(f"FAIL: {msg}")
+        raise AssertionError(msg)
+
+
+# same "<event> : <DAY>, <TIME>" rows as ga_main.write_output_to_file
+def write_rows(path, schedule, extra=()):
+    with open(path, "w") as f:
+        f.write("=== GA RESULTS ===\nGenerations: 1\n\n")
+        f.write("================ FORMATTED SCHEDULE ASSIGNMENT ================\n\n")
+        for event, slot in schedule.assignments.items():
+            f.write(f"{event.id} : {slot.day}, {slot.start_time}\n")
+        for line in extra:
+            f.write(line + "\n")
+
+
+def test_warm_start_after_edit():
+    random.seed(6)
+    tmp = tempfile.mkdtemp()
+    try:
+        original = parse_input_file(os.path.join(project_root, "input", "deptinst1.txt"))
+        previous = generate_single_complete_schedule(original)
+        output = os.path.join(tmp, "deptinst1_output.txt")
+        write_rows(output, previous, extra=["CPSC 777 LEC 01 : MO, 8:00"])
+        check(len(read_output_assignments(output)) == len(original.events_by_id) + 1, "every row read back")
+
+        # the edited instance gains one course (a lecture and its tutorial)
+        with open(os.path.join(project_root, "input", "deptinst1.txt")) as f:
+            text = f.read()
+        text = text.replace("Lectures:\n", "Lectures:\nCPSC 998 LEC 01, false\n", 1)
+        text = text.replace("Tutorials:\n", "Tutorials:\nCPSC 998 LEC 01 TUT 01, false\n", 1)
+        edited_path = os.path.join(tmp, "deptinst1.txt")
+        with open(edited_path, "w") as f:
+            f.write(text)
+        edited = parse_input_file(edited_path)
+
+        schedule, stats = load_output_schedule(output, edited)
+        check(stats == {"kept": len(original.events_by_id), "dropped": 1, "placed": 2}, f"stats {stats}")
+        check(schedule.count_assignments() == len(edited.events_by_id), "every event of the new instance assigned")
+        check(
+            all(
+                schedule.get_assignment(edited.get_event(event.id)).slot_key == slot.slot_key
+                for event, slot in previous.assignments.items()
+            ),
+            "kept events stay in their old slots",
+        )
+
+        population = warm_start_population(schedule, edited, 20, 3000, 1)
+        check(len(population) == 20 and population[0][0] is schedule, "population starts from the loaded schedule")
+        check(
+            all(
+                sum(a is not b for a, b in zip(s.assignments.values(), schedule.assignments.values())) <= 3
+                for s, _, _, _ in population
+            ),
+            "perturbations move at most 3 events",
+        )
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == "__main__":
+    test_warm_start_after_edit()